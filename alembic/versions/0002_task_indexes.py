@@ -0,0 +1,38 @@
+"""Index tasks for per-project lookups and the open-deadline sweep
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate as db.orm_models.OPEN_TASK_PREDICATE at the time of this revision.
+OPEN_TASK_PREDICATE = "status IS NULL OR status <> 'done'"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_tasks_project_id_title", "tasks", ["project_id", "title"])
+    op.create_index("ix_tasks_project_id_id", "tasks", ["project_id", "id"])
+    op.create_index(
+        "ix_tasks_open_deadline", "tasks", ["deadline"],
+        postgresql_where=sa.text(OPEN_TASK_PREDICATE), sqlite_where=sa.text(OPEN_TASK_PREDICATE),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_open_deadline", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_title", table_name="tasks")
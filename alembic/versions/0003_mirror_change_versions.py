@@ -0,0 +1,41 @@
+"""Change versions for cross-process mirror coherence
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    mirror_version = op.create_table(
+        "mirror_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+    )
+    op.bulk_insert(mirror_version, [{"id": 1, "version": 0}])
+    op.create_table(
+        "project_changes",
+        sa.Column("project_id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+    )
+    op.create_index("ix_project_changes_version", "project_changes", ["version"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_project_changes_version", table_name="project_changes")
+    op.drop_table("project_changes")
+    op.drop_table("mirror_version")
@@ -0,0 +1,130 @@
+"""Partition tasks by status, with yearly partitions of done tasks
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 13:00:00.000000
+
+On PostgreSQL ``tasks`` becomes list-partitioned by status: open tasks live in the small
+``tasks_open`` partition and done tasks in ``tasks_done``, itself range-partitioned by
+``closed_at`` into one partition per year plus a default one, so old years can be
+detached. A partitioned table cannot have a primary key or unique constraint that
+leaves out the (nullable) partition keys, so each leaf partition gets its own primary
+key on ``id`` (ids still come from one sequence) and task titles lose their global
+uniqueness. Other databases have no declarative partitioning and only drop the latter.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate as db.orm_models.OPEN_TASK_PREDICATE at the time of this revision.
+OPEN_TASK_PREDICATE = "status IS NULL OR status <> 'done'"
+COLUMNS = "id, title, description, version, project_id, deadline, status, closed_at"
+INDEXES = ("ix_tasks_open_deadline", "ix_tasks_project_id_id", "ix_tasks_project_id_title")
+TITLE_UNIQUE_CONVENTION = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+
+
+def _is_postgres() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_tasks_project_id_title", "tasks", ["project_id", "title"])
+    op.create_index("ix_tasks_project_id_id", "tasks", ["project_id", "id"])
+    op.create_index(
+        "ix_tasks_open_deadline", "tasks", ["deadline"],
+        postgresql_where=sa.text(OPEN_TASK_PREDICATE), sqlite_where=sa.text(OPEN_TASK_PREDICATE),
+    )
+
+
+def _drop_indexes(table: str) -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def _closed_years(table: str) -> range:
+    """Years from the oldest closed task (or this year) through next year.
+
+    Offline (``--sql``) there are no rows to look at: older done tasks then land in
+    the default partition, from which ``add_task_partition`` can split their years.
+    """
+    this_year = date.today().year
+    if context.is_offline_mode():
+        return range(this_year, this_year + 2)
+    first = op.get_bind().execute(sa.text(f"SELECT min(closed_at) FROM {table} WHERE status = 'done'")).scalar()
+    return range(min(first.year, this_year) if first is not None else this_year, this_year + 2)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _is_postgres():
+        # The naming convention gives the reflected, unnamed UNIQUE (title) a name to drop it by.
+        with op.batch_alter_table("tasks", naming_convention=TITLE_UNIQUE_CONVENTION) as batch_op:
+            batch_op.drop_constraint("uq_tasks_title", type_="unique")
+        return
+
+    op.execute("ALTER TABLE tasks RENAME TO tasks_unpartitioned")
+    op.execute("ALTER SEQUENCE tasks_id_seq OWNED BY NONE")
+    _drop_indexes("tasks_unpartitioned")
+    op.execute("""
+        CREATE TABLE tasks (
+            id INTEGER NOT NULL DEFAULT nextval('tasks_id_seq'::regclass),
+            title VARCHAR NOT NULL,
+            description VARCHAR NOT NULL,
+            version INTEGER NOT NULL DEFAULT 1,
+            project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+            deadline TIMESTAMP WITHOUT TIME ZONE,
+            status VARCHAR(20),
+            closed_at TIMESTAMP WITHOUT TIME ZONE
+        ) PARTITION BY LIST (status)
+    """)
+    op.execute("CREATE TABLE tasks_open PARTITION OF tasks (PRIMARY KEY (id)) FOR VALUES IN (NULL, 'todo', 'doing')")
+    op.execute("CREATE TABLE tasks_done PARTITION OF tasks FOR VALUES IN ('done') PARTITION BY RANGE (closed_at)")
+    for year in _closed_years("tasks_unpartitioned"):
+        op.execute(
+            f"CREATE TABLE tasks_done_{year} PARTITION OF tasks_done (PRIMARY KEY (id)) "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    op.execute("CREATE TABLE tasks_done_default PARTITION OF tasks_done (PRIMARY KEY (id)) DEFAULT")
+    op.execute("CREATE TABLE tasks_other PARTITION OF tasks (PRIMARY KEY (id)) DEFAULT")
+
+    op.execute(f"INSERT INTO tasks ({COLUMNS}) SELECT {COLUMNS} FROM tasks_unpartitioned")
+    op.drop_table("tasks_unpartitioned")
+    op.execute("ALTER SEQUENCE tasks_id_seq OWNED BY tasks.id")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_postgres():
+        with op.batch_alter_table("tasks") as batch_op:
+            batch_op.create_unique_constraint("uq_tasks_title", ["title"])
+        return
+
+    op.execute("ALTER TABLE tasks RENAME TO tasks_partitioned")
+    op.execute("ALTER SEQUENCE tasks_id_seq OWNED BY NONE")
+    _drop_indexes("tasks_partitioned")
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False,
+                  server_default=sa.text("nextval('tasks_id_seq'::regclass)")),
+        sa.Column("title", sa.String(), nullable=False, unique=True),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("deadline", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        sa.Column("closed_at", sa.DateTime(), nullable=True),
+    )
+    op.execute(f"INSERT INTO tasks ({COLUMNS}) SELECT {COLUMNS} FROM tasks_partitioned")
+    op.drop_table("tasks_partitioned")  # drops the attached partitions; detached ones stay
+    op.execute("ALTER SEQUENCE tasks_id_seq OWNED BY tasks.id")
+    _create_indexes()
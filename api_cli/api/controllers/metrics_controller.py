@@ -0,0 +1,26 @@
+from typing import Dict
+
+from fastapi import APIRouter, HTTPException
+
+from db.async_db_interface import AsyncDatabaseInterface
+
+
+class MetricsController:
+    """Controller exposing database runtime metrics (connection pool, locks)."""
+
+    def __init__(self, db: AsyncDatabaseInterface) -> None:
+        self._db = db
+        self.router = APIRouter(prefix="/metrics", tags=["metrics"])
+        self._register()
+
+    def _register(self) -> None:
+        @self.router.get(
+            "/db",
+            response_model=Dict[str, Dict[str, float]],
+            responses={500: {"description": "Internal server error"}},
+        )
+        async def get_db_metrics():
+            try:
+                return await self._db.get_metrics()
+            except Exception as exc:
+                raise HTTPException(500, str(exc))
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from typing import List, Optional
 
+from api_cli.api.projection import parse_fields, project_responses
+from api_cli.api.versioning import if_match_version, set_etag
 from api_cli.api.schemas.requests.project_request_schema import ProjectUpdate, ProjectCreate
 from api_cli.api.schemas.responses.project_response_schema import ProjectResponse
-from service.project_manager import ProjectManager
+from api_cli.api.schemas.responses.stats_response_schema import StatsResponse
+from exception.exceptions import VersionConflictError
+from service.async_project_manager import AsyncProjectManager
 from models.models import Detail, Project
 from api_cli.api.schemas.detail_schema import DetailSchema
 
@@ -11,16 +15,13 @@ from api_cli.api.schemas.detail_schema import DetailSchema
 class ProjectController:
     """Controller for managing projects."""
 
-    def __init__(self, manager: ProjectManager) -> None:
+    def __init__(self, manager: AsyncProjectManager) -> None:
         self._manager = manager
         self.router = APIRouter(prefix="/projects", tags=["projects"])
         self._register()
 
-    def _get_project(self, project_id: int) -> Project:
-        project = None
-        for p in self._manager.get_repo_list():
-            if p.id == project_id:
-                project = p
+    async def _get_project(self, project_id: int) -> Project:
+        project = await self._manager.get_entity_by_id(project_id)
         if not project:
             raise HTTPException(404, "Project not found")
         return project
@@ -29,16 +30,49 @@ class ProjectController:
         @self.router.get(
             "/",
             response_model=Optional[List[ProjectResponse]],
-            responses={500: {"description": "Internal server error"}},
+            responses={400: {"description": "Unknown field requested"},
+                       500: {"description": "Internal server error"}},
         )
-        def get_projects():
+        async def get_projects(
+            limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of projects"),
+            after: Optional[int] = Query(None, ge=0, description="Return projects with id greater than this"),
+            fields: Optional[str] = Query(None, description="Comma-separated fields to include, e.g. id,detail"),
+        ):
+            selected = parse_fields(fields, ProjectResponse)
             try:
-                projects = self._manager.get_repo_list()
+                projects = await self._manager.get_page(after, limit)
                 if not projects:
                     return None
-                for p in projects:
-                    print(type(p.detail))
-                return [ProjectResponse(id=p.id, detail=DetailSchema.from_detail(p.detail)) for p in projects]
+                return project_responses(
+                    [ProjectResponse(id=p.id, detail=DetailSchema.from_detail(p.detail), version=p.version)
+                     for p in projects],
+                    selected,
+                )
+            except Exception as exc:
+                raise HTTPException(500, str(exc))
+
+        @self.router.get(
+            "/stats",
+            response_model=StatsResponse,
+            responses={500: {"description": "Internal server error"}},
+        )
+        async def get_stats():
+            try:
+                return StatsResponse.from_counts(await self._manager.get_status_counts())
+            except Exception as exc:
+                raise HTTPException(500, str(exc))
+
+        @self.router.get(
+            "/{project_id}/stats",
+            response_model=StatsResponse,
+            responses={404: {"description": "Project not found"},
+                       500: {"description": "Internal server error"}},
+        )
+        async def get_project_stats(project_id: int):
+            project = await self._get_project(project_id)
+            try:
+                counts = await self._manager.get_task_manager(project).get_status_counts()
+                return StatsResponse.from_counts(counts, project.id)
             except Exception as exc:
                 raise HTTPException(500, str(exc))
 
@@ -48,22 +82,25 @@ class ProjectController:
             responses={404: {"description": "Project not found"},
                        500: {"description": "Internal server error"}},
         )
-        def get_project(project_id: int):
-            project = self._get_project(project_id)
-            return ProjectResponse(id=project.id, detail=DetailSchema.from_detail(project.detail))
+        async def get_project(project_id: int, response: Response):
+            project = await self._get_project(project_id)
+            set_etag(response, project.version)
+            return ProjectResponse(id=project.id, detail=DetailSchema.from_detail(project.detail),
+                                   version=project.version)
 
         @self.router.post(
             "/",
-            response_model=Project,
+            response_model=ProjectResponse,
             responses={400: {"description": "Invalid input"},
                        500: {"description": "Internal server error"}},
         )
-        def create_project(data: ProjectCreate):
+        async def create_project(data: ProjectCreate, response: Response):
             try:
                 detail = Detail(data.detail.title, data.detail.description)
-                self._manager.add_entity(detail)
-                new_project = self._manager.get_repo_list()[-1]
-                return ProjectResponse(id=new_project.id, detail=DetailSchema.from_detail(new_project.detail))
+                new_project = await self._manager.add_entity(detail)
+                set_etag(response, new_project.version)
+                return ProjectResponse(id=new_project.id, detail=DetailSchema.from_detail(new_project.detail),
+                                       version=new_project.version)
             except ValueError as exc:
                 raise HTTPException(400, str(exc))
             except Exception as exc:
@@ -73,16 +110,24 @@ class ProjectController:
             "/{project_id}",
             response_model=ProjectResponse,
             responses={400: {"description": "Invalid input"}, 404: {"description": "Project not found"},
+                       409: {"description": "Project was modified concurrently"},
                        500: {"description": "Internal server error"}},
         )
-        def update_project(project_id: int, data: ProjectUpdate):
-            old = self._get_project(project_id)
+        async def update_project(project_id: int, data: ProjectUpdate, response: Response,
+                                 if_match: Optional[str] = Header(None)):
+            old = await self._get_project(project_id)
+            expected = if_match_version(if_match, old.version)
 
             try:
                 detail = Detail(data.detail.title, data.detail.description)
                 updated = self._manager.create_entity_object(detail)
-                self._manager.update_entity_object(old, updated)
-                return ProjectResponse(id=old.id, detail=DetailSchema.from_detail(old.detail))
+                updated.based_on(expected)
+                await self._manager.update_entity_object(old, updated)
+                set_etag(response, updated.version)
+                return ProjectResponse(id=old.id, detail=DetailSchema.from_detail(updated.detail),
+                                       version=updated.version)
+            except VersionConflictError as exc:
+                raise HTTPException(409, str(exc))
             except ValueError as exc:
                 raise HTTPException(400, str(exc))
             except Exception as exc:
@@ -93,10 +138,10 @@ class ProjectController:
             responses={404: {"description": "Project not found"},
                        500: {"description": "Internal server error"}},
         )
-        def delete_project(project_id: int):
-            project = self._get_project(project_id)
+        async def delete_project(project_id: int):
+            project = await self._get_project(project_id)
             try:
-                self._manager.remove_entity_object(project)
+                await self._manager.remove_entity_object(project)
                 return {"detail": "Project deleted successfully"}
             except Exception as exc:
                 raise HTTPException(500, str(exc))
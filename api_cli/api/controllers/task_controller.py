@@ -1,56 +1,70 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from typing import List, Optional
 
+from api_cli.api.projection import parse_fields, project_responses
+from api_cli.api.versioning import if_match_version, set_etag
 from api_cli.api.schemas.requests.task_request_schema import TaskCreate, TaskUpdate
 from api_cli.api.schemas.responses.task_response_schema import TaskResponse
-from models.models import Detail
-from service.project_manager import ProjectManager
-from service.task_manager import TaskManager
+from exception.exceptions import VersionConflictError
+from models.models import Detail, Task
+from service.async_project_manager import AsyncProjectManager
+from service.async_task_manager import AsyncTaskManager
 from api_cli.api.schemas.detail_schema import DetailSchema
 
 
 class TaskController:
     """Controller for managing tasks."""
 
-    def __init__(self, project_manager: ProjectManager) -> None:
+    def __init__(self, project_manager: AsyncProjectManager) -> None:
         self._project_manager = project_manager
         self.router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["tasks"])
         self._register()
 
-    def _get_task_manager(self, project_id: int) -> TaskManager:
-        projects = self._project_manager.get_repo_list()
-        project = None
-        for p in projects:
-            if p.id == project_id:
-                project = p
+    async def _get_task_manager(self, project_id: int) -> AsyncTaskManager:
+        project = await self._project_manager.get_entity_by_id(project_id)
         if not project:
             raise HTTPException(404, "Project not found")
         return self._project_manager.get_task_manager(project)
 
+    @staticmethod
+    async def _get_task(manager: AsyncTaskManager, task_id: int) -> Task:
+        task = await manager.get_entity_by_id(task_id)
+        if not task:
+            raise HTTPException(404, "Task not found")
+        return task
+
     def _register(self) -> None:
         @self.router.get(
             "/",
             response_model=Optional[List[TaskResponse]],
-            responses={404: {"description": "Project not found"},
+            responses={400: {"description": "Unknown field requested"},
+                       404: {"description": "Project not found"},
                        500: {"description": "Internal server error"}},
         )
-        def get_tasks(project_id: int):
+        async def get_tasks(
+            project_id: int,
+            limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of tasks"),
+            after: Optional[int] = Query(None, ge=0, description="Return tasks with id greater than this"),
+            fields: Optional[str] = Query(None, description="Comma-separated fields to include, e.g. id,status"),
+        ):
+            selected = parse_fields(fields, TaskResponse)
             try:
-                manager = self._get_task_manager(project_id)
-                tasks = manager.get_repo_list()
+                manager = await self._get_task_manager(project_id)
+                tasks = await manager.get_page(after, limit)
                 if not tasks:
                     return None
-                return [
+                return project_responses([
                     TaskResponse(
                         id=t.id,
                         project_id=manager.get_parent_project().id,
                         detail=DetailSchema.from_detail(t.detail),
                         status=t.status,
                         deadline=t.deadline,
-                        closed_at=t.closed_at
+                        closed_at=t.closed_at,
+                        version=t.version
                     )
                     for t in tasks
-                ]
+                ], selected)
             except HTTPException:
                 raise
             except Exception as exc:
@@ -62,18 +76,18 @@ class TaskController:
             responses={404: {"description": "Project or Task not found"},
                        500: {"description": "Internal server error"}},
         )
-        def get_task(project_id: int, task_id: int):
-            manager = self._get_task_manager(project_id)
-            task = next((t for t in manager.get_repo_list() if t.id == task_id), None)
-            if not task:
-                raise HTTPException(404, "Task not found")
+        async def get_task(project_id: int, task_id: int, response: Response):
+            manager = await self._get_task_manager(project_id)
+            task = await self._get_task(manager, task_id)
+            set_etag(response, task.version)
             return TaskResponse(
                 id=task.id,
                 project_id=manager.get_parent_project().id,
                 detail=DetailSchema.from_detail(task.detail),
                 status=task.status,
                 deadline=task.deadline,
-                closed_at=task.closed_at
+                closed_at=task.closed_at,
+                version=task.version
             )
 
         @self.router.post(
@@ -83,18 +97,19 @@ class TaskController:
                        404: {"description": "Project not found"},
                        500: {"description": "Internal server error"}},
         )
-        def create_task(project_id: int, data: TaskCreate):
-            manager = self._get_task_manager(project_id)
+        async def create_task(project_id: int, data: TaskCreate, response: Response):
+            manager = await self._get_task_manager(project_id)
             try:
                 detail = Detail(data.detail.title,data.detail.description)
-                manager.add_entity(detail, data.deadline, data.status)
-                new_task = manager.get_repo_list()[-1]
+                new_task = await manager.add_entity(detail, data.deadline, data.status)
+                set_etag(response, new_task.version)
                 return TaskResponse(
                     id=new_task.id,
                     project_id=manager.get_parent_project().id,
                     detail=DetailSchema.from_detail(new_task.detail),
                     status=new_task.status,
-                    deadline=new_task.deadline
+                    deadline=new_task.deadline,
+                    version=new_task.version
                 )
             except ValueError as exc:
                 raise HTTPException(400, str(exc))
@@ -108,13 +123,14 @@ class TaskController:
             response_model=TaskResponse,
             responses={400: {"description": "Invalid input"},
                        404: {"description": "Project or Task not found"},
+                       409: {"description": "Task was modified concurrently"},
                        500: {"description": "Internal server error"}},
         )
-        def update_task(project_id: int, task_id: int, data: TaskUpdate):
-            manager = self._get_task_manager(project_id)
-            old = next((t for t in manager.get_repo_list() if t.id == task_id), None)
-            if not old:
-                raise HTTPException(404, "Task not found")
+        async def update_task(project_id: int, task_id: int, data: TaskUpdate, response: Response,
+                              if_match: Optional[str] = Header(None)):
+            manager = await self._get_task_manager(project_id)
+            old = await self._get_task(manager, task_id)
+            expected = if_match_version(if_match, old.version)
 
             new_detail = data.detail if data.detail else old.detail
             new_deadline = data.deadline if data.deadline is not None else old.deadline
@@ -122,15 +138,20 @@ class TaskController:
 
             try:
                 updated_task = manager.create_entity_object(new_detail, new_deadline, new_status)
-                manager.update_entity_object(old, updated_task, manager.get_parent_project())
+                updated_task.based_on(expected)
+                await manager.update_entity_object(old, updated_task, manager.get_parent_project())
+                set_etag(response, updated_task.version)
                 return TaskResponse(
-                    id=updated_task.id,
+                    id=old.id,
                     project_id=manager.get_parent_project().id,
                     detail=DetailSchema.from_detail(updated_task.detail),
                     status=updated_task.status,
                     deadline=updated_task.deadline,
-                    closed_at=old.closed_at
+                    closed_at=old.closed_at,
+                    version=updated_task.version
                 )
+            except VersionConflictError as exc:
+                raise HTTPException(409, str(exc))
             except ValueError as exc:
                 raise HTTPException(400, str(exc))
             except HTTPException:
@@ -143,13 +164,11 @@ class TaskController:
             responses={404: {"description": "Project or Task not found"},
                        500: {"description": "Internal server error"}},
         )
-        def delete_task(project_id: int, task_id: int):
-            manager = self._get_task_manager(project_id)
-            task = next((t for t in manager.get_repo_list() if t.id == task_id), None)
-            if not task:
-                raise HTTPException(404, "Task not found")
+        async def delete_task(project_id: int, task_id: int):
+            manager = await self._get_task_manager(project_id)
+            task = await self._get_task(manager, task_id)
             try:
-                manager.remove_entity_object(task)
+                await manager.remove_entity_object(task)
                 return {"detail": "Task deleted successfully"}
             except Exception as exc:
                 raise HTTPException(500, str(exc))
@@ -0,0 +1,39 @@
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from db.async_db_interface import AsyncDatabaseInterface
+
+
+class UnitOfWorkMiddleware(BaseHTTPMiddleware):
+    """Runs each request in one database unit of work.
+
+    Every database call made while handling the request joins the same session and
+    transaction. It is committed once before the response is returned when the status
+    is below 400; error responses and exceptions roll back the database and the mirror.
+    """
+
+    def __init__(self, app: ASGIApp, db: AsyncDatabaseInterface) -> None:
+        super().__init__(app)
+        self._db = db
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        uow = self._db.begin_unit_of_work()
+        try:
+            try:
+                response = await call_next(request)
+            except Exception:
+                await uow.rollback()
+                raise
+            if response.status_code >= 400:
+                await uow.rollback()
+                return response
+            try:
+                await uow.commit()  # rolls back itself when the commit fails
+            except Exception as exc:
+                return JSONResponse({"detail": str(exc)}, status_code=500)
+            return response
+        finally:
+            await uow.close()
@@ -0,0 +1,29 @@
+from typing import List, Optional, Sequence, Set, Type
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Set[str]]:
+    """Parse a comma-separated ``fields`` query value into top-level field names of model.
+
+    Returns None when no projection was asked for; unknown names are rejected with 400.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(model.model_fields)
+    if not requested or unknown:
+        allowed = ", ".join(model.model_fields)
+        raise HTTPException(400, f"Unknown fields: {', '.join(sorted(unknown)) or fields!r}; allowed: {allowed}")
+    return requested
+
+
+def project_responses(items: Sequence[BaseModel], fields: Optional[Set[str]]):
+    """Return items as-is, or a JSON response holding only the requested fields of each."""
+    if fields is None:
+        return list(items)
+    content: List[dict] = [item.model_dump(include=fields) for item in items]
+    return JSONResponse(jsonable_encoder(content))
@@ -7,4 +7,5 @@ from api_cli.api.schemas.detail_schema import DetailSchema
 class ProjectResponse(BaseModel):
     """Project response output."""
     id: Optional[int]
-    detail: DetailSchema
\ No newline at end of file
+    detail: DetailSchema
+    version: Optional[int] = None
@@ -0,0 +1,16 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class StatsResponse(BaseModel):
+    """Task counts by status."""
+    project_id: Optional[int] = Field(None, description="Project the counts belong to; empty for global stats")
+    todo: int
+    doing: int
+    done: int
+    total: int
+
+    @classmethod
+    def from_counts(cls, counts: Dict[str, int], project_id: Optional[int] = None) -> "StatsResponse":
+        return cls(project_id=project_id, total=sum(counts.values()), **counts)
@@ -13,3 +13,4 @@ class TaskResponse(BaseModel):
         Field(..., description="Task status; must be one of 'todo', 'doing', 'done'"))
     deadline: date = Field(..., description="Deadline in format YYYY-MM-DD; must not be in the past")
     closed_at: datetime | None = None
+    version: Optional[int] = None
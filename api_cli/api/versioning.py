@@ -0,0 +1,32 @@
+from typing import Optional
+
+from fastapi import HTTPException, Response
+
+
+def etag(version: Optional[int]) -> Optional[str]:
+    """Strong entity tag for a stored version."""
+    return None if version is None else f'"{version}"'
+
+
+def set_etag(response: Response, version: Optional[int]) -> None:
+    tag = etag(version)
+    if tag is not None:
+        response.headers["ETag"] = tag
+
+
+def if_match_version(if_match: Optional[str], version: Optional[int]) -> Optional[int]:
+    """Version an update has to be based on: the one If-Match names, else the one read.
+
+    The backend compares it with the stored row, so a client whose ETag is newer than
+    this process's copy still gets through; several tags that all miss the copy's
+    version are rejected with 409.
+    """
+    if if_match is None or version is None:
+        return version
+    tags = {tag.strip().removeprefix("W/") for tag in if_match.split(",")}
+    if "*" in tags or etag(version) in tags:
+        return version
+    versions = [int(tag.strip('"')) for tag in tags if tag.strip('"').isdigit()]
+    if len(versions) != 1:
+        raise HTTPException(409, f"Version mismatch: current ETag is {etag(version)}")
+    return versions[0]
@@ -0,0 +1,49 @@
+"""Seeding a project with tasks one by one versus with add_tasks.
+
+Uses SQLiteDatabase, which shares the Postgres entity layer, so it runs without a server.
+Run from the repository root:
+    python -m benchmarks.bench_bulk_insert
+"""
+import os
+import tempfile
+from datetime import date
+from time import perf_counter
+from typing import List
+
+from db.db_sqlite import SQLiteDatabase
+from models.models import Detail, Project, Task
+
+SIZES = (100, 1_000, 10_000)
+
+
+def _tasks(count: int) -> List[Task]:
+    return [Task(detail=Detail(f"task-{i}", "bench"), deadline=date(2030, 1, 1)) for i in range(count)]
+
+
+def _seed(count: int, bulk: bool) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        db = SQLiteDatabase(os.path.join(directory, "bench.db"))
+        project = Project(detail=Detail("project", "bench"))
+        db.add_project(project)
+        tasks = _tasks(count)
+        start = perf_counter()
+        if bulk:
+            db.add_tasks(project, tasks)
+        else:
+            for task in tasks:
+                db.add_task(project, task)
+        elapsed = perf_counter() - start
+        db._db_session.get_engine().dispose()
+        return elapsed
+
+
+def main() -> None:
+    print(f"{'tasks':>8} {'one by one s':>14} {'add_tasks s':>13} {'speedup':>9}")
+    for size in SIZES:
+        single = _seed(size, bulk=False)
+        bulk = _seed(size, bulk=True)
+        print(f"{size:>8} {single:>14.3f} {bulk:>13.3f} {single / bulk:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Title lookup cost of InMemoryDatabase as the data set grows.
+
+Run from the repository root:
+    python -m benchmarks.bench_inmemory_lookups
+"""
+from datetime import date
+from time import perf_counter
+from typing import List
+
+from db.db_inmemory import InMemoryDatabase
+from models.models import Detail, Project, Task
+
+SIZES = (1_000, 10_000, 100_000)
+LOOKUPS = 10_000
+TASKS_PER_PROJECT = 10
+
+
+def _build(num_projects: int) -> InMemoryDatabase:
+    db = InMemoryDatabase()
+    for i in range(num_projects):
+        project = Project(detail=Detail(f"project-{i}", "bench"))
+        db.add_project(project)
+        for j in range(TASKS_PER_PROJECT):
+            db.add_task(project, Task(detail=Detail(f"task-{j}", "bench"), deadline=date(2030, 1, 1)))
+    return db
+
+
+def _per_op_us(start: float, ops: int) -> float:
+    return (perf_counter() - start) / ops * 1_000_000
+
+
+def _bench(num_projects: int) -> List[float]:
+    db = _build(num_projects)
+    probes = [Project(detail=Detail(f"project-{i * 7919 % num_projects}", "")) for i in range(LOOKUPS)]
+    task_probe = Task(detail=Detail(f"task-{TASKS_PER_PROJECT - 1}", ""), deadline=date(2030, 1, 1))
+
+    start = perf_counter()
+    for probe in probes:
+        db.get_tasks(probe)
+    get_tasks_us = _per_op_us(start, LOOKUPS)
+
+    start = perf_counter()
+    for probe in probes:
+        db.update_entity(task_probe, task_probe, probe)
+    update_us = _per_op_us(start, LOOKUPS)
+
+    start = perf_counter()
+    for i in range(LOOKUPS):
+        project = Project(detail=Detail(f"extra-{i}", "bench"))
+        db.add_project(project)
+        db.add_task(project, Task(detail=Detail("task", "bench"), deadline=date(2030, 1, 1)))
+    add_us = _per_op_us(start, LOOKUPS)
+
+    return [get_tasks_us, update_us, add_us]
+
+
+def main() -> None:
+    print(f"{'projects':>10} {'get_tasks us':>14} {'update us':>12} {'add us':>10}")
+    for size in SIZES:
+        get_tasks_us, update_us, add_us = _bench(size)
+        print(f"{size:>10} {get_tasks_us:>14.3f} {update_us:>12.3f} {add_us:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Bytes per task of the domain models, before and after slotting.
+
+"before" rebuilds the previous plain-dataclass models locally so both layouts are
+measured with the same inputs. Status strings and deadlines are created fresh per
+row, the way database drivers return them; deadlines are distinct timestamps, as a
+DateTime column yields.
+
+Run from the repository root:
+    python -m benchmarks.bench_model_memory
+"""
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+
+from models.models import Detail, Task
+
+NUM_TASKS = 200_000
+STATUSES = ("todo", "doing", "done")
+FIRST_DEADLINE = datetime(2030, 1, 1, 9, 0)
+
+
+@dataclass
+class LegacyDetail:
+    title: str
+    description: str
+
+
+@dataclass
+class LegacyEntity:
+    detail: LegacyDetail
+    _id: int = field(default=None, init=False)
+
+
+@dataclass
+class LegacyTask(LegacyEntity):
+    deadline: date
+    status: str = "todo"
+    closed_at: Optional[date] = None
+
+
+def _legacy_task(i: int) -> LegacyTask:
+    status = "".join(STATUSES[i % 3])
+    return LegacyTask(detail=LegacyDetail(f"task-{i}", f"description {i}"),
+                      deadline=FIRST_DEADLINE + timedelta(minutes=17 * i), status=status)
+
+
+def _slotted_task(i: int) -> Task:
+    status = "".join(STATUSES[i % 3])
+    return Task(detail=Detail(f"task-{i}", f"description {i}"),
+                deadline=FIRST_DEADLINE + timedelta(minutes=17 * i), status=status)
+
+
+def _bytes_per_task(factory: Callable[[int], object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tasks: List[object] = [factory(i) for i in range(NUM_TASKS)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del tasks
+    return used / NUM_TASKS
+
+
+def main() -> None:
+    before = _bytes_per_task(_legacy_task)
+    after = _bytes_per_task(_slotted_task)
+    print(f"tasks: {NUM_TASKS}")
+    print(f"before (dataclass): {before:8.1f} bytes/task")
+    print(f"after  (slotted):   {after:8.1f} bytes/task")
+    print(f"saved:              {100 * (1 - after / before):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
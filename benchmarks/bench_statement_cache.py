@@ -0,0 +1,90 @@
+"""Per-call cost of the entity layer's hot queries: built per call versus built once.
+
+"fresh" builds each statement the way the entity layer used to (``session.query(...)
+.filter_by(...)`` or ``update(...).where(...).values(...)``), so every call pays for
+statement construction and its cache key; "cached" executes the prebuilt statements
+of db.entities.statements with a parameter dict. The "build" columns time statement
+construction plus cache key generation alone, which is the overhead removed from the
+write path; "tasks of project" also includes the switch from ORM objects to plain
+rows in TaskPostgres.load_all. Runs on SQLite in memory, so execution itself is as cheap as it gets.
+Run from the repository root:
+    python -m benchmarks.bench_statement_cache
+"""
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Tuple
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from db.entities import statements
+from db.orm_models import Base, ProjectORM, TaskORM
+
+CALLS = 5_000
+TASKS = 20
+
+
+def _time(call: Callable[[], object]) -> float:
+    start = perf_counter()
+    for _ in range(CALLS):
+        call()
+    return (perf_counter() - start) / CALLS * 1_000_000
+
+
+def _cache_key(query) -> object:
+    statement = query.statement if hasattr(query, "statement") else query
+    return statement._generate_cache_key()
+
+
+def _seed(session: Session) -> Tuple[int, int]:
+    project = ProjectORM(title="project", description="bench")
+    session.add(project)
+    session.flush()
+    session.add_all(TaskORM(project_id=project.id, title=f"task-{i}", description="bench",
+                            deadline=datetime(2030, 1, 1), status="todo") for i in range(TASKS))
+    session.flush()
+    return project.id, session.query(TaskORM.id).filter_by(title="task-0").scalar()
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        project_id, task_id = _seed(session)
+        values = {"title": "task-0", "description": "bench", "deadline": datetime(2030, 1, 1), "status": "doing"}
+        queries = {
+            "project by title": (
+                lambda: session.query(ProjectORM).filter_by(title="project"),
+                lambda q: q.one_or_none(),
+                lambda: session.execute(statements.PROJECT_BY_TITLE, {"title": "project"}).scalar_one_or_none(),
+            ),
+            "task by title": (
+                lambda: session.query(TaskORM).filter_by(project_id=project_id, title="task-0"),
+                lambda q: q.one_or_none(),
+                lambda: session.execute(statements.TASK_BY_PROJECT_AND_TITLE,
+                                        {"project_id": project_id, "title": "task-0"}).scalar_one_or_none(),
+            ),
+            "tasks of project": (
+                lambda: session.query(TaskORM).filter_by(project_id=project_id).order_by(TaskORM.id.asc()),
+                lambda q: q.all(),
+                lambda: session.execute(statements.TASK_ROWS_OF_PROJECT, {"project_id": project_id}).all(),
+            ),
+            "update by id": (
+                lambda: update(TaskORM).where(TaskORM.id == task_id).values(**values),
+                lambda stmt: session.execute(stmt),
+                lambda: session.execute(statements.UPDATE_BY_ID[TaskORM], {"entity_id": task_id, **values}),
+            ),
+        }
+
+        print(f"{'query':>18} {'fresh build us':>15} {'fresh us':>10} {'cached us':>10} {'saved':>7}")
+        for name, (build, run, cached) in queries.items():
+            build_us = _time(lambda: _cache_key(build()))
+            fresh_us = _time(lambda: run(build()))
+            cached_us = _time(cached)
+            print(f"{name:>18} {build_us:>15.1f} {fresh_us:>10.1f} {cached_us:>10.1f} "
+                  f"{1 - cached_us / fresh_us:>6.0%}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Per-write latency of the SQL entity layer: primary-key writes versus title lookups.
+
+Updates and removes of tasks with a known id run one UPDATE/DELETE by primary key;
+id-less tasks fall back to resolving the parent project and the task by title first.
+Uses SQLiteDatabase, which shares the Postgres entity layer, so it runs without a
+server; round trips cost more against a networked Postgres.
+Run from the repository root:
+    python -m benchmarks.bench_write_latency
+"""
+import os
+import tempfile
+from datetime import date
+from time import perf_counter
+from typing import Tuple
+
+from sqlalchemy import event
+
+from db.db_sqlite import SQLiteDatabase
+from db.entities.task_postgres import TaskPostgres
+from models.models import Detail, Project, Task
+
+WRITES = 2_000
+
+
+def _task(title: str, status: str = "todo") -> Task:
+    return Task(detail=Detail(title, "bench"), deadline=date(2030, 1, 1), status=status)
+
+
+def _id_less(task: Task) -> Task:
+    return _task(task.detail.title, task.status)
+
+
+def _bench(by_id: bool) -> Tuple[float, float, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        db = SQLiteDatabase(os.path.join(directory, "bench.db"))
+        project = Project(detail=Detail("project", "bench"))
+        db.add_project(project)
+        db.add_tasks(project, [_task(f"task-{i}") for i in range(WRITES)])
+        entity = TaskPostgres()
+        statements = []
+        engine = db._db_session.get_engine()
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        container = list(db.get_tasks(project))
+        start = perf_counter()
+        for task in list(container):
+            old = task if by_id else _id_less(task)
+            with db._db_session.get_session() as session, session.begin():
+                entity.update_entity(old, _task(task.detail.title, "doing"), container, session, parent=project)
+        update_us = (perf_counter() - start) / WRITES * 1_000_000
+        statements_per_update = len(statements) / WRITES
+
+        start = perf_counter()
+        for task in list(container):
+            old = task if by_id else _id_less(task)
+            with db._db_session.get_session() as session, session.begin():
+                entity.remove_entity(old, container if by_id else [old], session, parent=project)
+        remove_us = (perf_counter() - start) / WRITES * 1_000_000
+
+        engine.dispose()
+        return update_us, remove_us, statements_per_update
+
+
+def main() -> None:
+    print(f"{'path':>10} {'update us':>11} {'remove us':>11} {'stmts/update':>13}")
+    for label, by_id in (("by title", False), ("by id", True)):
+        update_us, remove_us, statements = _bench(by_id)
+        print(f"{label:>10} {update_us:>11.1f} {remove_us:>11.1f} {statements:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
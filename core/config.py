@@ -12,6 +12,19 @@ class AppConfig:
         max_tasks (int): Maximum number of allowed tasks per project.
         max_task_name_length (int): Maximum character length for a task's title.
         max_task_description_length (int): Maximum character length for a task's description.
+        memory_data_dir (str): Directory for the in-memory backend's snapshot and write-ahead log;
+            empty keeps the in-memory backend volatile.
+        memory_snapshot_interval (int): Number of logged writes between full snapshots.
+        memory_fsync (bool): Whether every log append is fsynced to disk.
+        sqlite_path (str): Database file used when db_type is "sqlite".
+        db_pool_size (int): Connections kept open in the SQL connection pool.
+        db_max_overflow (int): Extra connections the pool may open under load.
+        db_pool_timeout (float): Seconds to wait for a free connection before failing.
+        db_pool_pre_ping (bool): Whether pooled connections are tested before use.
+        db_pool_recycle (int): Seconds after which pooled connections are replaced; -1 disables it.
+        db_async (bool): Whether the API talks to Postgres through the asyncio engine (asyncpg).
+        db_mirror_refresh_interval (float): Seconds between checks of the database's change
+            version, bounding how stale writes of other processes look; -1 disables the checks.
     """
     max_projects: int
     max_project_name_length: int
@@ -24,4 +37,15 @@ class AppConfig:
     db_user: str
     db_password: str
     db_host: str
-    db_port: int
\ No newline at end of file
+    db_port: int
+    memory_data_dir: str = ""
+    memory_snapshot_interval: int = 1000
+    memory_fsync: bool = False
+    sqlite_path: str = "todo.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = False
+    db_pool_recycle: int = -1
+    db_async: bool = False
+    db_mirror_refresh_interval: float = 1.0
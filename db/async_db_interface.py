@@ -0,0 +1,178 @@
+from __future__ import annotations
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, List, TypeVar, Generic, Optional, Tuple
+from db.db_interface import DatabaseInterface
+from db.pagination import keyset_page
+from db.snapshot import DatabaseSnapshot
+from db.unit_of_work import AsyncUnitOfWork
+from models.models import Project, Task
+
+T = TypeVar("T", Project, Task)
+
+
+class AsyncDatabaseInterface(ABC, Generic[T]):
+    """Awaitable counterpart of DatabaseInterface used by the async request path."""
+
+    def begin_unit_of_work(self) -> AsyncUnitOfWork:
+        """Start a unit of work that the calls awaited until its commit or rollback join."""
+        return AsyncUnitOfWork()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncUnitOfWork]:
+        """Run the enclosed calls in one transaction: commit on success, roll back on error."""
+        uow = self.begin_unit_of_work()
+        try:
+            yield uow
+        except BaseException:
+            await uow.rollback()
+            raise
+        else:
+            await uow.commit()
+        finally:
+            await uow.close()
+
+    @abstractmethod
+    async def add_project(self, project: Project) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_project(self, project: Project) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_task(self, project: Project, task: Task) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_task(self, project: Project, task: Task) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_entity(self, old_entity: T, new_entity: T, parent_project: Optional[Project]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_projects(self) -> List[Project]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_tasks(self, project: Project) -> List[Task]:
+        raise NotImplementedError
+
+    async def get_projects_page(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Project]:
+        return keyset_page(await self.get_projects(), after, limit)
+
+    async def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                             limit: Optional[int] = None) -> List[Task]:
+        return keyset_page(await self.get_tasks(project), after, limit)
+
+    @abstractmethod
+    async def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                                    limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close_overdue(self, now: datetime) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def snapshot(self) -> DatabaseSnapshot:
+        raise NotImplementedError
+
+    async def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        return {}
+
+
+class SyncDatabaseAdapter(AsyncDatabaseInterface[T]):
+    """Exposes a blocking DatabaseInterface to the async request path.
+
+    With ``offload`` every call runs in a worker thread so backends doing I/O never
+    block the event loop; this includes reads served from a mirror, which may refresh
+    it first. Without it calls run inline, which suits pure in-memory stores.
+    """
+
+    def __init__(self, db: DatabaseInterface[T], offload: bool = True) -> None:
+        self._db = db
+        self._offload = offload
+
+    async def _call(self, method, *args):
+        if self._offload:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def begin_unit_of_work(self) -> AsyncUnitOfWork:
+        # Begun on the event loop so the worker threads of later calls inherit it.
+        offload = asyncio.to_thread if self._offload else None
+        return AsyncUnitOfWork(self._db.begin_unit_of_work(), offload=offload)
+
+    async def add_project(self, project: Project) -> None:
+        await self._call(self._db.add_project, project)
+
+    async def remove_project(self, project: Project) -> None:
+        await self._call(self._db.remove_project, project)
+
+    async def add_task(self, project: Project, task: Task) -> None:
+        await self._call(self._db.add_task, project, task)
+
+    async def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        await self._call(self._db.add_tasks, project, tasks)
+
+    async def remove_task(self, project: Project, task: Task) -> None:
+        await self._call(self._db.remove_task, project, task)
+
+    async def update_entity(self, old_entity: T, new_entity: T, parent_project: Optional[Project]) -> None:
+        await self._call(self._db.update_entity, old_entity, new_entity, parent_project)
+
+    async def get_projects(self) -> List[Project]:
+        return await self._call(self._db.get_projects)
+
+    async def get_tasks(self, project: Project) -> List[Task]:
+        return await self._call(self._db.get_tasks, project)
+
+    async def get_projects_page(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Project]:
+        return await self._call(self._db.get_projects_page, after, limit)
+
+    async def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                             limit: Optional[int] = None) -> List[Task]:
+        return await self._call(self._db.get_tasks_page, project, after, limit)
+
+    async def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        return await self._call(self._db.get_project_by_id, project_id)
+
+    async def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        return await self._call(self._db.get_task_by_id, project, task_id)
+
+    async def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        return await self._call(self._db.get_status_counts, project)
+
+    async def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                                    limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        return await self._call(self._db.get_tasks_due_between, start, end, limit)
+
+    async def close_overdue(self, now: datetime) -> List[int]:
+        return await self._call(self._db.close_overdue, now)
+
+    async def snapshot(self) -> DatabaseSnapshot:
+        return await self._call(self._db.snapshot)
+
+    async def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        return self._db.get_metrics()
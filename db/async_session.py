@@ -0,0 +1,30 @@
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from db.pool import PoolSettings, pool_status
+
+
+class AsyncDBSession:
+    """Asyncio session manager; the URL must name an async driver (postgresql+asyncpg, sqlite+aiosqlite)."""
+
+    def __init__(self, url: str, pool: Optional[PoolSettings] = None) -> None:
+        self.url = url
+        try:
+            self.engine = create_async_engine(url, echo=False, **(pool or PoolSettings()).engine_options(asyncio=True))
+            self.SessionFactory = async_sessionmaker(bind=self.engine, expire_on_commit=False, class_=AsyncSession)
+        except Exception as exc:
+            raise RuntimeError("Failed to initialize async SQLAlchemy engine.") from exc
+
+    def get_session(self) -> AsyncSession:
+        return self.SessionFactory()
+
+    def get_engine(self) -> AsyncEngine:
+        return self.engine
+
+    def pool_status(self) -> Dict[str, float]:
+        """Return current pool occupancy plus cumulative checkout wait times and timeouts."""
+        return pool_status(self.engine.pool)
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
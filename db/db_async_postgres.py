@@ -0,0 +1,131 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import AsyncIterator, Dict, TypeVar, Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.async_db_interface import AsyncDatabaseInterface
+from db.async_session import AsyncDBSession
+from db.pool import PoolSettings
+from db.postgres_mirror import MirrorCheckpoint, PostgresMirror
+from db.snapshot import DatabaseSnapshot
+from db.unit_of_work import AsyncSessionUnitOfWork, AsyncUnitOfWork
+from models.models import Project, Task
+
+T = TypeVar("T", Project, Task)
+
+
+class AsyncPostgresDatabase(PostgresMirror, AsyncDatabaseInterface[T]):
+    """PostgreSQL database on SQLAlchemy's asyncio engine (asyncpg driver).
+
+    Shares the mirror and entity classes with PostgresDatabase: each operation opens an
+    AsyncSession and runs the same ORM code through ``run_sync``, so statements are
+    awaited on the event loop instead of blocking a worker thread. Reads that the
+    mirror already holds never touch the database. Call ``load()`` once on startup.
+    Calls awaited inside ``unit_of_work()`` share its session and single commit;
+    ``refresh_interval`` works as in PostgresDatabase.
+    """
+
+    def __init__(self, url: str, pool: Optional[PoolSettings] = None,
+                 refresh_interval: Optional[float] = None) -> None:
+        super().__init__()
+        self._refresh_interval = refresh_interval
+        self._db_session = AsyncDBSession(url, pool=pool)
+        self._current_uow: ContextVar[Optional[AsyncSessionUnitOfWork]] = ContextVar(
+            f"async_uow_{id(self)}", default=None)
+
+    def begin_unit_of_work(self) -> AsyncUnitOfWork:
+        if self._current_uow.get() is not None:
+            return AsyncUnitOfWork()  # joins the outer unit, which commits or rolls back
+        return AsyncSessionUnitOfWork(self._db_session.get_session(), self._current_uow,
+                                      MirrorCheckpoint(), self._restore_checkpoint, self._publish_changes)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        if self._current_uow.get() is None:
+            async with self.unit_of_work(), self._session() as session:
+                yield session
+            return
+        session = self._current_uow.get().session
+        if self._refresh_due():
+            await session.run_sync(self._refresh_mirror)
+        yield session
+
+    async def _refresh_if_due(self) -> None:
+        if self._refresh_due():
+            async with self._session():
+                pass
+
+    async def load(self) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._load_mirror)
+
+    async def close(self) -> None:
+        await self._db_session.dispose()
+
+    async def add_project(self, project: Project) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._add_project, project)
+
+    async def remove_project(self, project: Project) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._remove_project, project)
+
+    async def add_task(self, parent_project: Project, task: Task) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._add_task, parent_project, task)
+
+    async def add_tasks(self, parent_project: Project, tasks: List[Task]) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._add_tasks, parent_project, tasks)
+
+    async def remove_task(self, parent_project: Project, task: Task) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._remove_task, parent_project, task)
+
+    async def update_entity(self, old_entity: T, new_entity: T, parent_project: Optional[Project]) -> None:
+        async with self._session() as session:
+            await session.run_sync(self._update_entity, old_entity, new_entity, parent_project)
+
+    async def get_projects(self) -> List[Project]:
+        await self._refresh_if_due()
+        return self._projects
+
+    async def get_tasks(self, project: Project) -> List[Task]:
+        await self._refresh_if_due()
+        if self._is_loaded(project):
+            return self._find_project_model(project).tasks
+        async with self._session() as session:
+            return await session.run_sync(self._get_tasks, project)
+
+    async def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                             limit: Optional[int] = None) -> List[Task]:
+        async with self._session() as session:
+            return await session.run_sync(self._get_tasks_page, project, after, limit)
+
+    async def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        await self._refresh_if_due()
+        return self._projects_by_id.get(project_id)
+
+    async def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        async with self._session() as session:
+            return await session.run_sync(self._get_task_by_id, project, task_id)
+
+    async def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        await self._refresh_if_due()
+        return self._get_status_counts(project)
+
+    async def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                                    limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        async with self._session() as session:
+            return await session.run_sync(self._get_tasks_due_between, start, end, limit)
+
+    async def close_overdue(self, now: datetime) -> List[int]:
+        async with self._session() as session:
+            return await session.run_sync(self._close_overdue, now)
+
+    async def snapshot(self) -> DatabaseSnapshot:
+        async with self._session() as session:
+            return await session.run_sync(self._snapshot)
+
+    async def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        return {"pool": self._db_session.pool_status()}
@@ -0,0 +1,355 @@
+from datetime import date, datetime
+from threading import RLock
+from typing import Dict, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from db.db_interface import DatabaseInterface
+from db.snapshot import DatabaseSnapshot, SnapshotCache
+from db.status_counters import STATUSES
+from models.models import Detail, Project, Task
+
+T = TypeVar("T", Project, Task)
+
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+_DONE = _STATUS_CODES["done"]
+_TIME_DTYPE = "datetime64[us]"
+
+
+def _status_code(status: Optional[str]) -> int:
+    return _STATUS_CODES[status or "todo"]
+
+
+def _to_datetime64(value: Optional[date]) -> np.datetime64:
+    if value is None:
+        return np.datetime64("NaT").astype(_TIME_DTYPE)
+    return np.datetime64(value).astype(_TIME_DTYPE)
+
+
+def _is_date(value: Optional[date]) -> bool:
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def _resize(column: np.ndarray, capacity: int, fill) -> np.ndarray:
+    resized = np.full(capacity, fill, dtype=column.dtype)
+    resized[:len(column)] = column
+    return resized
+
+
+class ColumnarDatabase(DatabaseInterface[T]):
+    """In-memory database storing tasks column-wise in NumPy arrays.
+
+    Projects stay as lightweight objects without task lists. Every task is a row over
+    id, project id, deadline, status code and closed_at arrays plus title/description
+    string tables; Task objects are only built when rows leave the database. Deadlines
+    keep microseconds, and a flag column remembers which ones were plain dates. Rows are
+    appended in id order, so ids stay sorted and are found by binary search, and each
+    project keeps its rows and a title-to-row map. Removed rows are tombstoned and
+    compacted once they make up half of the store.
+
+    One reentrant lock serializes every operation, since the overdue closer runs in its
+    own thread next to the API's writes.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._project_index: Dict[str, Project] = {}
+        self._projects_by_id: Dict[int, Project] = {}
+        self._next_project_id = 1
+        self._next_task_id = 1
+        self._snapshots = SnapshotCache()
+        self._lock = RLock()
+        self._load()
+
+    # ---------- Projects ----------
+
+    def add_project(self, project: Project) -> None:
+        with self._lock:
+            if project._id is None:
+                project._id = self._next_project_id
+            self._next_project_id = max(self._next_project_id, project._id + 1)
+            self._projects.append(project)
+            self._project_index[project.detail.title] = project
+            self._projects_by_id[project._id] = project
+            self._rows_by_project[project._id] = []
+            self._title_rows[project._id] = {}
+            self._snapshots.invalidate(project._id)
+            tasks, project.tasks = project.tasks, []
+            for task in tasks:
+                self.add_task(project, task)
+
+    def remove_project(self, project: Project) -> None:
+        with self._lock:
+            proj = self._find_project(project)
+            self._kill_rows(self._project_rows(proj.id))
+            self._projects.remove(proj)
+            del self._project_index[proj.detail.title]
+            del self._projects_by_id[proj.id]
+            del self._rows_by_project[proj.id]
+            del self._title_rows[proj.id]
+            self._snapshots.invalidate(proj.id)
+
+    # ---------- Tasks ----------
+
+    def add_task(self, project: Project, task: Task) -> None:
+        with self._lock:
+            proj = self._find_project(project)
+            if task.detail.title in self._title_rows[proj.id]:
+                raise ValueError(f"Task '{task.detail.title}' already exists in project '{proj.detail.title}'.")
+            if task._id is None or task._id < self._next_task_id:
+                task._id = self._next_task_id
+            self._next_task_id = task._id + 1
+            self._append_row(proj.id, task)
+            self._snapshots.invalidate(proj.id)
+
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        with self._lock:
+            proj = self._find_project(project)
+            titles = set(self._title_rows[proj.id])
+            for task in tasks:
+                if task.detail.title in titles:
+                    raise ValueError(f"Task '{task.detail.title}' already exists in project '{proj.detail.title}'.")
+                titles.add(task.detail.title)
+            if self._size + len(tasks) > len(self._ids):
+                self._grow(max(2 * len(self._ids), self._size + len(tasks)))
+            for task in tasks:
+                if task._id is None or task._id < self._next_task_id:
+                    task._id = self._next_task_id
+                self._next_task_id = task._id + 1
+                self._append_row(proj.id, task)
+            self._snapshots.invalidate(proj.id)
+
+    def remove_task(self, project: Project, task: Task) -> None:
+        with self._lock:
+            proj = self._find_project(project)
+            self._kill_rows(np.array([self._resolve_row(proj, task)]))
+            self._snapshots.invalidate(proj.id)
+
+    # ---------- Update Method ----------
+
+    def update_entity(self, old_entity: T, new_entity: T, parent_project: Optional[Project]) -> None:
+        with self._lock:
+            if isinstance(old_entity, Project) and isinstance(new_entity, Project):
+                proj_obj = self._find_project(old_entity)
+                new_title = new_entity.detail.title
+                if new_title != proj_obj.detail.title and new_title in self._project_index:
+                    raise ValueError(f"Project '{new_title}' already exists.")
+                del self._project_index[proj_obj.detail.title]
+                proj_obj.detail = new_entity.detail
+                self._project_index[proj_obj.detail.title] = proj_obj
+                self._snapshots.invalidate(proj_obj.id)
+            elif isinstance(old_entity, Task) and isinstance(new_entity, Task):
+                if parent_project is None:
+                    raise ValueError("Parent project must be provided for tasks.")
+                proj = self._find_project(parent_project)
+                row = self._resolve_row(proj, old_entity)
+                titles = self._title_rows[proj.id]
+                new_title = new_entity.detail.title
+                if new_title != self._titles[row] and new_title in titles:
+                    raise ValueError(f"Task '{new_title}' already exists in project '{proj.detail.title}'.")
+                self._snapshots.invalidate(proj.id)
+                del titles[self._titles[row]]
+                titles[new_title] = row
+                self._titles[row] = new_title
+                self._descriptions[row] = new_entity.detail.description
+                self._set_deadline(row, new_entity.deadline)
+                if new_entity.status:
+                    self._statuses[row] = _status_code(new_entity.status)
+                if new_entity.closed_at is not None:
+                    self._closed_at[row] = _to_datetime64(new_entity.closed_at)
+            else:
+                raise TypeError("Entity type mismatch.")
+
+    # ---------- Get Methods ----------
+
+    def get_projects(self) -> List[Project]:
+        return self._projects
+
+    def get_tasks(self, project: Project) -> List[Task]:
+        with self._lock:
+            proj = self._find_project(project)
+            return [self._materialize(row) for row in self._project_rows(proj.id)]
+
+    def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                       limit: Optional[int] = None) -> List[Task]:
+        with self._lock:
+            rows = self._project_rows(self._find_project(project).id)
+            if after is not None:
+                rows = rows[self._ids[rows] > after]
+            return [self._materialize(row) for row in rows[:limit]]
+
+    def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        return self._projects_by_id.get(project_id)
+
+    def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        with self._lock:
+            row = self._find_row_by_id(task_id)
+            if row is None or self._project_ids[row] != project.id:
+                return None
+            return self._materialize(row)
+
+    def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        with self._lock:
+            if project is None:
+                statuses = self._statuses[:self._size][self._live[:self._size]]
+            else:
+                statuses = self._statuses[self._project_rows(self._find_project(project).id)]
+            counts = np.bincount(statuses, minlength=len(STATUSES))
+            return {status: int(counts[code]) for status, code in _STATUS_CODES.items()}
+
+    def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                              limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        with self._lock:
+            deadlines = self._deadlines[:self._size]
+            mask = self._live[:self._size] & (self._statuses[:self._size] != _DONE) & ~np.isnat(deadlines)
+            if start is not None:
+                mask &= deadlines >= _to_datetime64(start)
+            if end is not None:
+                mask &= deadlines < _to_datetime64(end)
+            rows = np.flatnonzero(mask)
+            rows = rows[np.argsort(deadlines[rows], kind="stable")][:limit]
+            return [(self._projects_by_id[int(self._project_ids[row])], self._materialize(row)) for row in rows]
+
+    def close_overdue(self, now: datetime) -> List[int]:
+        """Close overdue tasks with one masked assignment over the status and closed_at columns."""
+        with self._lock:
+            deadlines = self._deadlines[:self._size]
+            mask = self._live[:self._size] & (self._statuses[:self._size] != _DONE) & ~np.isnat(deadlines)
+            mask &= deadlines < _to_datetime64(now)
+            rows = np.flatnonzero(mask)
+            self._statuses[rows] = _DONE
+            self._closed_at[rows] = _to_datetime64(now)
+            for project_id in np.unique(self._project_ids[rows]):
+                self._snapshots.invalidate(int(project_id))
+            return self._ids[rows].tolist()
+
+    def snapshot(self) -> DatabaseSnapshot:
+        with self._lock:
+            return self._snapshots.build(self._projects, self.get_tasks)
+
+    # ---------- Helper Methods ----------
+
+    def _find_project(self, project: Project) -> Project:
+        proj = self._project_index.get(project.detail.title)
+        if proj is None:
+            raise ValueError(f"Project '{project.detail.title}' not found.")
+        return proj
+
+    def _project_rows(self, project_id: int) -> np.ndarray:
+        return np.array(self._rows_by_project.get(project_id, ()), dtype=np.int64)
+
+    def _find_row_by_id(self, task_id: int) -> Optional[int]:
+        row = int(np.searchsorted(self._ids[:self._size], task_id))
+        if row < self._size and self._ids[row] == task_id and self._live[row]:
+            return row
+        return None
+
+    def _resolve_row(self, project: Project, task: Task) -> int:
+        row = self._find_row_by_id(task.id) if task.id is not None else None
+        if row is None or self._project_ids[row] != project.id:
+            row = self._title_rows[project.id].get(task.detail.title)
+        if row is None:
+            raise ValueError(f"Task '{task.detail.title}' not found in project '{project.detail.title}'.")
+        return row
+
+    def _materialize(self, row: int) -> Task:
+        deadline = self._deadlines[row].item()
+        if deadline is not None and self._date_deadlines[row]:
+            deadline = deadline.date()
+        task = Task(
+            detail=Detail(self._titles[row], self._descriptions[row]),
+            deadline=deadline,
+            status=STATUSES[self._statuses[row]],
+            closed_at=self._closed_at[row].item(),
+        )
+        task._id = int(self._ids[row])
+        return task
+
+    def _set_deadline(self, row: int, deadline: Optional[date]) -> None:
+        self._deadlines[row] = _to_datetime64(deadline)
+        self._date_deadlines[row] = _is_date(deadline)
+
+    def _append_row(self, project_id: int, task: Task) -> None:
+        if self._size == len(self._ids):
+            self._grow(2 * len(self._ids))
+        row = self._size
+        self._ids[row] = task.id
+        self._project_ids[row] = project_id
+        self._set_deadline(row, task.deadline)
+        self._statuses[row] = _status_code(task.status)
+        self._closed_at[row] = _to_datetime64(task.closed_at)
+        self._live[row] = True
+        self._titles.append(task.detail.title)
+        self._descriptions.append(task.detail.description)
+        self._rows_by_project[project_id].append(row)
+        self._title_rows[project_id][task.detail.title] = row
+        self._size += 1
+
+    def _kill_rows(self, rows: np.ndarray) -> None:
+        self._live[rows] = False
+        killed: Dict[int, set] = {}
+        for row in rows.tolist():
+            project_id = int(self._project_ids[row])
+            killed.setdefault(project_id, set()).add(row)
+            del self._title_rows[project_id][self._titles[row]]
+            self._titles[row] = None
+            self._descriptions[row] = None
+        for project_id, project_rows in killed.items():
+            self._rows_by_project[project_id] = [
+                row for row in self._rows_by_project[project_id] if row not in project_rows
+            ]
+        self._dead += len(rows)
+        if self._dead * 2 > self._size:
+            self._compact()
+
+    def _grow(self, capacity: int) -> None:
+        self._ids = _resize(self._ids, capacity, 0)
+        self._project_ids = _resize(self._project_ids, capacity, 0)
+        self._deadlines = _resize(self._deadlines, capacity, np.datetime64("NaT"))
+        self._date_deadlines = _resize(self._date_deadlines, capacity, False)
+        self._statuses = _resize(self._statuses, capacity, 0)
+        self._closed_at = _resize(self._closed_at, capacity, np.datetime64("NaT"))
+        self._live = _resize(self._live, capacity, False)
+
+    def _compact(self) -> None:
+        keep = self._live[:self._size].copy()
+        size = int(keep.sum())
+        self._ids[:size] = self._ids[:self._size][keep]
+        self._project_ids[:size] = self._project_ids[:self._size][keep]
+        self._deadlines[:size] = self._deadlines[:self._size][keep]
+        self._date_deadlines[:size] = self._date_deadlines[:self._size][keep]
+        self._statuses[:size] = self._statuses[:self._size][keep]
+        self._closed_at[:size] = self._closed_at[:self._size][keep]
+        self._live[:self._size] = False
+        self._live[:size] = True
+        self._titles = [title for title, kept in zip(self._titles, keep) if kept]
+        self._descriptions = [desc for desc, kept in zip(self._descriptions, keep) if kept]
+        self._size = size
+        self._dead = 0
+        for project_id in self._rows_by_project:
+            self._rows_by_project[project_id] = []
+            self._title_rows[project_id] = {}
+        for row, project_id in enumerate(self._project_ids[:size].tolist()):
+            self._rows_by_project[project_id].append(row)
+            self._title_rows[project_id][self._titles[row]] = row
+
+    # ---------- Storage ----------
+
+    def _load(self) -> None:
+        """Start with empty columns; this backend keeps no demo data."""
+        capacity = self._INITIAL_CAPACITY
+        self._size = 0
+        self._dead = 0
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._project_ids = np.zeros(capacity, dtype=np.int64)
+        self._deadlines = np.full(capacity, np.datetime64("NaT"), dtype=_TIME_DTYPE)
+        self._date_deadlines = np.zeros(capacity, dtype=bool)
+        self._statuses = np.zeros(capacity, dtype=np.int8)
+        self._closed_at = np.full(capacity, np.datetime64("NaT"), dtype=_TIME_DTYPE)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._titles: List[Optional[str]] = []
+        self._descriptions: List[Optional[str]] = []
+        self._rows_by_project: Dict[int, List[int]] = {}
+        self._title_rows: Dict[int, Dict[str, int]] = {}
@@ -1,44 +1,142 @@
-from typing import List, Optional, TypeVar
+from typing import Dict, Iterator, List, Optional, Tuple, TypeVar
 from datetime import date
 from models.models import Project, Task, Detail
 from db.db_interface import DatabaseInterface
+from db.deadline_index import DeadlineIndex
+from db.locking import InstrumentedLock, LockStats, ReadWriteLock, StripedLock
+from db.pagination import keyset_page
+from db.persistence import (
+    ADD_PROJECT, UPDATE_PROJECT, REMOVE_PROJECT, ADD_TASK, UPDATE_TASK, REMOVE_TASK, SET_NEXT_IDS,
+    InMemoryPersistence, Record,
+)
+from db.snapshot import DatabaseSnapshot, SnapshotCache
+from db.status_counters import StatusCounters
+from exception.exceptions import VersionConflictError
 
 T = TypeVar("T", Project, Task)
 
 
-def _find_task(project: Project, task: Task) -> Task:
-    for t in project.tasks:
-        if t.detail.title == task.detail.title:
-            return t
-    raise ValueError(f"Task '{task.detail.title}' not found in project '{project.detail.title}'.")
+def _check_version(old_entity: T, new_entity: T, stored: T) -> None:
+    """Reject an update based on an older version than the stored entity.
+
+    That is the version new_entity is based on, else the one of old_entity when it is
+    a copy rather than the stored object itself.
+    """
+    expected = new_entity.version
+    if expected is None and old_entity is not stored:
+        expected = old_entity.version
+    if expected is not None and expected != stored.version:
+        raise VersionConflictError(f"'{old_entity.detail.title}'")
 
 
 class InMemoryDatabase(DatabaseInterface[T]):
-    """In-memory database implementation with CRUD operations."""
+    """In-memory database implementation with CRUD operations.
+
+    Projects and tasks are kept in their lists for ordered reads and additionally
+    indexed by title (project title -> task title -> task) and by id for O(1) lookups.
+    Tasks that are not done are also kept in a deadline-ordered index, and task
+    counts by status are maintained per project and globally.
+
+    With ``persistence`` every write is also logged to its snapshot + write-ahead log
+    and the state is recovered from there instead of loading the demo data.
+
+    Thread safety: project-level writes take the project list's write lock; task
+    writes take its read lock plus the stripe lock of their project, so writes to
+    projects on different stripes run concurrently. The id maps, deadline index,
+    counters and log shared by all projects are updated under a short mutex.
+    Returned lists are live; use ``snapshot()`` to iterate while others write.
+    """
 
-    def __init__(self) -> None:
+    TASK_LOCK_STRIPES = 64
+
+    def __init__(self, persistence: Optional[InMemoryPersistence] = None) -> None:
         super().__init__()
+        self._lock_stats = {name: LockStats() for name in ("projects_read", "projects_write", "tasks", "shared")}
+        self._projects_lock = ReadWriteLock(self._lock_stats["projects_read"], self._lock_stats["projects_write"])
+        self._task_locks = StripedLock(self.TASK_LOCK_STRIPES, self._lock_stats["tasks"])
+        self._shared_lock = InstrumentedLock(self._lock_stats["shared"])
+        self._project_index: Dict[str, Project] = {}
+        self._task_index: Dict[str, Dict[str, Task]] = {}
+        self._projects_by_id: Dict[int, Project] = {}
+        self._tasks_by_id: Dict[int, Task] = {}
+        self._task_project_ids: Dict[int, int] = {}
+        self._next_project_id = 1
+        self._next_task_id = 1
+        self._deadline_index = DeadlineIndex()
+        self._status_counters = StatusCounters()
+        self._snapshots = SnapshotCache()
+        self._persistence = persistence
+        self._replaying = False
         self._load()
 
     # ---------- Unified Add/Remove Methods ----------
 
     def add_entity(self, entity: T, parent: Optional[Project] = None) -> None:
         if parent is None:  # Project
-            self._projects.append(entity)  # No duplicates check here
+            with self._projects_lock.write():
+                self._projects.append(entity)  # No duplicates check here
+                self._index_project(entity)
+                self._snapshots.invalidate(entity.id)
+                self._log_project(ADD_PROJECT, entity)
+                for task in entity.tasks:
+                    self._log_task(ADD_TASK, entity, task)
         else:  # Task
-            proj = self._find_project(parent)
-            if any(t.detail.title == entity.detail.title for t in proj.tasks):
-                raise ValueError(f"Task '{entity.detail.title}' already exists in project '{proj.detail.title}'.")
-            proj.tasks.append(entity)
+            with self._projects_lock.read():
+                proj = self._find_project(parent)
+                with self._task_locks.for_key(proj.id):
+                    tasks = self._task_index[proj.detail.title]
+                    if entity.detail.title in tasks:
+                        raise ValueError(
+                            f"Task '{entity.detail.title}' already exists in project '{proj.detail.title}'.")
+                    proj.tasks.append(entity)
+                    tasks[entity.detail.title] = entity
+                    with self._shared_lock:
+                        self._register_task(proj, entity)
+                        self._snapshots.invalidate(proj.id)
+                        self._log_task(ADD_TASK, proj, entity)
+        self._snapshot_if_due()
+
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        with self._projects_lock.read():
+            proj = self._find_project(project)
+            with self._task_locks.for_key(proj.id):
+                index = self._task_index[proj.detail.title]
+                seen = set()
+                for task in tasks:
+                    if task.detail.title in index or task.detail.title in seen:
+                        raise ValueError(
+                            f"Task '{task.detail.title}' already exists in project '{proj.detail.title}'.")
+                    seen.add(task.detail.title)
+                proj.tasks.extend(tasks)
+                for task in tasks:
+                    index[task.detail.title] = task
+                with self._shared_lock:
+                    for task in tasks:
+                        self._register_task(proj, task)
+                        self._log_task(ADD_TASK, proj, task)
+                    self._snapshots.invalidate(proj.id)
+        self._snapshot_if_due()
 
     def remove_entity(self, entity: T, parent: Optional[Project] = None) -> None:
         if parent is None:
-            proj = self._find_project(entity)
-            self._projects.remove(proj)
+            with self._projects_lock.write():
+                proj = self._find_project(entity)
+                self._projects.remove(proj)
+                self._unindex_project(proj)
+                self._snapshots.invalidate(proj.id)
+                self._log(REMOVE_PROJECT, proj.id)
         else:
-            proj = self._find_project(parent)
-            task_obj = _find_task(proj, entity)
-            proj.tasks.remove(task_obj)
+            with self._projects_lock.read():
+                proj = self._find_project(parent)
+                with self._task_locks.for_key(proj.id):
+                    task_obj = self._find_task(proj, entity)
+                    proj.tasks.remove(task_obj)
+                    del self._task_index[proj.detail.title][task_obj.detail.title]
+                    with self._shared_lock:
+                        self._forget_task(task_obj)
+                        self._snapshots.invalidate(proj.id)
+                        self._log(REMOVE_TASK, proj.id, task_obj.id)
+        self._snapshot_if_due()
 
     # ---------- Interface Wrappers ----------
 
@@ -58,18 +156,53 @@ class InMemoryDatabase(DatabaseInterface[T]):
 
     def update_entity(self, old_entity: T, new_entity: T, parent_project: Optional[Project]) -> None:
         if isinstance(old_entity, Project) and isinstance(new_entity, Project):
-            proj_obj = self._find_project(old_entity)
-            proj_obj.detail = new_entity.detail
+            with self._projects_lock.write():
+                proj_obj = self._find_project(old_entity)
+                _check_version(old_entity, new_entity, proj_obj)
+                old_title = proj_obj.detail.title
+                new_title = new_entity.detail.title
+                if new_title != old_title and new_title in self._project_index:
+                    raise ValueError(f"Project '{new_title}' already exists.")
+                proj_obj.detail = new_entity.detail
+                proj_obj._version += 1
+                new_entity._version = proj_obj._version
+                self._reindex_project(old_title, proj_obj)
+                self._snapshots.invalidate(proj_obj.id)
+                self._log_project(UPDATE_PROJECT, proj_obj)
         elif isinstance(old_entity, Task) and isinstance(new_entity, Task):
             if parent_project is None:
                 raise ValueError("Parent project must be provided for tasks.")
-            proj = self._find_project(parent_project)
-            task_obj = _find_task(proj, old_entity)
-            task_obj.detail = new_entity.detail
-            task_obj.deadline = new_entity.deadline
-            task_obj.status = new_entity.status or task_obj.status
+            with self._projects_lock.read():
+                proj = self._find_project(parent_project)
+                with self._task_locks.for_key(proj.id):
+                    self._update_task(proj, old_entity, new_entity)
         else:
             raise TypeError("Entity type mismatch.")
+        self._snapshot_if_due()
+
+    def _update_task(self, proj: Project, old_entity: Task, new_entity: Task) -> None:
+        task_obj = self._find_task(proj, old_entity)
+        _check_version(old_entity, new_entity, task_obj)
+        tasks = self._task_index[proj.detail.title]
+        new_title = new_entity.detail.title
+        if new_title != task_obj.detail.title and new_title in tasks:
+            raise ValueError(f"Task '{new_title}' already exists in project '{proj.detail.title}'.")
+        del tasks[task_obj.detail.title]
+        old_deadline, old_status = task_obj.deadline, task_obj.status
+        task_obj.detail = new_entity.detail
+        task_obj.deadline = new_entity.deadline
+        task_obj.status = new_entity.status or task_obj.status
+        if new_entity.closed_at is not None:
+            task_obj.closed_at = new_entity.closed_at
+        task_obj._version += 1
+        new_entity._version = task_obj._version
+        tasks[task_obj.detail.title] = task_obj
+        with self._shared_lock:
+            self._deadline_index.discard(task_obj.id, old_deadline)
+            self._index_deadline(task_obj)
+            self._status_counters.move(proj.id, old_status, task_obj.status)
+            self._snapshots.invalidate(proj.id)
+            self._log_task(UPDATE_TASK, proj, task_obj)
 
     # ---------- Get Methods ----------
 
@@ -77,20 +210,187 @@ class InMemoryDatabase(DatabaseInterface[T]):
         return self._projects
 
     def get_tasks(self, project: Project) -> List[Task]:
-        proj = self._find_project(project)
-        return proj.tasks
+        with self._projects_lock.read():
+            return self._find_project(project).tasks
+
+    def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                       limit: Optional[int] = None) -> List[Task]:
+        with self._projects_lock.read():
+            proj = self._find_project(project)
+            with self._task_locks.for_key(proj.id):
+                return keyset_page(proj.tasks, after, limit)
+
+    def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        with self._projects_lock.read():
+            return self._projects_by_id.get(project_id)
+
+    def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        with self._projects_lock.read(), self._shared_lock:
+            if self._task_project_ids.get(task_id) != project.id:
+                return None
+            return self._tasks_by_id[task_id]
+
+    def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        with self._projects_lock.read():
+            project_id = None if project is None else self._find_project(project).id
+            with self._shared_lock:
+                return self._status_counters.snapshot(project_id)
+
+    def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                              limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        with self._projects_lock.read(), self._shared_lock:
+            return [
+                (self._projects_by_id[self._task_project_ids[task_id]], self._tasks_by_id[task_id])
+                for task_id in self._deadline_index.range(start, end, limit)
+            ]
+
+    def snapshot(self) -> DatabaseSnapshot:
+        with self._projects_lock.write():
+            return self._snapshots.build(self._projects, lambda project: project.tasks)
+
+    def lock_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return acquisitions, contended acquisitions and wait times (seconds) per lock."""
+        return {name: stats.as_dict() for name, stats in self._lock_stats.items()}
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        return {f"lock.{name}": stats for name, stats in self.lock_stats().items()}
 
     # ---------- Helper Methods ----------
 
     def _find_project(self, project: Project) -> Project:
-        for p in self._projects:
-            if p.detail.title == project.detail.title:
-                return p
-        raise ValueError(f"Project '{project.detail.title}' not found.")
+        proj = self._project_index.get(project.detail.title)
+        if proj is None:
+            raise ValueError(f"Project '{project.detail.title}' not found.")
+        return proj
+
+    def _find_task(self, project: Project, task: Task) -> Task:
+        task_obj = self._task_index[project.detail.title].get(task.detail.title)
+        if task_obj is None:
+            raise ValueError(f"Task '{task.detail.title}' not found in project '{project.detail.title}'.")
+        return task_obj
+
+    def _index_project(self, project: Project) -> None:
+        if project._id is None:
+            project._id = self._next_project_id
+        if project._version is None:
+            project._version = 1
+        self._next_project_id = max(self._next_project_id, project._id + 1)
+        self._project_index[project.detail.title] = project
+        self._task_index[project.detail.title] = {t.detail.title: t for t in project.tasks}
+        self._projects_by_id[project._id] = project
+        for task in project.tasks:
+            self._register_task(project, task)
+
+    def _reindex_project(self, old_title: str, project: Project) -> None:
+        del self._project_index[old_title]
+        self._project_index[project.detail.title] = project
+        self._task_index[project.detail.title] = self._task_index.pop(old_title)
+
+    def _unindex_project(self, project: Project) -> None:
+        del self._project_index[project.detail.title]
+        del self._task_index[project.detail.title]
+        del self._projects_by_id[project._id]
+        for task in project.tasks:
+            self._forget_task(task)
+        self._status_counters.drop_project(project._id)
+
+    def _register_task(self, project: Project, task: Task) -> None:
+        if task._id is None:
+            task._id = self._next_task_id
+        if task._version is None:
+            task._version = 1
+        self._next_task_id = max(self._next_task_id, task._id + 1)
+        self._tasks_by_id[task._id] = task
+        self._task_project_ids[task._id] = project._id
+        self._index_deadline(task)
+        self._status_counters.add(project._id, task.status)
+
+    def _forget_task(self, task: Task) -> None:
+        del self._tasks_by_id[task._id]
+        project_id = self._task_project_ids.pop(task._id)
+        self._deadline_index.discard(task._id, task.deadline)
+        self._status_counters.remove(project_id, task.status)
+
+    def _index_deadline(self, task: Task) -> None:
+        if task.status != "done":
+            self._deadline_index.add(task.id, task.deadline)
+
+    # ---------- Persistence ----------
+
+    def close(self) -> None:
+        """Write a final snapshot and close the log when persistence is enabled."""
+        if self._persistence is not None:
+            with self._projects_lock.write():
+                self._persistence.write_snapshot(self._snapshot_records())
+                self._persistence.close()
+
+    def _log(self, op: int, *fields) -> None:
+        if self._persistence is None or self._replaying:
+            return
+        self._persistence.append(op, *fields)
+
+    def _snapshot_if_due(self) -> None:
+        if self._persistence is None or self._replaying or not self._persistence.should_snapshot():
+            return
+        with self._projects_lock.write():
+            if self._persistence.should_snapshot():
+                self._persistence.write_snapshot(self._snapshot_records())
+
+    def _log_project(self, op: int, project: Project) -> None:
+        self._log(op, project.id, project.detail.title, project.detail.description)
+
+    def _log_task(self, op: int, project: Project, task: Task) -> None:
+        self._log(op, project.id, task.id, task.detail.title, task.detail.description,
+                  task.deadline, task.status, task.closed_at)
+
+    def _snapshot_records(self) -> Iterator[Record]:
+        yield SET_NEXT_IDS, (self._next_project_id, self._next_task_id)
+        for project in self._projects:
+            yield ADD_PROJECT, (project.id, project.detail.title, project.detail.description)
+            for task in project.tasks:
+                yield ADD_TASK, (project.id, task.id, task.detail.title, task.detail.description,
+                                 task.deadline, task.status, task.closed_at)
+
+    def _recover(self) -> None:
+        self._replaying = True
+        try:
+            for op, fields in self._persistence.recover():
+                self._replay(op, fields)
+        finally:
+            self._replaying = False
+
+    def _replay(self, op: int, fields: tuple) -> None:
+        if op in (ADD_PROJECT, UPDATE_PROJECT):
+            project_id, title, description = fields
+            project = Project(detail=Detail(title, description))
+            if op == UPDATE_PROJECT:
+                self.update_entity(self._projects_by_id[project_id], project, None)
+            else:
+                project._id = project_id
+                self.add_entity(project)
+        elif op == REMOVE_PROJECT:
+            self.remove_entity(self._projects_by_id[fields[0]])
+        elif op in (ADD_TASK, UPDATE_TASK):
+            project_id, task_id, title, description, deadline, status, closed_at = fields
+            project = self._projects_by_id[project_id]
+            task = Task(detail=Detail(title, description), deadline=deadline, status=status, closed_at=closed_at)
+            if op == UPDATE_TASK:
+                self.update_entity(self._tasks_by_id[task_id], task, project)
+            else:
+                task._id = task_id
+                self.add_entity(task, parent=project)
+        elif op == REMOVE_TASK:
+            project_id, task_id = fields
+            self.remove_entity(self._tasks_by_id[task_id], parent=self._projects_by_id[project_id])
+        elif op == SET_NEXT_IDS:
+            self._next_project_id, self._next_task_id = fields
 
     # ---------- Demo Data ----------
 
     def _load(self) -> None:
+        if self._persistence is not None:
+            self._recover()
+            return
         project1 = Project(
             detail=Detail("Project A", "Demo project A"),
             tasks=[
@@ -105,3 +405,5 @@ class InMemoryDatabase(DatabaseInterface[T]):
             ],
         )
         self._projects = [project1, project2]
+        for project in self._projects:
+            self._index_project(project)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, TypeVar, Generic, Optional
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, Iterator, List, TypeVar, Generic, Optional, Tuple
+from db.pagination import keyset_page
+from db.snapshot import DatabaseSnapshot
+from db.unit_of_work import UnitOfWork
 from models.models import Project, Task
 
 T = TypeVar("T", Project, Task)
@@ -11,6 +16,28 @@ class DatabaseInterface(ABC, Generic[T]):
     def __init__(self):
         self._projects: List[Project] = []
 
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Return backend runtime metrics grouped by component; empty when the backend has none."""
+        return {}
+
+    def begin_unit_of_work(self) -> UnitOfWork:
+        """Start a unit of work that the calls made until its commit or rollback join."""
+        return UnitOfWork()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[UnitOfWork]:
+        """Run the enclosed calls in one transaction: commit on success, roll back on error."""
+        uow = self.begin_unit_of_work()
+        try:
+            yield uow
+        except BaseException:
+            uow.rollback()
+            raise
+        else:
+            uow.commit()
+        finally:
+            uow.close()
+
     @abstractmethod
     def add_project(self, project: Project) -> None:
         raise NotImplementedError
@@ -23,6 +50,11 @@ class DatabaseInterface(ABC, Generic[T]):
     def add_task(self, project: Project, task: Task) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def add_tasks(self, project: Project, tasks: List[Task]) -> None:
+        """Add a batch of tasks to a project; either all of them are stored or none."""
+        raise NotImplementedError
+
     @abstractmethod
     def remove_task(self, project: Project, task: Task) -> None:
         raise NotImplementedError
@@ -39,6 +71,52 @@ class DatabaseInterface(ABC, Generic[T]):
     def get_tasks(self, project: Project) -> List[Task]:
         raise NotImplementedError
 
+    def get_projects_page(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Project]:
+        """Return up to limit projects with id > after, in id order."""
+        return keyset_page(self.get_projects(), after, limit)
+
+    def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                       limit: Optional[int] = None) -> List[Task]:
+        """Return up to limit tasks of a project with id > after, in id order."""
+        return keyset_page(self.get_tasks(project), after, limit)
+
+    @abstractmethod
+    def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        """Return task counts by status for a project, or across all projects when project is None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                              limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        """Return (project, task) pairs of not-done tasks with start <= deadline < end, earliest first."""
+        raise NotImplementedError
+
+    def close_overdue(self, now: datetime) -> List[int]:
+        """Mark not-done tasks with deadline < now as done, closed at now; return their ids.
+
+        Task by task through update_entity; backends that can close them in one set-based
+        operation override this.
+        """
+        closed = []
+        for project, task in self.get_tasks_due_between(end=now):
+            new_task = Task(detail=task.detail, deadline=task.deadline, status="done", closed_at=now)
+            self.update_entity(task, new_task, project)
+            closed.append(task.id)
+        return closed
+
+    @abstractmethod
+    def snapshot(self) -> DatabaseSnapshot:
+        """Return an immutable point-in-time view that later writes do not affect."""
+        raise NotImplementedError
+
     @abstractmethod
     def _load(self) -> None:
         raise NotImplementedError
\ No newline at end of file
@@ -1,21 +1,42 @@
-from typing import TypeVar, Optional, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import Dict, Iterator, TypeVar, Optional, List, Tuple
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
 from db.db_interface import DatabaseInterface
-from db.entities.project_postgres import ProjectPostgres
-from db.entities.task_postgres import TaskPostgres
+from db.pool import PoolSettings
+from db.postgres_mirror import MirrorCheckpoint, PostgresMirror
 from db.session import DBSession
+from db.snapshot import DatabaseSnapshot
+from db.unit_of_work import SessionUnitOfWork, UnitOfWork
 from models.models import Project, Task
 
 T = TypeVar("T", Project, Task)
 
 
-class PostgresDatabase(DatabaseInterface[T]):
-    """PostgreSQL database wrapper."""
+class PostgresDatabase(PostgresMirror, DatabaseInterface[T]):
+    """PostgreSQL database wrapper.
 
-    def __init__(self, url: str, use_alembic: bool = False):
+    Reads are served from an in-process mirror of the tables, indexed by primary key,
+    together with per-project and global task counts by status. Projects are mirrored
+    at startup as metadata only; a project's tasks are fetched on first access and
+    cached from then on, so untouched projects never load their tasks.
+
+    Calls made inside ``unit_of_work()`` share its session and are committed once at
+    the end; a call made outside one runs in a unit of work of its own.
+
+    With ``refresh_interval`` set (seconds), writes committed by other processes are
+    picked up at most that long after they happen; None trusts the mirror forever,
+    which is only safe while this process is the database's single writer.
+    """
+
+    def __init__(self, url: str, use_alembic: bool = False, pool: Optional[PoolSettings] = None,
+                 refresh_interval: Optional[float] = None):
         super().__init__()
-        self._project_entity = ProjectPostgres()
-        self._task_entity = TaskPostgres()
-        self._db_session = DBSession(url, use_alembic=use_alembic)
+        self._refresh_interval = refresh_interval
+        self._db_session = self._create_session(url, use_alembic, pool)
+        self._current_uow: ContextVar[Optional[SessionUnitOfWork]] = ContextVar(f"uow_{id(self)}", default=None)
 
         if not use_alembic:
             from db.orm_models import Base
@@ -23,48 +44,118 @@ class PostgresDatabase(DatabaseInterface[T]):
 
         self._load()
 
+    def _create_session(self, url: str, use_alembic: bool, pool: Optional[PoolSettings]) -> DBSession:
+        if not use_alembic and make_url(url).get_backend_name() == "postgresql":
+            # Migration 0005 partitions tasks, which create_all cannot reproduce.
+            raise RuntimeError("PostgreSQL schemas come from the migrations: run `alembic upgrade head` "
+                               "and pass use_alembic=True.")
+        return DBSession(url, use_alembic=use_alembic, pool=pool)
+
+    def begin_unit_of_work(self) -> UnitOfWork:
+        if self._current_uow.get() is not None:
+            return UnitOfWork()  # joins the outer unit, which commits or rolls back
+        return SessionUnitOfWork(self._db_session.get_session(), self._current_uow,
+                                 MirrorCheckpoint(), self._restore_checkpoint, self._publish_changes)
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        if self._current_uow.get() is None:
+            with self.unit_of_work(), self._session() as session:
+                yield session
+            return
+        session = self._current_uow.get().session
+        if self._refresh_due():
+            self._refresh_mirror(session)
+        yield session
+
+    def _refresh_if_due(self) -> None:
+        if self._refresh_due():
+            with self._session():
+                pass
+
     def add_project(self, project: Project) -> None:
-        with self._db_session.get_session() as session:
-            self._project_entity.add_entity(project, self._projects, session)
+        with self._session() as session:
+            self._add_project(session, project)
 
     def remove_project(self, project: Project) -> None:
-        with self._db_session.get_session() as session:
-            self._project_entity.remove_entity(project, self._projects, session)
+        with self._session() as session:
+            self._remove_project(session, project)
 
     def add_task(self, parent_project: Project, task: Task) -> None:
-        proj_model = self._find_project_model(parent_project)
-        with self._db_session.get_session() as session:
-            self._task_entity.add_entity(task, proj_model.tasks, session, parent=parent_project)
+        with self._session() as session:
+            self._add_task(session, parent_project, task)
+
+    def add_tasks(self, parent_project: Project, tasks: List[Task]) -> None:
+        with self._session() as session:
+            self._add_tasks(session, parent_project, tasks)
 
     def remove_task(self, parent_project: Project, task: Task) -> None:
-        proj_model = self._find_project_model(parent_project)
-        with self._db_session.get_session() as session:
-            self._task_entity.remove_entity(task, proj_model.tasks, session, parent=parent_project)
+        with self._session() as session:
+            self._remove_task(session, parent_project, task)
 
     def update_entity(self, old_entity: T, new_entity: T, parent_project: Optional[Project]) -> None:
-        with self._db_session.get_session() as session:
-            if parent_project is None:
-                self._project_entity.update_entity(old_entity, new_entity, self._projects,session)
-            else:
-                proj_model = self._find_project_model(parent_project)
-                self._task_entity.update_entity(old_entity, new_entity, proj_model.tasks,
-                                                session, parent=parent_project)
+        with self._session() as session:
+            self._update_entity(session, old_entity, new_entity, parent_project)
+
+    def close_overdue(self, now: datetime) -> List[int]:
+        """Close overdue tasks with one UPDATE ... RETURNING and patch the mirror from its rows."""
+        with self._session() as session:
+            return self._close_overdue(session, now)
+
+    def add_task_partition(self, year: int) -> None:
+        """Create the partition of tasks closed in year (PostgreSQL only)."""
+        with self._session() as session:
+            self._task_partitions.add_closed_year(session, year)
+
+    def detach_task_partition(self, year: int) -> List[int]:
+        """Detach the partition of tasks closed in year from ``tasks`` and return their ids.
+
+        The partition stays in the database as a standalone table, e.g. for archiving;
+        its tasks leave the mirror and, once committed, every other process's mirror.
+        """
+        with self._session() as session:
+            return self._detach_closed_tasks(session, year)
 
     def get_projects(self) -> List[Project]:
+        self._refresh_if_due()
         return self._projects
 
     def get_tasks(self, project: Project) -> List[Task]:
-        return self._find_project_model(project).tasks
+        self._refresh_if_due()
+        if self._is_loaded(project):
+            return self._find_project_model(project).tasks
+        with self._session() as session:
+            return self._get_tasks(session, project)
+
+    def get_tasks_page(self, project: Project, after: Optional[int] = None,
+                       limit: Optional[int] = None) -> List[Task]:
+        with self._session() as session:
+            return self._get_tasks_page(session, project, after, limit)
+
+    def get_project_by_id(self, project_id: int) -> Optional[Project]:
+        self._refresh_if_due()
+        return self._projects_by_id.get(project_id)
+
+    def get_task_by_id(self, project: Project, task_id: int) -> Optional[Task]:
+        with self._session() as session:
+            return self._get_task_by_id(session, project, task_id)
+
+    def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        self._refresh_if_due()
+        return self._get_status_counts(project)
+
+    def get_tasks_due_between(self, start: Optional[date] = None, end: Optional[date] = None,
+                              limit: Optional[int] = None) -> List[Tuple[Project, Task]]:
+        with self._session() as session:
+            return self._get_tasks_due_between(session, start, end, limit)
+
+    def snapshot(self) -> DatabaseSnapshot:
+        with self._session() as session:
+            return self._snapshot(session)
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        return {"pool": self._db_session.pool_status()}
 
     def _load(self) -> None:
-        self._projects.clear()
-        with self._db_session.get_session() as session:
-            loaded = self._project_entity.load_all(session)
-            loaded.sort(key=lambda p: p._id)
-            self._projects.extend(loaded)
-
-    def _find_project_model(self, project: Project) -> Project:
-        for p in self._projects:
-            if p.detail.title == project.detail.title:
-                return p
-        raise ValueError(f"Project '{project.detail.title}' not found")
+        with self._session() as session:
+            self._load_mirror(session)
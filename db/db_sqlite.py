@@ -0,0 +1,23 @@
+from typing import Optional, TypeVar
+
+from db.db_postgres import PostgresDatabase
+from db.pool import PoolSettings
+from db.session import DBSession, SQLiteSession
+from models.models import Project, Task
+
+T = TypeVar("T", Project, Task)
+
+
+class SQLiteDatabase(PostgresDatabase[T]):
+    """Embedded SQLite database sharing the PostgreSQL backend's schema and entity classes.
+
+    The whole database is a single file opened in WAL mode, so readers never block the
+    writer and commits only fsync the log at checkpoints.
+    """
+
+    def __init__(self, path: str, pool: Optional[PoolSettings] = None,
+                 refresh_interval: Optional[float] = None) -> None:
+        super().__init__(path, use_alembic=False, pool=pool, refresh_interval=refresh_interval)
+
+    def _create_session(self, path: str, use_alembic: bool, pool: Optional[PoolSettings]) -> DBSession:
+        return SQLiteSession(path, pool=pool)
@@ -0,0 +1,46 @@
+from bisect import bisect_left, insort
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+Key = Tuple[datetime, int]
+
+
+def to_datetime(value: date) -> datetime:
+    """Normalize a date or datetime deadline to a comparable datetime."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time.min)
+
+
+class DeadlineIndex:
+    """Deadline-ordered index of task ids, kept sorted for range queries."""
+
+    def __init__(self) -> None:
+        self._keys: List[Key] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, task_id: int, deadline: Optional[date]) -> None:
+        if deadline is not None:
+            insort(self._keys, (to_datetime(deadline), task_id))
+
+    def discard(self, task_id: int, deadline: Optional[date]) -> None:
+        if deadline is None:
+            return
+        key = (to_datetime(deadline), task_id)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def range(self, start: Optional[date] = None, end: Optional[date] = None,
+              limit: Optional[int] = None) -> List[int]:
+        """Return ids with start <= deadline < end in deadline order, at most limit of them."""
+        low = 0 if start is None else bisect_left(self._keys, (to_datetime(start), -1))
+        high = len(self._keys) if end is None else bisect_left(self._keys, (to_datetime(end), -1))
+        if limit is not None:
+            high = min(high, low + limit)
+        return [task_id for _, task_id in self._keys[low:high]]
@@ -0,0 +1,49 @@
+from typing import Collection, List, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from db.orm_models import MirrorVersionORM, ProjectChangeORM
+
+_COUNTER_ID = 1
+
+
+class ChangeLogPostgres:
+    """Database-side change versions that keep mirrors in different processes coherent.
+
+    Every committed write bumps the single ``mirror_version`` row and stamps the projects
+    it touched with the new version. The bump holds the counter row's lock until commit,
+    so versions become visible in commit order and a reader that has seen version N can
+    never later miss a change numbered N or lower.
+    """
+
+    def ensure_counter(self, session: Session) -> int:
+        """Return the current version, creating the counter row on a fresh database."""
+        version = self.current_version(session)
+        if version is None:
+            session.execute(insert(MirrorVersionORM).values(id=_COUNTER_ID, version=0))
+            version = 0
+        return version
+
+    def current_version(self, session: Session) -> Optional[int]:
+        return session.execute(
+            select(MirrorVersionORM.version).where(MirrorVersionORM.id == _COUNTER_ID)
+        ).scalar_one_or_none()
+
+    def publish(self, session: Session, project_ids: Collection[int]) -> int:
+        """Bump the version and stamp the given projects with it; return the new version."""
+        version = session.execute(
+            update(MirrorVersionORM)
+            .where(MirrorVersionORM.id == _COUNTER_ID)
+            .values(version=MirrorVersionORM.version + 1)
+            .returning(MirrorVersionORM.version)
+        ).scalar_one()
+        session.execute(delete(ProjectChangeORM).where(ProjectChangeORM.project_id.in_(project_ids)))
+        session.execute(insert(ProjectChangeORM), [
+            {"project_id": project_id, "version": version} for project_id in project_ids
+        ])
+        return version
+
+    def changed_since(self, session: Session, version: int) -> List[int]:
+        """Return ids of projects written after the given version, removed ones included."""
+        return list(session.execute(
+            select(ProjectChangeORM.project_id).where(ProjectChangeORM.version > version)
+        ).scalars())
@@ -1,8 +1,11 @@
 from abc import abstractmethod
-from typing import TypeVar, Generic, List, Optional, Type
+from typing import Any, Dict, Iterator, Mapping, Sequence, TypeVar, Generic, List, Optional, Type
+from sqlalchemy import Executable, Row
 from sqlalchemy.orm import Session
 
+from db.entities.statements import DELETE_BY_ID, UPDATE_BY_ID, UPDATE_BY_ID_AND_VERSION
 from db.orm_models import ProjectORM, TaskORM
+from exception.exceptions import VersionConflictError
 from models.models import Project, Task
 
 T = TypeVar("T")
@@ -11,12 +14,13 @@ T = TypeVar("T")
 def _apply_detail_update(new_entity: T, orm_obj: Type[TaskORM | ProjectORM]) -> None:
     orm_obj.title = new_entity.detail.title
     orm_obj.description = new_entity.detail.description
+    orm_obj.version += 1
 
 
 def _apply_postgres_remove(container: List[T], entity:T ,
                            orm_obj: Type[TaskORM | ProjectORM], session: Session) -> None:
     session.delete(orm_obj)
-    session.commit()
+    session.flush()
     container.remove(entity)
 
 
@@ -25,13 +29,36 @@ def _update_in_memory_container(container: List[T], new_entity: T, old_entity: T
         new_entity.tasks = old_entity.tasks
     for index, item in enumerate(container):
         if item.detail.title == old_entity.detail.title:
+            new_entity._id = item._id
             container[index] = new_entity
             return
     raise ValueError(f"Entity '{old_entity.detail.title}' not found in container.")
 
 
 class EntityPostgres(Generic[T]):
-    """Base class for Postgres entities."""
+    """Base class for Postgres entities.
+
+    Updates and removes of entities with a known id are a single UPDATE/DELETE by
+    primary key; the title-based ORM lookup is only the fallback for id-less entities.
+    An update of an entity read with a version (or of a replacement marked with
+    ``based_on``) only matches while the row still has that version, so a concurrent writer's change raises VersionConflictError instead
+    of being overwritten.
+    Writes are flushed, never committed: the caller's unit of work owns the transaction.
+    Bulk loads stream their rows in batches of ``load_batch_size`` over a server-side
+    cursor, so only one batch of raw rows is held at a time.
+    """
+
+    orm_class: Type[TaskORM | ProjectORM]
+    load_batch_size = 1000
+
+    def _stream(self, session: Session, statement: Executable,
+                params: Optional[Mapping[str, Any]] = None) -> Iterator[Sequence[Row]]:
+        """Yield the statement's rows in batches of load_batch_size."""
+        result = session.execute(statement, params or {}, execution_options={"yield_per": self.load_batch_size})
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
 
     def add_entity(self, entity: T, container: List[T],
                    session: Session, parent: Optional[Project] = None) -> None:
@@ -40,29 +67,62 @@ class EntityPostgres(Generic[T]):
 
     def remove_entity(self, entity: T, container: List[T],
                       session: Session, parent: Optional[Project] = None) -> None:
+        if entity.id is not None:
+            self._delete_by_id(entity, session)
+            container.remove(entity)
+            return
         proj_orm = self._fetch_parent_proj_orm(parent, session)
         orm_object = self._fetch_orm(entity, session, parent, proj_orm)
         _apply_postgres_remove(container, entity, orm_object, session)
 
     def update_entity(self, old_entity: T, new_entity: T, container: List[T],
                       session: Session, parent: Optional[Project] = None) -> None:
-        parent_proj_orm = self._fetch_parent_proj_orm(parent, session)
-        old_entity_orm = self._fetch_orm(old_entity, session, parent, parent_proj_orm)
-        self._apply_postgres_update(new_entity, old_entity_orm, session)
+        if old_entity.id is not None:
+            self._update_by_id(old_entity, new_entity, session)
+        else:
+            parent_proj_orm = self._fetch_parent_proj_orm(parent, session)
+            old_entity_orm = self._fetch_orm(old_entity, session, parent, parent_proj_orm)
+            self._apply_postgres_update(new_entity, old_entity_orm, session)
         _update_in_memory_container(container, new_entity, old_entity)
 
+    def _update_by_id(self, old_entity: T, new_entity: T, session: Session) -> None:
+        params = {"entity_id": old_entity.id, **self._update_values(new_entity)}
+        expected = new_entity.version if new_entity.version is not None else old_entity.version
+        if expected is None:
+            statement = UPDATE_BY_ID[self.orm_class]
+        else:
+            statement = UPDATE_BY_ID_AND_VERSION[self.orm_class]
+            params["expected_version"] = expected
+        version = session.execute(statement, params).scalar_one_or_none()
+        if version is None:
+            if expected is not None and session.get(self.orm_class, old_entity.id) is not None:
+                raise VersionConflictError(f"'{old_entity.detail.title}'")
+            raise ValueError(f"Entity '{old_entity.detail.title}' not found")
+        new_entity._version = version
+
+    def _delete_by_id(self, entity: T, session: Session) -> None:
+        result = session.execute(DELETE_BY_ID[self.orm_class], {"entity_id": entity.id})
+        if result.rowcount == 0:
+            raise ValueError(f"Entity '{entity.detail.title}' not found")
+
+    def _update_values(self, new_entity: T) -> Dict[str, Any]:
+        return {"title": new_entity.detail.title, "description": new_entity.detail.description}
+
     def _apply_postgres_add(self, container: List[T], entity: T,
                             session: Session, parent_proj_orm: Optional[Type[ProjectORM]]) -> None:
         entity_orm = self._create_orm_object(entity, parent_proj_orm)
         session.add(entity_orm)
-        session.commit()
+        session.flush()
+        entity._id = entity_orm.id
+        entity._version = entity_orm.version
         container.append(entity)
 
     def _apply_postgres_update(self, new_entity: T,
                                old_entity_orm: Type[TaskORM | ProjectORM], session: Session) -> None:
         self._apply_deadline_and_task_update(new_entity, old_entity_orm)
         _apply_detail_update(new_entity, old_entity_orm)
-        session.commit()
+        session.flush()
+        new_entity._version = old_entity_orm.version
 
     @abstractmethod
     def load_all(self, session: Session) -> List[T]:
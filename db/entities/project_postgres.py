@@ -1,11 +1,13 @@
-from typing import List, Optional, Type
+from typing import Collection, List, Optional, Type
 from sqlalchemy.orm import Session
 from db.entities.entity_postgres import EntityPostgres
+from db.entities.statements import DELETE_TASKS_OF_PROJECT, PROJECT_BY_TITLE, PROJECT_ROWS, PROJECT_ROWS_BY_IDS
 from db.orm_models import ProjectORM, TaskORM
 from models.models import Project, Detail, Task
 
 
 class ProjectPostgres(EntityPostgres[Project]):
+    orm_class = ProjectORM
 
     def _create_orm_object(self, entity: Project, proj_orm: Optional[ProjectORM]) -> ProjectORM:
         return ProjectORM(title=entity.detail.title, description=entity.detail.description)
@@ -15,7 +17,7 @@ class ProjectPostgres(EntityPostgres[Project]):
 
     def _fetch_orm(self, entity: Project, session: Session, parent: Optional[Project],
                    parent_orm: Optional[ProjectORM]) -> Type[ProjectORM]:
-        orm_obj = session.query(ProjectORM).filter_by(title=entity.detail.title).one_or_none()
+        orm_obj = session.execute(PROJECT_BY_TITLE, {"title": entity.detail.title}).scalar_one_or_none()
         if orm_obj is None:
             raise ValueError(f"Project '{entity.detail.title}' not found")
         return orm_obj
@@ -23,21 +25,30 @@ class ProjectPostgres(EntityPostgres[Project]):
     def _fetch_parent_proj_orm(self, parent: Optional[Project], session: Session) -> None:
         return None
 
+    def _delete_by_id(self, entity: Project, session: Session) -> None:
+        session.execute(DELETE_TASKS_OF_PROJECT, {"project_id": entity.id})
+        super()._delete_by_id(entity, session)
+
     def load_all(self, session: Session) -> List[Project]:
+        """Load every project with its tasks in two queries, independent of project count."""
         from db.entities.task_postgres import TaskPostgres
 
-        task_loader = TaskPostgres()
+        tasks_by_project = TaskPostgres().load_grouped(session)
+        projects = self.load_metadata(session)
+        for project in projects:
+            project.tasks = tasks_by_project.get(project.id, [])
+        return projects
+
+    def load_metadata(self, session: Session, project_ids: Optional[Collection[int]] = None) -> List[Project]:
+        """Load every project, or only the given ones, without their tasks."""
+        if project_ids is None:
+            batches = self._stream(session, PROJECT_ROWS)
+        else:
+            batches = self._stream(session, PROJECT_ROWS_BY_IDS, {"project_ids": list(project_ids)})
         projects: List[Project] = []
-
-        query = session.query(ProjectORM).order_by(ProjectORM.id.asc())
-        orm_projects = query.all()
-
-        for orm_proj in orm_projects:
-            tasks = task_loader.load_all(session, parent=orm_proj)
-            detail = Detail(orm_proj.title, orm_proj.description)
-
-            project = Project(detail=detail, tasks=tasks)
-            project._id = orm_proj.id
-            projects.append(project)
-
+        for rows in batches:
+            for project_id, title, description, version in rows:
+                project = Project(detail=Detail(title, description))
+                project._id, project._version = project_id, version
+                projects.append(project)
         return projects
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Statements of the entity layer's hot paths, built once at import time.
+
+Each statement takes its values as named bind parameters, so a call only passes a
+parameter dict: there is no per-call query construction, and the statement's cache
+key is computed once, hitting the engine's compiled cache on every execution.
+"""
+from sqlalchemy import bindparam, delete, select, update
+
+from db.orm_models import ProjectORM, TaskORM
+
+_NO_SYNC = {"synchronize_session": False}
+
+PROJECT_BY_TITLE = select(ProjectORM).where(ProjectORM.title == bindparam("title"))
+
+TASK_BY_PROJECT_AND_TITLE = select(TaskORM).where(
+    TaskORM.project_id == bindparam("project_id"), TaskORM.title == bindparam("title")
+)
+
+PROJECT_ROWS = select(
+    ProjectORM.id, ProjectORM.title, ProjectORM.description, ProjectORM.version,
+).order_by(ProjectORM.id.asc())
+
+PROJECT_ROWS_BY_IDS = PROJECT_ROWS.where(ProjectORM.id.in_(bindparam("project_ids", expanding=True)))
+
+TASK_ROWS = select(
+    TaskORM.project_id, TaskORM.id, TaskORM.title, TaskORM.description,
+    TaskORM.deadline, TaskORM.status, TaskORM.closed_at, TaskORM.version,
+).order_by(TaskORM.project_id.asc(), TaskORM.id.asc())
+
+TASK_ROWS_OF_PROJECTS = TASK_ROWS.where(TaskORM.project_id.in_(bindparam("project_ids", expanding=True)))
+
+TASK_ROWS_OF_PROJECT = (
+    select(TaskORM.id, TaskORM.title, TaskORM.description, TaskORM.deadline, TaskORM.status, TaskORM.closed_at,
+           TaskORM.version)
+    .where(TaskORM.project_id == bindparam("project_id"))
+    .order_by(TaskORM.id.asc())
+)
+
+TASK_ROWS_PAGE = (
+    TASK_ROWS_OF_PROJECT.where(TaskORM.id > bindparam("after")).limit(bindparam("limit"))
+)
+
+DELETE_TASKS_OF_PROJECT = delete(TaskORM).where(
+    TaskORM.project_id == bindparam("project_id")
+).execution_options(**_NO_SYNC)
+
+# SET columns come from the keys of the parameter dict passed with the statement; each
+# update bumps the row's version and returns the new one.
+UPDATE_BY_ID = {
+    orm_class: update(orm_class).where(orm_class.id == bindparam("entity_id"))
+    .values(version=orm_class.version + 1).returning(orm_class.version).execution_options(**_NO_SYNC)
+    for orm_class in (ProjectORM, TaskORM)
+}
+
+# Optimistic variant: only matches while the row still has the version the writer read.
+UPDATE_BY_ID_AND_VERSION = {
+    orm_class: statement.where(orm_class.version == bindparam("expected_version"))
+    for orm_class, statement in UPDATE_BY_ID.items()
+}
+
+DELETE_BY_ID = {
+    orm_class: delete(orm_class).where(orm_class.id == bindparam("entity_id")).execution_options(**_NO_SYNC)
+    for orm_class in (ProjectORM, TaskORM)
+}
@@ -0,0 +1,72 @@
+from datetime import date
+from typing import Dict, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from db.orm_models import TaskORM
+
+DONE_PARTITION = "tasks_done"
+DONE_DEFAULT_PARTITION = "tasks_done_default"
+
+
+def closed_partition_name(year: int) -> str:
+    return f"{DONE_PARTITION}_{int(year)}"
+
+
+def _require_postgres(session: Session) -> None:
+    if session.get_bind().dialect.name != "postgresql":
+        raise NotImplementedError("Task partitions require PostgreSQL.")
+
+
+class TaskPartitionsPostgres:
+    """Yearly partitions of done tasks on a database partitioned by migration 0005.
+
+    ``tasks`` is list-partitioned by status, so the open-task predicate used by the
+    overdue sweep and the deadline queries prunes every done partition. Done tasks are
+    range-partitioned by ``closed_at`` into one partition per year plus a default one;
+    a year's partition can be created ahead of time and detached once it is history.
+    Partition DDL runs in the caller's transaction.
+    """
+
+    def closed_years(self, session: Session) -> List[int]:
+        """Years that have a partition of done tasks attached."""
+        _require_postgres(session)
+        names = session.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ), {"parent": DONE_PARTITION}).scalars()
+        return sorted(int(name.rsplit("_", 1)[1]) for name in names if name != DONE_DEFAULT_PARTITION)
+
+    def add_closed_year(self, session: Session, year: int) -> None:
+        """Create the partition of tasks closed in year, moving its rows out of the default partition."""
+        if year in self.closed_years(session):
+            return
+        name = closed_partition_name(year)
+        bounds: Dict[str, date] = {"start": date(year, 1, 1), "end": date(year + 1, 1, 1)}
+        # A new range may not overlap rows already held by the default partition, so the
+        # default one is detached while its rows of that year move to the new partition.
+        session.execute(text(f"ALTER TABLE {DONE_PARTITION} DETACH PARTITION {DONE_DEFAULT_PARTITION}"))
+        session.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {DONE_PARTITION} (PRIMARY KEY (id)) "
+            f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+        ))
+        columns = ", ".join(column.name for column in TaskORM.__table__.columns)
+        in_year = "closed_at >= :start AND closed_at < :end"
+        session.execute(text(
+            f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {DONE_DEFAULT_PARTITION} WHERE {in_year}"
+        ), bounds)
+        session.execute(text(f"DELETE FROM {DONE_DEFAULT_PARTITION} WHERE {in_year}"), bounds)
+        session.execute(text(f"ALTER TABLE {DONE_PARTITION} ATTACH PARTITION {DONE_DEFAULT_PARTITION} DEFAULT"))
+
+    def detach_closed_year(self, session: Session, year: int) -> List[Tuple[int, int]]:
+        """Detach the partition of tasks closed in year, keeping it as a standalone table.
+
+        Returns (project id, task id) of the tasks that left ``tasks``.
+        """
+        if year not in self.closed_years(session):
+            raise ValueError(f"No partition of tasks closed in {year}.")
+        name = closed_partition_name(year)
+        rows = [tuple(row) for row in session.execute(text(f"SELECT project_id, id FROM {name}"))]
+        session.execute(text(f"ALTER TABLE {DONE_PARTITION} DETACH PARTITION {name}"))
+        return rows
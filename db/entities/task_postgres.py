@@ -1,12 +1,41 @@
-from typing import List, Optional, Type
+from datetime import date, datetime
+from typing import Any, Collection, Dict, List, Optional, Tuple, Type
+from sqlalchemy import func, insert, or_, update
 from sqlalchemy.orm import Session
 from models.models import Task, Detail, Project
 from db.entities.entity_postgres import EntityPostgres
+from db.entities.statements import (
+    PROJECT_BY_TITLE, TASK_BY_PROJECT_AND_TITLE, TASK_ROWS, TASK_ROWS_OF_PROJECT, TASK_ROWS_OF_PROJECTS,
+    TASK_ROWS_PAGE,
+)
 from db.orm_models import TaskORM, ProjectORM
 
+# Matches the partial index ix_tasks_open_deadline and, on a status-partitioned tasks
+# table, prunes the done partitions.
+_OPEN_TASK = or_(TaskORM.status.is_(None), TaskORM.status != "done")
+
+
+def _tasks_from_rows(rows) -> List[Task]:
+    tasks: List[Task] = []
+    for task_id, title, description, deadline, status, closed_at, version in rows:
+        task = Task(detail=Detail(title, description), deadline=deadline, status=status, closed_at=closed_at)
+        task._id, task._version = task_id, version
+        tasks.append(task)
+    return tasks
+
+
+def _project_tasks_from_rows(rows) -> List[Tuple[int, Task]]:
+    project_tasks: List[Tuple[int, Task]] = []
+    for project_id, task_id, title, description, deadline, status, closed_at, version in rows:
+        task = Task(detail=Detail(title, description), deadline=deadline, status=status, closed_at=closed_at)
+        task._id, task._version = task_id, version
+        project_tasks.append((project_id, task))
+    return project_tasks
+
 
 class TaskPostgres(EntityPostgres[Task]):
     """Task entity operations for PostgreSQL."""
+    orm_class = TaskORM
 
     def _create_orm_object(self, entity: Task, parent_proj_orm: ProjectORM) -> TaskORM:
         return TaskORM(
@@ -14,39 +43,107 @@ class TaskPostgres(EntityPostgres[Task]):
             title=entity.detail.title,description=entity.detail.description,
             deadline=entity.deadline, status=entity.status, closed_at=entity.closed_at)
 
+    def add_entities(self, tasks: List[Task], container: List[Task], session: Session, project_id: int) -> None:
+        """Insert tasks with one multi-row INSERT ... RETURNING id."""
+        if not tasks:
+            return
+        rows = [
+            {"project_id": project_id, "title": task.detail.title, "description": task.detail.description,
+             "deadline": task.deadline, "status": task.status, "closed_at": task.closed_at}
+            for task in tasks
+        ]
+        # Titles are unique within a batch, so returned ids are matched by title instead of
+        # requiring RETURNING rows in parameter order (which forces row-at-a-time inserts on SQLite).
+        ids = dict(session.execute(insert(TaskORM).returning(TaskORM.title, TaskORM.id), rows).all())
+        for task in tasks:
+            task._id, task._version = ids[task.detail.title], 1
+        container.extend(tasks)
+
     def _apply_deadline_and_task_update(self, new_entity: Task, old_entity_orm: Type[TaskORM]) -> None:
         old_entity_orm.deadline = new_entity.deadline
         old_entity_orm.status = new_entity.status
         if new_entity.closed_at is not None:
             old_entity_orm.closed_at = new_entity.closed_at
 
+    def _update_values(self, new_entity: Task) -> Dict[str, Any]:
+        values = super()._update_values(new_entity)
+        values.update(deadline=new_entity.deadline, status=new_entity.status)
+        if new_entity.closed_at is not None:
+            values["closed_at"] = new_entity.closed_at
+        return values
+
     def _fetch_parent_proj_orm(self, parent: Project, session: Session) -> Type[ProjectORM]:
         if parent is None:
             raise ValueError("Parent project must be provided for task.")
-        proj_orm = session.query(ProjectORM).filter_by(title=parent.detail.title).one()
-        return proj_orm
+        return session.execute(PROJECT_BY_TITLE, {"title": parent.detail.title}).scalar_one()
 
     def _fetch_orm(self, entity: Task, session: Session, parent: Project,
                    parent_orm: ProjectORM) -> Type[TaskORM]:
         title = entity.detail.title
-        task_orm = session.query(TaskORM).filter_by(project_id=parent_orm.id, title=title).one_or_none()
+        task_orm = session.execute(
+            TASK_BY_PROJECT_AND_TITLE, {"project_id": parent_orm.id, "title": title}
+        ).scalar_one_or_none()
         if not task_orm:
             raise ValueError(f"Task '{entity.detail.title}' not found in project '{parent.detail.title}'")
         return task_orm
 
-    def load_all(self, session: Session, parent: Optional[Type[ProjectORM]] = None) -> List[Task]:
-        tasks: List[Task] = []
+    def load_all(self, session: Session, parent: Optional[Type[ProjectORM] | Project] = None) -> List[Task]:
         if parent is None:
-            return tasks
+            return []
+        tasks: List[Task] = []
+        for rows in self._stream(session, TASK_ROWS_OF_PROJECT, {"project_id": parent.id}):
+            tasks.extend(_tasks_from_rows(rows))
+        return tasks
+
+    def load_page(self, session: Session, project_id: int, after: Optional[int], limit: int) -> List[Task]:
+        """Return up to limit tasks of a project with id > after, using the (project_id, id) index."""
+        params = {"project_id": project_id, "after": 0 if after is None else after, "limit": limit}
+        return _tasks_from_rows(session.execute(TASK_ROWS_PAGE, params))
+
+    def load_grouped(self, session: Session,
+                     project_ids: Optional[Collection[int]] = None) -> Dict[int, List[Task]]:
+        """Load all tasks, or those of the given projects, in one query grouped by project id."""
+        if project_ids is None:
+            batches = self._stream(session, TASK_ROWS)
+        else:
+            batches = self._stream(session, TASK_ROWS_OF_PROJECTS, {"project_ids": list(project_ids)})
+        grouped: Dict[int, List[Task]] = {}
+        for rows in batches:
+            for project_id, task in _project_tasks_from_rows(rows):
+                grouped.setdefault(project_id, []).append(task)
+        return grouped
 
-        query = session.query(TaskORM).filter_by(project_id=parent.id)
-        task_list = query.order_by(TaskORM.id.asc()).all()
+    def load_status_counts(self, session: Session,
+                           project_ids: Optional[Collection[int]] = None) -> List[Tuple[int, Optional[str], int]]:
+        """Return (project id, status, task count) rows computed in the database."""
+        query = session.query(TaskORM.project_id, TaskORM.status, func.count(TaskORM.id))
+        if project_ids is not None:
+            query = query.filter(TaskORM.project_id.in_(project_ids))
+        return [tuple(row) for row in query.group_by(TaskORM.project_id, TaskORM.status)]
 
-        for orm_obj in task_list:
-            detail = Detail(orm_obj.title, orm_obj.description)
-            task = Task(detail=detail, deadline=orm_obj.deadline,
-                        status=orm_obj.status, closed_at=orm_obj.closed_at)
-            task._id = orm_obj.id
-            tasks.append(task)
+    def load_due(self, session: Session, start: Optional[date] = None, end: Optional[date] = None,
+                 limit: Optional[int] = None) -> List[Tuple[int, Task]]:
+        """Return (project id, task) of not-done tasks with start <= deadline < end, earliest first."""
+        query = session.query(
+            TaskORM.project_id, TaskORM.id, TaskORM.title, TaskORM.description,
+            TaskORM.deadline, TaskORM.status, TaskORM.closed_at, TaskORM.version,
+        ).filter(TaskORM.deadline.is_not(None), _OPEN_TASK)
+        if start is not None:
+            query = query.filter(TaskORM.deadline >= start)
+        if end is not None:
+            query = query.filter(TaskORM.deadline < end)
+        query = query.order_by(TaskORM.deadline.asc(), TaskORM.id.asc())
+        if limit is not None:
+            query = query.limit(limit)
+        return _project_tasks_from_rows(query.all())
 
-        return tasks
\ No newline at end of file
+    def close_overdue(self, session: Session, now: datetime) -> List[Tuple[int, int, int]]:
+        """Close every open task with deadline < now in one UPDATE; return (project id, task id, version) rows."""
+        statement = (
+            update(TaskORM)
+            .where(TaskORM.deadline < now, _OPEN_TASK)
+            .values(status="done", closed_at=now, version=TaskORM.version + 1)
+            .returning(TaskORM.project_id, TaskORM.id, TaskORM.version)
+            .execution_options(synchronize_session=False)
+        )
+        return [tuple(row) for row in session.execute(statement)]
@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+from threading import Condition, Lock
+from time import perf_counter
+from typing import Dict, Iterator, List
+
+
+class LockStats:
+    """Acquisition count and wait time of one lock, in seconds."""
+
+    def __init__(self) -> None:
+        self._guard = Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, contended: bool) -> None:
+        with self._guard:
+            self.acquisitions += 1
+            if contended:
+                self.contended += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._guard:
+            return {
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+            }
+
+
+class InstrumentedLock:
+    """Mutex that records how long callers waited for it."""
+
+    def __init__(self, stats: LockStats) -> None:
+        self._lock = Lock()
+        self._stats = stats
+
+    def __enter__(self) -> "InstrumentedLock":
+        if self._lock.acquire(blocking=False):
+            self._stats.record(0.0, contended=False)
+        else:
+            start = perf_counter()
+            self._lock.acquire()
+            self._stats.record(perf_counter() - start, contended=True)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._lock.release()
+
+
+class StripedLock:
+    """Fixed pool of mutexes; keys mapping to different stripes never contend."""
+
+    def __init__(self, stripes: int, stats: LockStats) -> None:
+        self._locks: List[InstrumentedLock] = [InstrumentedLock(stats) for _ in range(stripes)]
+
+    def for_key(self, key: int) -> InstrumentedLock:
+        return self._locks[hash(key) % len(self._locks)]
+
+
+class ReadWriteLock:
+    """Writer-preferring reader-writer lock with wait-time instrumentation.
+
+    Not reentrant: a thread must not acquire it again while holding it.
+    """
+
+    def __init__(self, read_stats: LockStats, write_stats: LockStats) -> None:
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._read_stats = read_stats
+        self._write_stats = write_stats
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        start = perf_counter()
+        with self._cond:
+            contended = self._writer or self._waiting_writers > 0
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        self._read_stats.record(perf_counter() - start, contended)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        start = perf_counter()
+        with self._cond:
+            contended = self._writer or self._readers > 0
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        self._write_stats.record(perf_counter() - start, contended)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
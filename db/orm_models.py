@@ -1,5 +1,5 @@
 from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Index, text
 
 Base = declarative_base()
 
@@ -9,6 +9,8 @@ class EntityORM(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String, unique=True, nullable=False)
     description = Column(String, nullable=False)
+    # Bumped by every update; writers update conditionally on the version they read.
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
 
 class ProjectORM(EntityORM):
@@ -16,10 +18,38 @@ class ProjectORM(EntityORM):
     tasks = relationship("TaskORM", back_populates="project", cascade="all, delete-orphan")
 
 
+# Tasks with a NULL status are "todo", so open tasks are matched the way load_due filters them.
+OPEN_TASK_PREDICATE = "status IS NULL OR status <> 'done'"
+
+
 class TaskORM(EntityORM):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_id_title", "project_id", "title"),
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        Index("ix_tasks_open_deadline", "deadline",
+              postgresql_where=text(OPEN_TASK_PREDICATE), sqlite_where=text(OPEN_TASK_PREDICATE)),
+    )
+    # Not unique: on PostgreSQL the table is partitioned by status (migration 0005), and a
+    # partitioned table cannot enforce uniqueness over columns that exclude the partition key.
+    # The partitioning lives in that migration only, so PostgreSQL schemas never come from create_all.
+    title = Column(String, nullable=False)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     deadline = Column(DateTime, nullable=True)
     status = Column(String(20), nullable=True)
     closed_at = Column(DateTime, nullable=True)
     project = relationship("ProjectORM", back_populates="tasks")
+
+
+class MirrorVersionORM(Base):
+    """Single-row counter bumped by every committed write; mirrors compare it to their own."""
+    __tablename__ = "mirror_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+
+
+class ProjectChangeORM(Base):
+    """Mirror version of the last committed write to each project (kept after the project is removed)."""
+    __tablename__ = "project_changes"
+    project_id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, index=True)
@@ -0,0 +1,12 @@
+from bisect import bisect_right
+from typing import List, Optional, Sequence, TypeVar
+
+from models.models import Entity
+
+E = TypeVar("E", bound=Entity)
+
+
+def keyset_page(entities: Sequence[E], after: Optional[int] = None, limit: Optional[int] = None) -> List[E]:
+    """Return up to limit entities with id > after from a sequence kept in id order."""
+    start = 0 if after is None else bisect_right(entities, after, key=lambda entity: entity.id)
+    return list(entities[start:None if limit is None else start + limit])
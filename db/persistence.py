@@ -0,0 +1,202 @@
+import mmap
+import os
+import struct
+import zlib
+from datetime import date, datetime, timedelta
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from db.status_counters import STATUSES
+
+ADD_PROJECT = 1
+UPDATE_PROJECT = 2
+REMOVE_PROJECT = 3
+ADD_TASK = 4
+UPDATE_TASK = 5
+REMOVE_TASK = 6
+SET_NEXT_IDS = 7
+
+Record = Tuple[int, tuple]
+
+# Field kinds per operation, in the order the fields are logged.
+_LAYOUTS = {
+    ADD_PROJECT: ("int", "str", "str"),
+    UPDATE_PROJECT: ("int", "str", "str"),
+    REMOVE_PROJECT: ("int",),
+    ADD_TASK: ("int", "int", "str", "str", "time", "status", "time"),
+    UPDATE_TASK: ("int", "int", "str", "str", "time", "status", "time"),
+    REMOVE_TASK: ("int", "int"),
+    SET_NEXT_IDS: ("int", "int"),
+}
+
+_FRAME = struct.Struct("<II")  # payload length, crc32 of payload
+_HEADER = struct.Struct("<QB")  # log sequence number, operation
+_INT = struct.Struct("<q")
+_LEN = struct.Struct("<I")
+_TAG = struct.Struct("<B")
+_SNAPSHOT_MAGIC = b"TODOSNP1"
+_SNAPSHOT_HEADER = struct.Struct("<8sQ")  # magic, last sequence number covered
+_EPOCH = datetime(1970, 1, 1)
+_NONE, _DATE, _DATETIME = 0, 1, 2
+
+
+def _encode_time(value: Optional[date]) -> bytes:
+    if value is None:
+        return _TAG.pack(_NONE)
+    if isinstance(value, datetime):
+        return _TAG.pack(_DATETIME) + _INT.pack((value - _EPOCH) // timedelta(microseconds=1))
+    return _TAG.pack(_DATE) + _INT.pack(value.toordinal())
+
+
+def _encode_field(kind: str, value) -> bytes:
+    if kind == "int":
+        return _INT.pack(value)
+    if kind == "str":
+        raw = value.encode("utf-8")
+        return _LEN.pack(len(raw)) + raw
+    if kind == "status":
+        return _TAG.pack(0 if value is None else STATUSES.index(value) + 1)
+    return _encode_time(value)
+
+
+def _decode_field(kind: str, buffer, offset: int) -> Tuple[object, int]:
+    if kind == "int":
+        return _INT.unpack_from(buffer, offset)[0], offset + _INT.size
+    if kind == "str":
+        (length,) = _LEN.unpack_from(buffer, offset)
+        start = offset + _LEN.size
+        return bytes(buffer[start:start + length]).decode("utf-8"), start + length
+    (tag,) = _TAG.unpack_from(buffer, offset)
+    offset += _TAG.size
+    if kind == "status":
+        return (None if tag == 0 else STATUSES[tag - 1]), offset
+    if tag == _NONE:
+        return None, offset
+    (raw,) = _INT.unpack_from(buffer, offset)
+    offset += _INT.size
+    if tag == _DATETIME:
+        return _EPOCH + timedelta(microseconds=raw), offset
+    return date.fromordinal(raw), offset
+
+
+def encode_record(lsn: int, op: int, fields: tuple) -> bytes:
+    payload = _HEADER.pack(lsn, op) + b"".join(
+        _encode_field(kind, value) for kind, value in zip(_LAYOUTS[op], fields)
+    )
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_records(buffer, offset: int = 0) -> Iterator[Tuple[int, int, int, tuple]]:
+    """Yield (end offset, lsn, op, fields) for each intact record; stop at the first torn one."""
+    end = len(buffer)
+    while offset + _FRAME.size <= end:
+        length, crc = _FRAME.unpack_from(buffer, offset)
+        start = offset + _FRAME.size
+        if start + length > end or zlib.crc32(buffer[start:start + length]) != crc:
+            return
+        lsn, op = _HEADER.unpack_from(buffer, start)
+        cursor = start + _HEADER.size
+        fields = []
+        for kind in _LAYOUTS[op]:
+            value, cursor = _decode_field(kind, buffer, cursor)
+            fields.append(value)
+        offset = start + length
+        yield offset, lsn, op, tuple(fields)
+
+
+def _fsync_directory(directory: str) -> None:
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class InMemoryPersistence:
+    """Snapshot file plus binary write-ahead log for InMemoryDatabase.
+
+    Every write is appended to ``wal.bin`` as a length- and CRC-framed record with a
+    sequence number. Every ``snapshot_interval`` records a full snapshot is written to
+    a temporary file and atomically renamed over ``snapshot.bin``, after which the log
+    is truncated. Recovery memory-maps the snapshot and replays only log records newer
+    than it; a torn record at the end of the log is discarded.
+    """
+
+    SNAPSHOT_FILE = "snapshot.bin"
+    WAL_FILE = "wal.bin"
+
+    def __init__(self, directory: str, snapshot_interval: int = 1000, fsync: bool = False) -> None:
+        self._directory = directory
+        self._snapshot_interval = snapshot_interval
+        self._fsync = fsync
+        self._lsn = 0
+        self._since_snapshot = 0
+        self._wal: Optional[BinaryIO] = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self._directory, self.SNAPSHOT_FILE)
+
+    @property
+    def wal_path(self) -> str:
+        return os.path.join(self._directory, self.WAL_FILE)
+
+    def recover(self) -> List[Record]:
+        """Return the snapshot records followed by the log tail, and open the log for appends."""
+        records, snapshot_lsn = self._read_snapshot()
+        self._lsn = snapshot_lsn
+        valid_length = 0
+        if os.path.exists(self.wal_path):
+            with open(self.wal_path, "rb") as wal:
+                buffer = wal.read()
+            for valid_length, lsn, op, fields in decode_records(buffer):
+                if lsn > snapshot_lsn:
+                    records.append((op, fields))
+                    self._lsn = lsn
+                    self._since_snapshot += 1
+        self._wal = open(self.wal_path, "ab")
+        self._wal.truncate(valid_length)
+        return records
+
+    def append(self, op: int, *fields) -> None:
+        self._lsn += 1
+        self._wal.write(encode_record(self._lsn, op, fields))
+        self._wal.flush()
+        if self._fsync:
+            os.fsync(self._wal.fileno())
+        self._since_snapshot += 1
+
+    def should_snapshot(self) -> bool:
+        return self._since_snapshot >= self._snapshot_interval
+
+    def write_snapshot(self, records: Iterable[Record]) -> None:
+        """Persist a full image covering every record appended so far, then reset the log."""
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "wb") as snapshot:
+            snapshot.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, self._lsn))
+            for op, fields in records:
+                snapshot.write(encode_record(0, op, fields))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        _fsync_directory(self._directory)
+        self._wal.truncate(0)
+        self._wal.seek(0)
+        self._since_snapshot = 0
+
+    def close(self) -> None:
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+
+    def _read_snapshot(self) -> Tuple[List[Record], int]:
+        if not os.path.exists(self.snapshot_path) or os.path.getsize(self.snapshot_path) == 0:
+            return [], 0
+        with open(self.snapshot_path, "rb") as snapshot:
+            with mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, lsn = _SNAPSHOT_HEADER.unpack_from(mapped, 0)
+                if magic != _SNAPSHOT_MAGIC:
+                    raise ValueError(f"'{self.snapshot_path}' is not a snapshot file.")
+                records = [(op, fields) for _, _, op, fields in decode_records(mapped, _SNAPSHOT_HEADER.size)]
+        return records, lsn
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool parameters passed to the SQLAlchemy engine.
+
+    Attributes:
+        size (int): Connections kept open in the pool.
+        max_overflow (int): Extra connections opened beyond size under load.
+        timeout (float): Seconds to wait for a free connection before failing.
+        pre_ping (bool): Whether connections are tested before each checkout.
+        recycle (int): Seconds after which connections are replaced; -1 disables recycling.
+    """
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30.0
+    pre_ping: bool = False
+    recycle: int = -1
+
+    def engine_options(self, asyncio: bool = False) -> Dict[str, Any]:
+        return {
+            "poolclass": InstrumentedAsyncQueuePool if asyncio else InstrumentedQueuePool,
+            "pool_size": self.size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout,
+            "pool_pre_ping": self.pre_ping,
+            "pool_recycle": self.recycle,
+        }
+
+
+class PoolStats:
+    """Connection checkouts, time spent waiting for them and checkout timeouts, in seconds."""
+
+    def __init__(self) -> None:
+        self._guard = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._guard:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._guard:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout of a queue pool; the stats survive pool recreation."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool recording checkout wait times and timeouts."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """Asyncio-compatible queue pool recording checkout wait times and timeouts."""
+
+
+def pool_status(pool) -> Dict[str, float]:
+    """Return current pool occupancy plus cumulative checkout wait times and timeouts."""
+    if not isinstance(pool, _InstrumentedPoolMixin):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool.stats.as_dict(),
+    }
@@ -0,0 +1,541 @@
+from bisect import insort
+from contextlib import contextmanager
+from datetime import date, datetime
+from threading import RLock
+from time import monotonic
+from typing import Callable, Collection, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from db.entities.change_log_postgres import ChangeLogPostgres
+from db.entities.project_postgres import ProjectPostgres
+from db.entities.task_partitions_postgres import TaskPartitionsPostgres
+from db.entities.task_postgres import TaskPostgres
+from db.pagination import keyset_page
+from db.snapshot import DatabaseSnapshot, SnapshotCache
+from db.status_counters import StatusCounters
+from db.unit_of_work import CHECKPOINT_KEY
+from exception.exceptions import VersionConflictError
+from models.models import Project, Task
+
+
+def _index_of(items: List, item) -> int:
+    """Position of item itself; list.index would match an equal copy."""
+    return next(index for index, candidate in enumerate(items) if candidate is item)
+
+
+def _remove_identical(items: List, item) -> bool:
+    for index, candidate in enumerate(items):
+        if candidate is item:
+            del items[index]
+            return True
+    return False
+
+
+class MirrorCheckpoint:
+    """Mirror changes of one unit of work: undone on rollback, published on commit.
+
+    Each write records how to undo its own patch to the mirror, so a rollback leaves
+    the changes other units made in the meantime in place.
+    """
+
+    def __init__(self) -> None:
+        self.undo: List[Callable[[], None]] = []
+        self.changed_project_ids: Set[int] = set()
+        self.mirror_version: Optional[int] = None
+
+
+class PostgresMirror:
+    """In-process mirror of the projects and tasks tables.
+
+    Shared by the blocking and the asyncio Postgres backends: every operation that
+    touches the database takes an open synchronous Session (the async backend passes
+    the one behind ``AsyncSession.run_sync``), writes through the entity classes and
+    then patches the mirror. Projects are mirrored as metadata only; a project's tasks
+    are fetched on first access and cached from then on. Every patch records its own
+    undo step in the unit of work, which a rollback replays newest first.
+
+    Concurrent requests share the mirror, so it is read and patched under a lock. The
+    lock is never held across a database statement: a unit waiting on a row lock must
+    not keep the other units from their mirror.
+
+    Other processes write to the same tables, so every commit bumps a change version
+    stored in the database. With a refresh interval set, the mirror compares that
+    version with its own at most once per interval and reloads only the projects
+    written since. A version conflict proves one project's copy stale, so that project
+    is reloaded on the next access even without a refresh interval.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = RLock()
+        self._projects: List[Project] = []
+        self._projects_by_id: Dict[int, Project] = {}
+        self._tasks_by_id: Dict[int, Task] = {}
+        self._task_project_ids: Dict[int, int] = {}
+        self._loaded_project_ids: Set[int] = set()
+        self._stale_project_ids: Set[int] = set()
+        self._status_counters = StatusCounters()
+        self._snapshots = SnapshotCache()
+        self._project_entity = ProjectPostgres()
+        self._task_entity = TaskPostgres()
+        self._change_log = ChangeLogPostgres()
+        self._task_partitions = TaskPartitionsPostgres()
+        self._mirror_version = 0
+        self._refresh_interval: Optional[float] = None
+        self._next_refresh = float("inf")  # no refresh before the first load
+
+    # ---------- Writes ----------
+
+    def _add_project(self, session: Session, project: Project) -> None:
+        self._project_entity.add_entity(project, [], session)
+        with self._lock:
+            self._mark_changed(session, project.id)
+            self._index_project(project)
+            self._loaded_project_ids.add(project.id)
+            for task in project.tasks:
+                self._index_task(project, task)
+                self._status_counters.add(project.id, task.status)
+            self._on_rollback(session, lambda: self._forget_project(project))
+
+    def _remove_project(self, session: Session, project: Project) -> None:
+        proj_model = self._find_project_model(project)
+        self._project_entity.remove_entity(proj_model, [proj_model], session)
+        with self._lock:
+            self._mark_changed(session, proj_model.id)
+            loaded = proj_model.id in self._loaded_project_ids
+            counts = self._status_counters.snapshot(proj_model.id)
+            self._forget_project(proj_model)
+            self._on_rollback(session, lambda: self._restore_project(proj_model, loaded, counts))
+
+    def _add_task(self, session: Session, parent_project: Project, task: Task) -> None:
+        proj_model = self._find_loaded_project_model(session, parent_project)
+        self._check_titles_free(proj_model, [task.detail.title])
+        self._task_entity.add_entity(task, [], session, parent=parent_project)
+        with self._lock:
+            self._mark_changed(session, proj_model.id)
+            self._insert_tasks(proj_model, [task])
+            self._on_rollback(session, lambda: self._drop_tasks(proj_model, [task]))
+
+    def _add_tasks(self, session: Session, parent_project: Project, tasks: List[Task]) -> None:
+        proj_model = self._find_loaded_project_model(session, parent_project)
+        self._check_titles_free(proj_model, [task.detail.title for task in tasks])
+        self._task_entity.add_entities(tasks, [], session, proj_model.id)
+        with self._lock:
+            self._mark_changed(session, proj_model.id)
+            self._insert_tasks(proj_model, tasks)
+            self._on_rollback(session, lambda: self._drop_tasks(proj_model, tasks))
+
+    def _remove_task(self, session: Session, parent_project: Project, task: Task) -> None:
+        proj_model = self._find_loaded_project_model(session, parent_project)
+        task = self._find_task_model(proj_model, task)
+        self._task_entity.remove_entity(task, [task], session, parent=parent_project)
+        with self._lock:
+            self._mark_changed(session, proj_model.id)
+            self._drop_tasks(proj_model, [task])
+            self._on_rollback(session, lambda: self._insert_tasks(proj_model, [task]))
+
+    def _update_entity(self, session: Session, old_entity, new_entity, parent_project: Optional[Project]) -> None:
+        if parent_project is None:
+            old_model = self._find_project_model(old_entity)
+            with self._reload_on_conflict(old_model.id):
+                self._project_entity.update_entity(old_model, new_entity, [old_model], session)
+            with self._lock:
+                self._mark_changed(session, new_entity.id)
+                self._replace_project(old_model, new_entity)
+                self._on_rollback(session, lambda: self._replace_project(new_entity, old_model))
+        else:
+            proj_model = self._find_loaded_project_model(session, parent_project)
+            old_model = self._find_task_model(proj_model, old_entity)
+            if new_entity.detail.title != old_model.detail.title:
+                self._check_titles_free(proj_model, [new_entity.detail.title])
+            with self._reload_on_conflict(proj_model.id):
+                self._task_entity.update_entity(old_model, new_entity, [old_model],
+                                                session, parent=parent_project)
+            with self._lock:
+                self._mark_changed(session, proj_model.id)
+                self._replace_task(proj_model, old_model, new_entity)
+                self._on_rollback(session, lambda: self._replace_task(proj_model, new_entity, old_model))
+
+    def _close_overdue(self, session: Session, now: datetime) -> List[int]:
+        closed = self._task_entity.close_overdue(session, now)
+        closed_by_project: Dict[int, Dict[int, int]] = {}
+        for project_id, task_id, version in closed:
+            closed_by_project.setdefault(project_id, {})[task_id] = version
+        counts = self._task_entity.load_status_counts(session, closed_by_project) if closed_by_project else []
+        with self._lock:
+            for project_id, task_ids in closed_by_project.items():
+                project = self._projects_by_id.get(project_id)
+                if project is None:
+                    continue
+                self._mark_changed(session, project_id)
+                if project_id not in self._loaded_project_ids:
+                    self._on_rollback(session, lambda project=project: self._unload_tasks(project))
+                    continue
+                # Replaced, not mutated, so a rollback can put the old objects back.
+                for task in [task for task in project.tasks if task.id in task_ids]:
+                    closed_task = Task(detail=task.detail, deadline=task.deadline, status="done", closed_at=now)
+                    closed_task._id, closed_task._version = task.id, task_ids[task.id]
+                    self._swap_task(project, task, closed_task)
+                    self._on_rollback(session, lambda project=project, task=task, closed_task=closed_task:
+                                      self._swap_task(project, closed_task, task))
+            self._reset_counts(session, closed_by_project, counts)
+        return [task_id for _, task_id, _ in closed]
+
+    def _detach_closed_tasks(self, session: Session, year: int) -> List[int]:
+        detached = self._task_partitions.detach_closed_year(session, year)
+        detached_by_project: Dict[int, Set[int]] = {}
+        for project_id, task_id in detached:
+            detached_by_project.setdefault(project_id, set()).add(task_id)
+        counts = self._task_entity.load_status_counts(session, detached_by_project) if detached_by_project else []
+        with self._lock:
+            for project_id, task_ids in detached_by_project.items():
+                project = self._projects_by_id.get(project_id)
+                if project is None:
+                    continue
+                self._mark_changed(session, project_id)
+                if project_id not in self._loaded_project_ids:
+                    self._on_rollback(session, lambda project=project: self._unload_tasks(project))
+                    continue
+                tasks = [task for task in project.tasks if task.id in task_ids]
+                self._drop_tasks(project, tasks, counted=False)
+                self._on_rollback(session, lambda project=project, tasks=tasks:
+                                  self._insert_tasks(project, tasks, counted=False))
+            self._reset_counts(session, detached_by_project, counts)
+        return [task_id for _, task_id in detached]
+
+    def _check_titles_free(self, project: Project, new_titles: List[str]) -> None:
+        """Task titles are unique per project; the partitioned table cannot enforce it."""
+        with self._lock:
+            titles = {task.detail.title for task in project.tasks}
+        for title in new_titles:
+            if title in titles:
+                raise ValueError(f"Task '{title}' already exists in project '{project.detail.title}'")
+            titles.add(title)
+
+    # ---------- Reads ----------
+
+    def _get_tasks(self, session: Session, project: Project) -> List[Task]:
+        return self._find_loaded_project_model(session, project).tasks
+
+    def _get_tasks_page(self, session: Session, project: Project, after: Optional[int],
+                        limit: Optional[int]) -> List[Task]:
+        """Page through the mirror when the project is loaded; otherwise read just the page."""
+        proj_model = self._find_project_model(project)
+        if limit is None or proj_model.id in self._loaded_project_ids:
+            tasks = self._find_loaded_project_model(session, project).tasks
+            with self._lock:
+                return keyset_page(tasks, after, limit)
+        return self._task_entity.load_page(session, proj_model.id, after, limit)
+
+    def _get_task_by_id(self, session: Session, project: Project, task_id: int) -> Optional[Task]:
+        self._find_loaded_project_model(session, project)
+        with self._lock:
+            if self._task_project_ids.get(task_id) != project.id:
+                return None
+            return self._tasks_by_id[task_id]
+
+    def _get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        with self._lock:
+            if project is None:
+                return self._status_counters.snapshot()
+            return self._status_counters.snapshot(self._find_project_model(project).id)
+
+    def _get_tasks_due_between(self, session: Session, start: Optional[date], end: Optional[date],
+                               limit: Optional[int]) -> List[Tuple[Project, Task]]:
+        """Filter in SQL; tasks of loaded projects come from the mirror, the rest are not cached."""
+        due = self._task_entity.load_due(session, start, end, limit)
+        with self._lock:
+            return [
+                (self._projects_by_id[project_id], self._tasks_by_id.get(task.id, task)
+                 if project_id in self._loaded_project_ids else task)
+                for project_id, task in due if project_id in self._projects_by_id
+            ]
+
+    def _snapshot(self, session: Session) -> DatabaseSnapshot:
+        """Read the tasks of unloaded projects in one query, without caching them in the mirror."""
+        fetched: Dict[int, List[Task]] = {}
+        while True:
+            with self._lock:
+                missing = [project.id for project in self._snapshots.uncached(self._projects)
+                           if project.id not in self._loaded_project_ids and project.id not in fetched]
+                if not missing:
+                    return self._snapshots.build(
+                        self._projects,
+                        lambda project: project.tasks if project.id in self._loaded_project_ids
+                        else fetched[project.id],
+                    )
+            # Read without the lock; a write in between may need another round.
+            fetched.update((project_id, []) for project_id in missing)
+            fetched.update(self._task_entity.load_grouped(session, missing))
+
+    def _is_loaded(self, project: Project) -> bool:
+        proj_model = self._find_project_model(project)
+        return proj_model.id in self._loaded_project_ids
+
+    # ---------- Loading ----------
+
+    def _load_mirror(self, session: Session) -> None:
+        version = self._change_log.ensure_counter(session)
+        projects = self._project_entity.load_metadata(session)
+        counts = self._task_entity.load_status_counts(session)
+        with self._lock:
+            self._projects.clear()
+            self._projects_by_id.clear()
+            self._tasks_by_id.clear()
+            self._task_project_ids.clear()
+            self._loaded_project_ids.clear()
+            self._status_counters.clear()
+            self._snapshots.invalidate()
+            self._mirror_version = version
+            self._next_refresh = monotonic() + (self._refresh_interval or 0.0)
+            self._projects.extend(projects)
+            for project_id, status, count in counts:
+                self._status_counters.add(project_id, status, count)
+            for project in self._projects:
+                self._projects_by_id[project.id] = project
+
+    def _load_tasks(self, session: Session, project: Project) -> None:
+        if project.id in self._loaded_project_ids:
+            return
+        tasks = self._task_entity.load_all(session, parent=project)
+        with self._lock:
+            if project.id in self._loaded_project_ids:
+                return
+            project.tasks = tasks
+            self._loaded_project_ids.add(project.id)
+            for task in project.tasks:
+                self._index_task(project, task)
+
+    def _unload_tasks(self, project: Project) -> None:
+        """Forget a project's cached tasks, e.g. ones read while uncommitted writes were visible."""
+        if project.id not in self._loaded_project_ids:
+            return
+        for task in project.tasks:
+            self._unindex_task(task)
+        project.tasks = []
+        self._loaded_project_ids.discard(project.id)
+        self._snapshots.invalidate(project.id)
+
+    # ---------- Unit of Work ----------
+
+    def _on_rollback(self, session: Session, undo: Callable[[], None]) -> None:
+        checkpoint = session.info.get(CHECKPOINT_KEY)
+        if checkpoint is not None:
+            checkpoint.undo.append(undo)
+
+    def _restore_checkpoint(self, checkpoint: MirrorCheckpoint) -> None:
+        with self._lock:
+            for undo in reversed(checkpoint.undo):
+                undo()
+            checkpoint.undo.clear()
+            if checkpoint.mirror_version is not None:
+                # Projects refreshed inside the unit may hold its rolled back writes: check again.
+                self._mirror_version = checkpoint.mirror_version
+                self._next_refresh = 0.0
+
+    def _mark_changed(self, session: Session, project_id: int) -> None:
+        checkpoint = session.info.get(CHECKPOINT_KEY)
+        if checkpoint is not None:
+            checkpoint.changed_project_ids.add(project_id)
+
+    def _publish_changes(self, session: Session, checkpoint: MirrorCheckpoint) -> None:
+        if not checkpoint.changed_project_ids:
+            return
+        version = self._change_log.publish(session, checkpoint.changed_project_ids)
+        with self._lock:
+            if checkpoint.mirror_version is None:
+                checkpoint.mirror_version = self._mirror_version
+            if version == self._mirror_version + 1:
+                # Nobody else committed in between, so the mirror is current at this version.
+                self._mirror_version = version
+
+    # ---------- Coherence ----------
+
+    @contextmanager
+    def _reload_on_conflict(self, project_id: int) -> Iterator[None]:
+        """A version conflict proves the mirror's copy stale: reload the project on next access."""
+        try:
+            yield
+        except VersionConflictError:
+            with self._lock:
+                self._stale_project_ids.add(project_id)
+            raise
+
+    def _refresh_due(self) -> bool:
+        if self._stale_project_ids:
+            return True
+        return self._refresh_interval is not None and monotonic() >= self._next_refresh
+
+    def _refresh_mirror(self, session: Session) -> None:
+        """Reload the projects found stale and those other processes wrote since this mirror's version."""
+        with self._lock:
+            stale, self._stale_project_ids = self._stale_project_ids, set()
+        version = None
+        if self._refresh_interval is not None and monotonic() >= self._next_refresh:
+            self._next_refresh = monotonic() + self._refresh_interval
+            since = self._mirror_version
+            version = self._change_log.current_version(session)
+            if version is None or version <= since:
+                version = None
+            else:
+                checkpoint = session.info.get(CHECKPOINT_KEY)
+                if checkpoint is not None and checkpoint.mirror_version is None:
+                    checkpoint.mirror_version = since
+                stale.update(self._change_log.changed_since(session, since))
+        if stale:
+            self._reload_projects(session, stale)
+        if version is not None:
+            with self._lock:
+                self._mirror_version = max(self._mirror_version, version)
+
+    def _reload_projects(self, session: Session, project_ids: Collection[int]) -> None:
+        fresh = self._project_entity.load_metadata(session, project_ids)
+        counts = self._task_entity.load_status_counts(session, project_ids)
+        with self._lock:
+            for project_id in project_ids:
+                stale = self._projects_by_id.get(project_id)
+                if stale is not None:
+                    self._forget_project(stale)
+            for project in fresh:
+                self._index_project(project)
+            for project_id, status, count in counts:
+                self._status_counters.add(project_id, status, count)
+
+    # ---------- Helper Methods ----------
+    # Called with the lock held.
+
+    def _index_project(self, project: Project) -> None:
+        insort(self._projects, project, key=lambda p: p.id)
+        self._projects_by_id[project.id] = project
+        self._snapshots.invalidate(project.id)
+
+    def _forget_project(self, project: Project) -> None:
+        if self._projects_by_id.get(project.id) is not project:
+            return
+        _remove_identical(self._projects, project)
+        self._unindex_project(project)
+        self._snapshots.invalidate(project.id)
+
+    def _restore_project(self, project: Project, loaded: bool, counts: Dict[str, int]) -> None:
+        if project.id in self._projects_by_id:
+            return
+        self._index_project(project)
+        if loaded:
+            self._loaded_project_ids.add(project.id)
+            for task in project.tasks:
+                self._index_task(project, task)
+        self._status_counters.replace(project.id, counts)
+
+    def _replace_project(self, current: Project, replacement: Project) -> None:
+        if self._projects_by_id.get(current.id) is not current:
+            return
+        self._projects[_index_of(self._projects, current)] = replacement
+        self._projects_by_id[replacement.id] = replacement
+        self._snapshots.invalidate(replacement.id)
+
+    def _insert_tasks(self, project: Project, tasks: List[Task], counted: bool = True) -> None:
+        """Put tasks into a loaded project, in id order; ones it already holds are skipped."""
+        if not self._is_current(project):
+            return
+        for task in tasks:
+            if task.id in self._tasks_by_id:
+                continue
+            insort(project.tasks, task, key=lambda t: t.id)
+            self._index_task(project, task)
+            if counted:
+                self._status_counters.add(project.id, task.status)
+        self._snapshots.invalidate(project.id)
+
+    def _drop_tasks(self, project: Project, tasks: List[Task], counted: bool = True) -> None:
+        if not self._is_current(project):
+            return
+        for task in tasks:
+            if _remove_identical(project.tasks, task):
+                self._unindex_task(task)
+                if counted:
+                    self._status_counters.remove(project.id, task.status)
+        self._snapshots.invalidate(project.id)
+
+    def _replace_task(self, project: Project, current: Task, replacement: Task) -> None:
+        if self._swap_task(project, current, replacement):
+            self._status_counters.move(project.id, current.status, replacement.status)
+
+    def _swap_task(self, project: Project, current: Task, replacement: Task) -> bool:
+        if not self._is_current(project) or self._tasks_by_id.get(current.id) is not current:
+            return False
+        project.tasks[_index_of(project.tasks, current)] = replacement
+        self._tasks_by_id[replacement.id] = replacement
+        self._snapshots.invalidate(project.id)
+        return True
+
+    def _reset_counts(self, session: Session, project_ids: Collection[int],
+                      rows: List[Tuple[int, Optional[str], int]]) -> None:
+        """Replace the projects' counts with rows read in session; a rollback takes back only the difference."""
+        fresh: Dict[int, StatusCounters] = {}
+        for project_id, status, count in rows:
+            fresh.setdefault(project_id, StatusCounters()).add(project_id, status, count)
+        differences: Dict[int, Dict[str, int]] = {}
+        for project_id in project_ids:
+            if project_id not in self._projects_by_id:
+                continue
+            before = self._status_counters.snapshot(project_id)
+            counts = fresh[project_id].snapshot(project_id) if project_id in fresh else {}
+            self._status_counters.replace(project_id, counts)
+            after = self._status_counters.snapshot(project_id)
+            differences[project_id] = {status: before[status] - after[status] for status in before}
+        self._on_rollback(session, lambda: self._shift_counts(differences))
+
+    def _shift_counts(self, differences: Dict[int, Dict[str, int]]) -> None:
+        for project_id, difference in differences.items():
+            if project_id in self._projects_by_id:
+                for status, count in difference.items():
+                    if count:
+                        self._status_counters.add(project_id, status, count)
+
+    def _is_current(self, project: Project) -> bool:
+        """A refresh may have replaced the object; patches to a replaced one are moot."""
+        return self._projects_by_id.get(project.id) is project and project.id in self._loaded_project_ids
+
+    def _unindex_project(self, project: Project) -> None:
+        self._projects_by_id.pop(project.id, None)
+        self._loaded_project_ids.discard(project.id)
+        for task in project.tasks:
+            self._unindex_task(task)
+        self._status_counters.drop_project(project.id)
+
+    def _index_task(self, project: Project, task: Task) -> None:
+        self._tasks_by_id[task.id] = task
+        self._task_project_ids[task.id] = project.id
+
+    def _unindex_task(self, task: Task) -> None:
+        self._tasks_by_id.pop(task.id, None)
+        self._task_project_ids.pop(task.id, None)
+
+    def _find_project_model(self, project: Project) -> Project:
+        """Resolve project to the mirror's current object, by id when it has one."""
+        with self._lock:
+            if project.id is not None:
+                found = self._projects_by_id.get(project.id)
+                if found is not None:
+                    return found
+            else:
+                for p in self._projects:
+                    if p.detail.title == project.detail.title:
+                        return p
+        raise ValueError(f"Project '{project.detail.title}' not found")
+
+    def _find_loaded_project_model(self, session: Session, project: Project) -> Project:
+        proj_model = self._find_project_model(project)
+        self._load_tasks(session, proj_model)
+        return proj_model
+
+    def _find_task_model(self, project: Project, task: Task) -> Task:
+        with self._lock:
+            indexed = self._tasks_by_id.get(task.id) if task.id is not None else None
+            if indexed is not None and self._task_project_ids.get(task.id) == project.id:
+                return indexed
+            for t in project.tasks:
+                if t.detail.title == task.detail.title:
+                    return t
+        raise ValueError(f"Task '{task.detail.title}' not found in project '{project.detail.title}'")
@@ -1,9 +1,11 @@
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 from urllib.parse import urlparse
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from psycopg2.extensions import connection as PsycopgConnection, cursor as PsycopgCursor
 
+from db.pool import PoolSettings, pool_status
+
 
 def _close_connection(conn: PsycopgConnection, cur: PsycopgCursor) -> None:
     try:
@@ -42,13 +44,13 @@ def _create_if_not_exist(cur: PsycopgCursor, dbname: str, exists: Optional[tuple
 class DBSession:
     """Database session manager with optional Alembic support."""
 
-    def __init__(self, url: str, use_alembic: bool = False) -> None:
+    def __init__(self, url: str, use_alembic: bool = False, pool: Optional[PoolSettings] = None) -> None:
         self.url = url
         self._use_alembic = use_alembic
         if not self._use_alembic:
             self._ensure_database_exists()
         try:
-            self.engine = create_engine(url, echo=False, future=True)
+            self.engine = create_engine(url, echo=False, future=True, **(pool or PoolSettings()).engine_options())
             self.SessionFactory = sessionmaker(bind=self.engine, expire_on_commit=False, class_=Session)
         except Exception as exc:
             raise RuntimeError("Failed to initialize SQLAlchemy engine.") from exc
@@ -59,6 +61,10 @@ class DBSession:
     def get_engine(self) -> Engine:
         return self.engine
 
+    def pool_status(self) -> Dict[str, float]:
+        """Return current pool occupancy plus cumulative checkout wait times and timeouts."""
+        return pool_status(self.engine.pool)
+
     def _ensure_database_exists(self) -> None:
         admin_url, dbname = self._init_admin_url()
         conn: Optional[PsycopgConnection] = None
@@ -81,3 +87,37 @@ class DBSession:
             return admin_url, dbname
         except Exception as exc:
             raise RuntimeError("Failed to parse database URL.") from exc
+
+
+class SQLiteSession(DBSession):
+    """Session manager for a single-file SQLite database in WAL mode."""
+
+    PRAGMAS = (
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("foreign_keys", "ON"),
+        ("busy_timeout", "5000"),
+        ("temp_store", "MEMORY"),
+        ("cache_size", "-65536"),
+        ("mmap_size", "268435456"),
+    )
+
+    def __init__(self, path: str, pool: Optional[PoolSettings] = None) -> None:
+        self.url = f"sqlite:///{path}"
+        self._use_alembic = False
+        try:
+            self.engine = create_engine(self.url, echo=False, future=True,
+                                        connect_args={"check_same_thread": False},
+                                        **(pool or PoolSettings()).engine_options())
+            event.listen(self.engine, "connect", self._apply_pragmas)
+            self.SessionFactory = sessionmaker(bind=self.engine, expire_on_commit=False, class_=Session)
+        except Exception as exc:
+            raise RuntimeError("Failed to initialize SQLite engine.") from exc
+
+    def _apply_pragmas(self, dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.PRAGMAS:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
@@ -0,0 +1,83 @@
+from datetime import date
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from models.models import Project, Task
+
+
+class TaskSnapshot(NamedTuple):
+    """Immutable copy of a task's values."""
+    id: Optional[int]
+    title: str
+    description: str
+    deadline: Optional[date]
+    status: Optional[str]
+    closed_at: Optional[date]
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskSnapshot":
+        return cls(task.id, task.detail.title, task.detail.description, task.deadline, task.status, task.closed_at)
+
+
+class ProjectSnapshot(NamedTuple):
+    """Immutable copy of a project and its tasks."""
+    id: Optional[int]
+    title: str
+    description: str
+    tasks: Tuple[TaskSnapshot, ...]
+
+
+class DatabaseSnapshot:
+    """Point-in-time, read-only view of all projects and tasks."""
+
+    def __init__(self, version: int, projects: Tuple[ProjectSnapshot, ...]) -> None:
+        self.version = version
+        self.projects = projects
+        self._by_id: Optional[Dict[int, ProjectSnapshot]] = None
+
+    def get_project(self, project_id: int) -> Optional[ProjectSnapshot]:
+        if self._by_id is None:
+            self._by_id = {project.id: project for project in self.projects}
+        return self._by_id.get(project_id)
+
+
+class SnapshotCache:
+    """Builds database snapshots with copy-on-write sharing between versions.
+
+    Each project's view is copied once and reused by every later snapshot until a
+    write to that project invalidates it, so taking a snapshot after a write only
+    copies the projects that changed plus the top-level tuple.
+    """
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._projects: Dict[int, ProjectSnapshot] = {}
+        self._current: Optional[DatabaseSnapshot] = None
+
+    def invalidate(self, project_id: Optional[int] = None) -> None:
+        """Drop the cached view of one project, or of all projects when project_id is None."""
+        if project_id is None:
+            self._projects.clear()
+        else:
+            self._projects.pop(project_id, None)
+        self._current = None
+        self._version += 1
+
+    def uncached(self, projects: Iterable[Project]) -> List[Project]:
+        """Projects whose view the next build has to create."""
+        if self._current is not None:
+            return []
+        return [project for project in projects if project.id not in self._projects]
+
+    def build(self, projects: Iterable[Project],
+              tasks_of: Callable[[Project], List[Task]]) -> DatabaseSnapshot:
+        if self._current is None:
+            views = []
+            for project in projects:
+                view = self._projects.get(project.id)
+                if view is None:
+                    tasks = tuple(TaskSnapshot.from_task(task) for task in tasks_of(project))
+                    view = ProjectSnapshot(project.id, project.detail.title, project.detail.description, tasks)
+                    self._projects[project.id] = view
+                views.append(view)
+            self._current = DatabaseSnapshot(self._version, tuple(views))
+        return self._current
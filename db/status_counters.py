@@ -0,0 +1,53 @@
+from collections import Counter
+from typing import Dict, Optional, Set
+
+STATUSES = ("todo", "doing", "done")
+
+
+def _status_key(status: Optional[str]) -> str:
+    return status or "todo"
+
+
+class StatusCounters:
+    """Per-project and global task counts by status, maintained incrementally."""
+
+    def __init__(self) -> None:
+        self._per_project: Dict[int, Counter] = {}
+        self._totals: Counter = Counter()
+
+    def add(self, project_id: int, status: Optional[str], count: int = 1) -> None:
+        key = _status_key(status)
+        self._per_project.setdefault(project_id, Counter())[key] += count
+        self._totals[key] += count
+
+    def remove(self, project_id: int, status: Optional[str]) -> None:
+        key = _status_key(status)
+        self._per_project[project_id][key] -= 1
+        self._totals[key] -= 1
+
+    def move(self, project_id: int, old_status: Optional[str], new_status: Optional[str]) -> None:
+        if _status_key(old_status) != _status_key(new_status):
+            self.remove(project_id, old_status)
+            self.add(project_id, new_status)
+
+    def drop_project(self, project_id: int) -> None:
+        self._totals.subtract(self._per_project.pop(project_id, Counter()))
+
+    def replace(self, project_id: int, counts: Dict[str, int]) -> None:
+        """Overwrite one project's counts, e.g. with an earlier snapshot()."""
+        self.drop_project(project_id)
+        for status, count in counts.items():
+            if count:
+                self.add(project_id, status, count)
+
+    def project_ids(self) -> Set[int]:
+        return set(self._per_project)
+
+    def clear(self) -> None:
+        self._per_project.clear()
+        self._totals.clear()
+
+    def snapshot(self, project_id: Optional[int] = None) -> Dict[str, int]:
+        """Return counts for one project, or across all projects when project_id is None."""
+        counts = self._totals if project_id is None else self._per_project.get(project_id, Counter())
+        return {status: counts[status] for status in STATUSES}
@@ -0,0 +1,109 @@
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+CHECKPOINT_KEY = "mirror_checkpoint"
+
+
+class UnitOfWork:
+    """Unit of work of a backend whose writes are applied immediately; every step is a no-op."""
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class SessionUnitOfWork(UnitOfWork):
+    """One session and transaction shared by every database call made while it is current.
+
+    Mirror changes are checkpointed through ``session.info`` so a rollback also restores
+    the in-process mirror; a failed commit rolls back both. ``publish`` runs in the
+    transaction right before the commit.
+    """
+
+    def __init__(self, session: Session, current: ContextVar, checkpoint,
+                 restore: Callable, publish: Callable) -> None:
+        self.session = session
+        self._checkpoint = checkpoint
+        self._restore = restore
+        self._publish = publish
+        self._current = current
+        session.info[CHECKPOINT_KEY] = checkpoint
+        self._token = current.set(self)
+
+    def commit(self) -> None:
+        try:
+            self._publish(self.session, self._checkpoint)
+            self.session.commit()
+        except BaseException:
+            self.rollback()
+            raise
+
+    def rollback(self) -> None:
+        self.session.rollback()
+        self._restore(self._checkpoint)
+
+    def close(self) -> None:
+        self.session.close()
+        self._current.reset(self._token)
+
+
+class AsyncUnitOfWork:
+    """Awaitable unit of work; the base class joins an outer unit or wraps a no-op one."""
+
+    def __init__(self, inner: Optional[UnitOfWork] = None, offload: Optional[Callable] = None) -> None:
+        self._inner = inner or UnitOfWork()
+        self._offload = offload
+
+    async def commit(self) -> None:
+        await self._run(self._inner.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._inner.rollback)
+
+    async def close(self) -> None:
+        self._inner.close()
+
+    async def _run(self, method) -> None:
+        if self._offload is not None:
+            await self._offload(method)
+        else:
+            method()
+
+
+class AsyncSessionUnitOfWork(AsyncUnitOfWork):
+    """One AsyncSession and transaction shared by every awaited call made while it is current."""
+
+    def __init__(self, session: AsyncSession, current: ContextVar, checkpoint,
+                 restore: Callable, publish: Callable) -> None:
+        super().__init__()
+        self.session = session
+        self._checkpoint = checkpoint
+        self._restore = restore
+        self._publish = publish
+        self._current = current
+        session.info[CHECKPOINT_KEY] = checkpoint
+        self._token = current.set(self)
+
+    async def commit(self) -> None:
+        try:
+            await self.session.run_sync(self._publish, self._checkpoint)
+            await self.session.commit()
+        except BaseException:
+            await self.rollback()
+            raise
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        self._restore(self._checkpoint)
+
+    async def close(self) -> None:
+        await self.session.close()
+        self._current.reset(self._token)
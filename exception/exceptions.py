@@ -56,3 +56,11 @@ class InvalidDateError(ValidationError):
     def __init__(self) -> None:
         message = "Deadline format must be YYYY-MM-DD and not before today."
         super().__init__(message)
+
+
+class VersionConflictError(ValueError):
+    """Entity was changed by another writer since it was read."""
+
+    def __init__(self, entity_name: str) -> None:
+        message = f"{entity_name} was modified concurrently; reload it and retry."
+        super().__init__(message)
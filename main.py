@@ -1,23 +1,32 @@
 from __future__ import annotations
+import asyncio
+import atexit
 import os
 import warnings
-from typing import Any
+from typing import Any, Optional
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from uvicorn import run
 
 from api_cli.api.controllers.task_controller import TaskController
+from api_cli.api.middleware import UnitOfWorkMiddleware
 from api_cli.cli.menus.main_menu import MainMenu
 from api_cli.gateway.project_gateway import ProjectGateway
 from core.config import AppConfig
+from db.async_db_interface import AsyncDatabaseInterface, SyncDatabaseAdapter
 from db.db_inmemory import InMemoryDatabase
 from db.db_postgres import PostgresDatabase
+from db.persistence import InMemoryPersistence
+from db.pool import PoolSettings
+from repository.async_task_repository import AsyncTaskRepository
 from repository.project_repository import ProjectRepository
 from repository.task_repository import TaskRepository
+from service.async_project_manager import AsyncProjectManager
 from service.project_manager import ProjectManager
-from service.scheduler.task_closer import TaskCloser
+from service.scheduler.task_closer import AsyncTaskCloser, TaskCloser
 from service.scheduler.task_scheduler import TaskScheduler
 from api_cli.api.controllers.project_controller import ProjectController
+from api_cli.api.controllers.metrics_controller import MetricsController
 
 
 def load_config() -> AppConfig:
@@ -35,19 +44,89 @@ def load_config() -> AppConfig:
         db_password=os.getenv("DB_PASSWORD", ""),
         db_host=os.getenv("DB_HOST", ""),
         db_port=int(os.getenv("DB_PORT", "5432")),
+        memory_data_dir=os.getenv("MEMORY_DATA_DIR", ""),
+        memory_snapshot_interval=int(os.getenv("MEMORY_SNAPSHOT_INTERVAL", "1000")),
+        memory_fsync=os.getenv("MEMORY_FSYNC", "false").lower() == "true",
+        sqlite_path=os.getenv("SQLITE_PATH", "todo.db"),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        db_pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        db_pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+        db_pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "-1")),
+        db_async=os.getenv("DB_ASYNC", "false").lower() == "true",
+        db_mirror_refresh_interval=float(os.getenv("DB_MIRROR_REFRESH_INTERVAL", "1")),
+    )
+
+
+def create_pool_settings(config: AppConfig) -> PoolSettings:
+    return PoolSettings(
+        size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        timeout=config.db_pool_timeout,
+        pre_ping=config.db_pool_pre_ping,
+        recycle=config.db_pool_recycle,
+    )
+
+
+def _refresh_interval(config: AppConfig) -> Optional[float]:
+    return None if config.db_mirror_refresh_interval < 0 else config.db_mirror_refresh_interval
+
+
+def _postgres_url(config: AppConfig, driver: str = "postgresql") -> str:
+    return (
+        f"{driver}://{config.db_user}:{config.db_password}"
+        f"@{config.db_host}:{config.db_port}/{config.db_name}"
     )
 
 
 def create_database(config: AppConfig, use_alembic: bool = False) -> Any:
     if config.db_type.lower() == "postgres":
-        url = (
-            f"postgresql://{config.db_user}:{config.db_password}"
-            f"@{config.db_host}:{config.db_port}/{config.db_name}"
+        return PostgresDatabase(_postgres_url(config), use_alembic=use_alembic, pool=create_pool_settings(config),
+                                refresh_interval=_refresh_interval(config))
+    if config.db_type.lower() == "sqlite":
+        from db.db_sqlite import SQLiteDatabase
+        return SQLiteDatabase(config.sqlite_path, pool=create_pool_settings(config),
+                              refresh_interval=_refresh_interval(config))
+    if config.db_type.lower() == "columnar":
+        from db.db_columnar import ColumnarDatabase
+        return ColumnarDatabase()
+    if config.memory_data_dir:
+        persistence = InMemoryPersistence(
+            config.memory_data_dir,
+            snapshot_interval=config.memory_snapshot_interval,
+            fsync=config.memory_fsync,
         )
-        return PostgresDatabase(url, use_alembic=use_alembic)
+        db = InMemoryDatabase(persistence=persistence)
+        atexit.register(db.close)
+        return db
     return InMemoryDatabase()
 
 
+def create_async_database(config: AppConfig) -> AsyncDatabaseInterface:
+    """Return the database used by the async API handlers, with the scheduler driving it.
+
+    With DB_ASYNC on postgres this is the only database of the process: the scheduler
+    closes tasks through it, so there is one mirror and one pool.
+    """
+    db_type = config.db_type.lower()
+    if db_type == "postgres" and config.db_async:
+        from db.db_async_postgres import AsyncPostgresDatabase
+        async_db = AsyncPostgresDatabase(_postgres_url(config, "postgresql+asyncpg"), pool=create_pool_settings(config),
+                                         refresh_interval=_refresh_interval(config))
+
+        async def start() -> None:
+            await async_db.load()
+            create_async_scheduler(async_db)
+
+        app.add_event_handler("startup", start)
+        app.add_event_handler("shutdown", async_db.close)
+        return async_db
+    db = create_database(config, use_alembic=True)
+    create_scheduler(db)
+    offload = db_type in ("postgres", "sqlite") or bool(config.memory_data_dir)
+    return SyncDatabaseAdapter(db, offload=offload)
+
+
 def create_scheduler(db: Any) -> None:
     project_repo = ProjectRepository(db)
     task_repo = TaskRepository(db)
@@ -56,16 +135,22 @@ def create_scheduler(db: Any) -> None:
     scheduler.start_background()
 
 
+def create_async_scheduler(async_db: AsyncDatabaseInterface) -> None:
+    """Start the scheduler on async_db; call from the event loop that serves it."""
+    closer = AsyncTaskCloser(task_repo=AsyncTaskRepository(async_db), loop=asyncio.get_running_loop())
+    scheduler = TaskScheduler(jobs=[closer])
+    scheduler.start_background()
+
+
 app = FastAPI(title="ToDoList API", version="1.0")
 
 
 def main(use_cli: bool = False) -> None:
-    config, db, manager = _initialize()
-
     if use_cli:
+        config, db, manager = _initialize()
         _run_cli(config, db, manager)
     else:
-        _run_api(manager)
+        _run_api(load_config())
 
 
 def _initialize() -> (AppConfig, PostgresDatabase | InMemoryDatabase, ProjectManager):
@@ -83,12 +168,17 @@ def _run_cli(config: AppConfig, db: PostgresDatabase | InMemoryDatabase, manager
     menu.run()
 
 
-def _run_api(manager: ProjectManager) -> None:
+def _run_api(config: AppConfig) -> None:
     warnings.warn("CLI mode is disabled. Use API only.", DeprecationWarning)
+    async_db = create_async_database(config)
+    manager = AsyncProjectManager(config, async_db)
     project_controller = ProjectController(manager)
     task_controller = TaskController(manager)
+    metrics_controller = MetricsController(async_db)
+    app.add_middleware(UnitOfWorkMiddleware, db=async_db)
     app.include_router(project_controller.router)
     app.include_router(task_controller.router)
+    app.include_router(metrics_controller.router)
     run(app, host="0.0.0.0", port=8000)
 
 
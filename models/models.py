@@ -1,40 +1,58 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import date
 from typing import List, Callable, Optional, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class Detail:
     """Entity metadata container."""
     title: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Abstract base for all entities."""
     detail: Detail
     _id: int = field(default=None, init=False)
+    _version: Optional[int] = field(default=None, init=False)
 
     @property
     def id(self):
         return self._id
 
+    @property
+    def version(self) -> Optional[int]:
+        """Number of stored revisions; None until the entity is persisted."""
+        return self._version
 
-@dataclass
+    def based_on(self, version: Optional[int]) -> None:
+        """Mark an unsaved replacement as a change to that stored version.
+
+        Updating with it then fails with VersionConflictError once the row has moved on.
+        """
+        self._version = version
+
+
+@dataclass(slots=True)
 class Task(Entity):
-    """Project task item."""
+    """Project task item; status strings are interned."""
     deadline: date
     status: Literal["todo", "doing", "done"] = "todo"
     closed_at: Optional[date] = None
 
+    def __post_init__(self) -> None:
+        if self.status is not None:
+            self.status = sys.intern(self.status)
+
     def __str__(self) -> str:
         closed_at = f" -> (closed at): {self.closed_at}" if self.closed_at is not None else ""
         other = f"{self.detail.title} ({self.detail.description}) - {self.status}, {self.deadline}"
         return other + closed_at
 
 
-@dataclass
+@dataclass(slots=True)
 class Project(Entity):
     """Project containing tasks."""
     tasks: List[Task] = field(default_factory=list)
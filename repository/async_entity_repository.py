@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Generic, TypeVar, List, Optional
+from db.async_db_interface import AsyncDatabaseInterface
+from db.unit_of_work import AsyncUnitOfWork
+from models.models import Project
+
+T = TypeVar("T")
+
+
+class AsyncEntityRepository(ABC, Generic[T]):
+    """Abstract async repository for generic entity operations."""
+
+    def __init__(self, db: AsyncDatabaseInterface[T]) -> None:
+        self._db: AsyncDatabaseInterface[T] = db
+
+    def unit_of_work(self) -> AsyncContextManager[AsyncUnitOfWork]:
+        """Group the enclosed repository calls into one database transaction."""
+        return self._db.unit_of_work()
+
+    @abstractmethod
+    async def get_db_list(self, project: object | None = None) -> List[T]:
+        """Return list of entities; project is required for nested entities like Task."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def append_to_db(self, entity: T, project: object | None = None) -> None:
+        """Add entity to database; project is required for nested entities like Task."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_from_db(self, entity: T, project: object | None = None) -> None:
+        """Remove entity from database; project is required for nested entities like Task."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_entity(self, parent_project: Project | None, old_entity: T, new_entity: T) -> None:
+        """Update an entity in the database; parent_project required for nested entities."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(self, entity_id: int, project: object | None = None) -> Optional[T]:
+        """Return entity with the given id or None; project is required for nested entities like Task."""
+        raise NotImplementedError
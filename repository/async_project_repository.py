@@ -0,0 +1,35 @@
+from typing import Dict, List, Optional
+from models.models import Project
+from repository.async_entity_repository import AsyncEntityRepository
+
+class AsyncProjectRepository(AsyncEntityRepository[Project]):
+    """Async repository for Project entities."""
+
+    async def get_db_list(self, parent_entity: Optional[Project] = None) -> List[Project]:
+        """Return all projects in database."""
+        return await self._db.get_projects()
+
+    async def append_to_db(self, entity: Project, parent_entity: Optional[Project] = None) -> None:
+        """Add a project to database."""
+        await self._db.add_project(entity)
+
+    async def remove_from_db(self, entity: Project, parent_entity: Optional[Project] = None) -> None:
+        """Remove a project from database."""
+        await self._db.remove_project(entity)
+
+    async def update_entity(self, parent_project: Optional[Project], old_entity: Project,
+                            new_entity: Project) -> None:
+        """Update a project in the database."""
+        await self._db.update_entity(old_entity, new_entity, None)
+
+    async def get_page(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Project]:
+        """Return up to limit projects with id > after, in id order."""
+        return await self._db.get_projects_page(after, limit)
+
+    async def get_by_id(self, entity_id: int, parent_entity: Optional[Project] = None) -> Optional[Project]:
+        """Return the project with the given id or None."""
+        return await self._db.get_project_by_id(entity_id)
+
+    async def get_status_counts(self) -> Dict[str, int]:
+        """Return task counts by status across all projects."""
+        return await self._db.get_status_counts()
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from models.models import Project, Task
+from repository.async_entity_repository import AsyncEntityRepository
+
+class AsyncTaskRepository(AsyncEntityRepository[Task]):
+    """Async repository for Task entities inside projects."""
+
+    async def get_db_list(self, project: Optional[Project] = None) -> List[Task]:
+        """Return all tasks of a project."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        return await self._db.get_tasks(project)
+
+    async def append_to_db(self, entity: Task, project: Optional[Project] = None) -> None:
+        """Add a task to a specific project."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        await self._db.add_task(project, entity)
+
+    async def add_tasks(self, project: Optional[Project], entities: List[Task]) -> None:
+        """Add a batch of tasks to a specific project in one database operation."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        await self._db.add_tasks(project, entities)
+
+    async def remove_from_db(self, entity: Task, project: Optional[Project] = None) -> None:
+        """Remove a task from a specific project."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        await self._db.remove_task(project, entity)
+
+    async def update_entity(self, parent_project: Optional[Project], old_entity: Task, new_entity: Task) -> None:
+        """Update a task in a project."""
+        if parent_project is None:
+            raise ValueError("Parent project must be provided for tasks.")
+        await self._db.update_entity(old_entity, new_entity, parent_project)
+
+    async def get_page(self, project: Optional[Project], after: Optional[int] = None,
+                       limit: Optional[int] = None) -> List[Task]:
+        """Return up to limit tasks of a project with id > after, in id order."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        return await self._db.get_tasks_page(project, after, limit)
+
+    async def get_by_id(self, entity_id: int, project: Optional[Project] = None) -> Optional[Task]:
+        """Return the task with the given id inside a project or None."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        return await self._db.get_task_by_id(project, entity_id)
+
+    async def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        """Return task counts by status of a project."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        return await self._db.get_status_counts(project)
+
+    async def close_overdue(self, now: datetime) -> List[int]:
+        """Mark every not-done task whose deadline has passed as done; return their ids."""
+        return await self._db.close_overdue(now)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List
+from typing import ContextManager, Generic, TypeVar, List, Optional
 from db.db_interface import DatabaseInterface
+from db.unit_of_work import UnitOfWork
 from models.models import Project
 
 T = TypeVar("T")
@@ -12,6 +13,10 @@ class EntityRepository(ABC, Generic[T]):
     def __init__(self, db: DatabaseInterface[T]) -> None:
         self._db: DatabaseInterface[T] = db
 
+    def unit_of_work(self) -> ContextManager[UnitOfWork]:
+        """Group the enclosed repository calls into one database transaction."""
+        return self._db.unit_of_work()
+
     @abstractmethod
     def get_db_list(self, project: object | None = None) -> List[T]:
         """Return list of entities; project is required for nested entities like Task."""
@@ -31,3 +36,8 @@ class EntityRepository(ABC, Generic[T]):
     def update_entity(self, parent_project: Project | None, old_entity: T, new_entity: T) -> None:
         """Update an entity in the database; parent_project required for nested entities."""
         raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(self, entity_id: int, project: object | None = None) -> Optional[T]:
+        """Return entity with the given id or None; project is required for nested entities like Task."""
+        raise NotImplementedError
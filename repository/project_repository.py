@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from models.models import Project, Detail
 from repository.entity_repository import EntityRepository
 
@@ -20,3 +20,11 @@ class ProjectRepository(EntityRepository[Project]):
     def update_entity(self, parent_project: Optional[Project], old_entity: Project, new_entity: Project) -> None:
         """Update a project in the database."""
         self._db.update_entity(old_entity, new_entity, None)
+
+    def get_by_id(self, entity_id: int, parent_entity: Optional[Project] = None) -> Optional[Project]:
+        """Return the project with the given id or None."""
+        return self._db.get_project_by_id(entity_id)
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Return task counts by status across all projects."""
+        return self._db.get_status_counts()
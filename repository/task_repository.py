@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from models.models import Project, Task
 from repository.entity_repository import EntityRepository
 
@@ -17,6 +18,12 @@ class TaskRepository(EntityRepository[Task]):
             raise ValueError("Project must be provided for tasks.")
         self._db.add_task(project, entity)
 
+    def add_tasks(self, project: Optional[Project], entities: List[Task]) -> None:
+        """Add a batch of tasks to a specific project in one database operation."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        self._db.add_tasks(project, entities)
+
     def remove_from_db(self, entity: Task, project: Optional[Project] = None) -> None:
         """Remove a task from a specific project."""
         if project is None:
@@ -28,3 +35,31 @@ class TaskRepository(EntityRepository[Task]):
         if parent_project is None:
             raise ValueError("Parent project must be provided for tasks.")
         self._db.update_entity(old_entity, new_entity, parent_project)
+
+    def get_by_id(self, entity_id: int, project: Optional[Project] = None) -> Optional[Task]:
+        """Return the task with the given id inside a project or None."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        return self._db.get_task_by_id(project, entity_id)
+
+    def get_status_counts(self, project: Optional[Project] = None) -> Dict[str, int]:
+        """Return task counts by status of a project."""
+        if project is None:
+            raise ValueError("Project must be provided for tasks.")
+        return self._db.get_status_counts(project)
+
+    def get_overdue(self, now: datetime) -> List[Tuple[Project, Task]]:
+        """Return (project, task) pairs of not-done tasks whose deadline has passed."""
+        return self._db.get_tasks_due_between(end=now)
+
+    def close_overdue(self, now: datetime) -> List[int]:
+        """Mark every not-done task whose deadline has passed as done; return their ids."""
+        return self._db.close_overdue(now)
+
+    def get_due_between(self, start: datetime, end: datetime) -> List[Tuple[Project, Task]]:
+        """Return (project, task) pairs of not-done tasks due in [start, end)."""
+        return self._db.get_tasks_due_between(start, end)
+
+    def get_next_due(self, count: int, now: datetime) -> List[Tuple[Project, Task]]:
+        """Return the next count not-done tasks due from now on."""
+        return self._db.get_tasks_due_between(start=now, limit=count)
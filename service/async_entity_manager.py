@@ -0,0 +1,95 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import TypeVar, Generic, List, Optional
+from core.config import AppConfig
+from models.models import Detail, Project
+from repository.async_entity_repository import AsyncEntityRepository
+from core.validator import NonEmptyTextValidator, MaxCountValidator
+
+T = TypeVar("T")
+
+
+class AsyncEntityManager(ABC, Generic[T]):
+    """Async counterpart of EntityManager for the async request path."""
+
+    def __init__(self, config: AppConfig, repository: AsyncEntityRepository[T]) -> None:
+        self._config: AppConfig = config
+        self._repository: AsyncEntityRepository[T] = repository
+
+    async def add_entity(self, detail: Detail, deadline: Optional[date] = None, status: Optional[str] = None) -> T:
+        """Validate and add entity; return the stored entity."""
+        async with self._repository.unit_of_work():
+            await self.validate_creation()
+            entity = self.create_entity_object(detail, deadline, status)
+            await self._append_to_repository(entity)
+        return entity
+
+    @abstractmethod
+    async def remove_entity_object(self, entity: T) -> None:
+        """Remove entity and handle cascade deletes if needed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_repo_list(self) -> List[T]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_entity_by_id(self, entity_id: int) -> Optional[T]:
+        raise NotImplementedError
+
+    async def update_entity_object(self, old_entity: T, new_entity: T, parent_project: Optional[Project] = None) -> None:
+        """Update an entity in repository."""
+        async with self._repository.unit_of_work():
+            await self._repository.update_entity(parent_project, old_entity, new_entity)
+
+    async def _append_to_repository(self, entity: T) -> None:
+        """Append entity to repository."""
+        await self._repository.append_to_db(entity)  # type: ignore
+
+    @abstractmethod
+    def entity_name(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_entity_object(
+        self, detail: Detail, deadline: Optional[date] = None, status: Optional[str] = None
+    ) -> T:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get_max_desc_length(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get_max_count(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get_max_title_length(self) -> int:
+        raise NotImplementedError
+
+    # ---------- Validators ----------
+
+    async def validate_creation(self) -> None:
+        """Validate max count."""
+        MaxCountValidator(
+            max_count=self._get_max_count(),
+            current_count=len(await self.get_repo_list()),
+            field_name=self.entity_name()
+        ).validate()
+
+    async def validate_title(self, title: str, skip_current: Optional[str] = None) -> None:
+        """Validate title for non-empty and max length."""
+        NonEmptyTextValidator(
+            max_length=self._get_max_title_length(),
+            field_name=f"{self.entity_name()} title",
+            existing_values=[e.detail.title for e in await self.get_repo_list()],
+            skip_current=skip_current
+        ).validate(title)
+
+    def validate_description(self, description: str) -> None:
+        """Validate description for non-empty and max length."""
+        NonEmptyTextValidator(
+            max_length=self._get_max_desc_length(),
+            field_name=f"{self.entity_name()} description"
+        ).validate(description)
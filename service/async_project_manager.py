@@ -0,0 +1,52 @@
+from typing import Dict, List, Optional
+from core.config import AppConfig
+from db.async_db_interface import AsyncDatabaseInterface
+from models.models import Detail, Project
+from repository.async_project_repository import AsyncProjectRepository
+from service.async_entity_manager import AsyncEntityManager
+from service.async_task_manager import AsyncTaskManager
+
+class AsyncProjectManager(AsyncEntityManager[Project]):
+    """Async manager for project-level operations."""
+
+    def __init__(self, config: AppConfig, db: AsyncDatabaseInterface) -> None:
+        super().__init__(config, AsyncProjectRepository(db))
+        self._db = db
+
+    def get_task_manager(self, project: Project) -> AsyncTaskManager:
+        """Return a task manager bound to project; each caller gets its own instance."""
+        return AsyncTaskManager(self._config, self._db, project)
+
+    def entity_name(self) -> str:
+        return "Project"
+
+    def create_entity_object(self, detail: Detail, deadline=None, status=None) -> Project:
+        return Project(detail=detail)
+
+    def _get_max_desc_length(self) -> int:
+        return self._config.max_project_description_length
+
+    def _get_max_title_length(self) -> int:
+        return self._config.max_project_name_length
+
+    def _get_max_count(self) -> int:
+        return self._config.max_projects
+
+    async def get_repo_list(self) -> List[Project]:
+        return await self._repository.get_db_list()
+
+    async def get_page(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Project]:
+        """Return the next projects after the given id."""
+        return await self._repository.get_page(after, limit)
+
+    async def get_entity_by_id(self, entity_id: int) -> Optional[Project]:
+        return await self._repository.get_by_id(entity_id)
+
+    async def get_status_counts(self) -> Dict[str, int]:
+        """Return task counts by status across all projects."""
+        return await self._repository.get_status_counts()
+
+    async def remove_entity_object(self, entity: Project) -> None:
+        """Remove entity; the database drops its tasks along with it."""
+        async with self._repository.unit_of_work():
+            await self._repository.remove_from_db(entity)
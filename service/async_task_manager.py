@@ -0,0 +1,65 @@
+from datetime import date
+from typing import Dict, Optional, List
+from core.config import AppConfig
+from db.async_db_interface import AsyncDatabaseInterface
+from models.models import Detail, Task, Project
+from repository.async_task_repository import AsyncTaskRepository
+from service.async_entity_manager import AsyncEntityManager
+from core.validator import StatusValidator, DeadlineValidator
+
+class AsyncTaskManager(AsyncEntityManager[Task]):
+    """Async manager for the tasks of one project."""
+
+    def __init__(self, config: AppConfig, db: AsyncDatabaseInterface, parent_project: Project) -> None:
+        super().__init__(config, AsyncTaskRepository(db))
+        self._parent_project: Project = parent_project
+
+    def entity_name(self) -> str:
+        return "Task"
+
+    def create_entity_object(
+        self, detail: Detail, deadline: Optional[date] = None, status: Optional[str] = "todo"
+    ) -> Task:
+        if status is None:
+            status = "todo"
+        return Task(detail=detail, deadline=deadline, status=status)
+
+    def _get_max_desc_length(self) -> int:
+        return self._config.max_task_description_length
+
+    def _get_max_title_length(self) -> int:
+        return self._config.max_task_name_length
+
+    def _get_max_count(self) -> int:
+        return self._config.max_tasks
+
+    async def remove_entity_object(self, entity: Task) -> None:
+        await self._repository.remove_from_db(entity, self._parent_project)
+
+    # ---------- Validators ----------
+
+    def validate_status(self, status: str) -> str:
+        return StatusValidator().validate(status)
+
+    def validate_deadline(self, deadline: date) -> None:
+        DeadlineValidator().validate(deadline)
+
+    async def get_repo_list(self) -> List[Task]:
+        return await self._repository.get_db_list(self._parent_project)
+
+    async def get_page(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[Task]:
+        """Return the next tasks of the parent project after the given id."""
+        return await self._repository.get_page(self._parent_project, after, limit)
+
+    async def get_entity_by_id(self, entity_id: int) -> Optional[Task]:
+        return await self._repository.get_by_id(entity_id, self._parent_project)
+
+    async def get_status_counts(self) -> Dict[str, int]:
+        """Return task counts by status of the parent project."""
+        return await self._repository.get_status_counts(self._parent_project)
+
+    async def _append_to_repository(self, entity: Task) -> None:
+        await self._repository.append_to_db(entity, self._parent_project)
+
+    def get_parent_project(self) -> Project:
+        return self._parent_project
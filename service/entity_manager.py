@@ -18,9 +18,10 @@ class EntityManager(ABC, Generic[T]):
 
     def add_entity(self, detail: Detail, deadline: Optional[date] = None, status: Optional[str] = None) -> None:
         """Validate and add entity."""
-        self.validate_creation()
-        entity = self.create_entity_object(detail, deadline, status)
-        self._append_to_repository(entity)
+        with self._repository.unit_of_work():
+            self.validate_creation()
+            entity = self.create_entity_object(detail, deadline, status)
+            self._append_to_repository(entity)
 
     @abstractmethod
     def remove_entity_object(self, entity: T) -> None:
@@ -31,9 +32,14 @@ class EntityManager(ABC, Generic[T]):
     def get_repo_list(self) -> List[T]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_entity_by_id(self, entity_id: int) -> Optional[T]:
+        raise NotImplementedError
+
     def update_entity_object(self, old_entity: T, new_entity: T, parent_project: Optional[Project] = None) -> None:
         """Update an entity in repository."""
-        self._repository.update_entity(parent_project, old_entity, new_entity)
+        with self._repository.unit_of_work():
+            self._repository.update_entity(parent_project, old_entity, new_entity)
 
     def _append_to_repository(self, entity: T) -> None:
         """Append entity to repository."""
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 from core.config import AppConfig
 from models.models import Detail, Project
 from repository.project_repository import ProjectRepository
@@ -17,13 +17,6 @@ class ProjectManager(EntityManager[Project]):
     def set_task_manager(self, task_manager: TaskManager) -> None:
         self._task_manager = task_manager
 
-    def _cascade_delete_tasks(self, entity: Project) -> None:
-        task_manager = self.get_task_manager(entity)
-        if task_manager:
-            task_manager.set_parent_project(entity)
-            for task in list(entity.tasks):
-                task_manager.remove_entity_object(task)
-
     def entity_name(self) -> str:
         return "Project"
 
@@ -53,10 +46,17 @@ class ProjectManager(EntityManager[Project]):
     def get_repo_list(self) -> List[Project]:
         return self._repository.get_db_list()
 
+    def get_entity_by_id(self, entity_id: int) -> Optional[Project]:
+        return self._repository.get_by_id(entity_id)
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Return task counts by status across all projects."""
+        return self._repository.get_status_counts()
+
     def _remove_from_repository(self, entity: Project, parent_project: Project | None = None) -> None:
         self._repository.remove_from_db(entity)
 
     def remove_entity_object(self, entity: Project) -> None:
-        """Remove entity and handle cascade deletes if needed."""
-        self._cascade_delete_tasks(entity)
-        self._remove_from_repository(entity)
\ No newline at end of file
+        """Remove entity; the database drops its tasks along with it."""
+        with self._repository.unit_of_work():
+            self._remove_from_repository(entity)
\ No newline at end of file
@@ -1,8 +1,8 @@
+import asyncio
 from datetime import datetime
-from typing import List
+from repository.async_task_repository import AsyncTaskRepository
 from repository.project_repository import ProjectRepository
 from repository.task_repository import TaskRepository
-from models.models import Project, Task
 
 
 class TaskCloser:
@@ -13,20 +13,21 @@ class TaskCloser:
         self._task_repo = task_repo
 
     def close_overdue_tasks(self) -> None:
-        """Mark all overdue tasks as done and set closed_at."""
-        now = datetime.now()
-        projects: List[Project] = self._project_repo.get_db_list()
-
-        for project in projects:
-            tasks: List[Task] = self._task_repo.get_db_list(project)
-            for task in tasks:
-                if task.deadline < now and getattr(task, "status", "") != "done":
-                    old_task = task
-                    new_task = Task(
-                        detail=task.detail,
-                        deadline=task.deadline,
-                        status="done",
-                        closed_at = now
-                    )
-                    setattr(new_task, "closed_at", datetime.now())
-                    self._task_repo.update_entity(project, old_task, new_task)
+        """Mark all overdue tasks as done and set closed_at in one backend operation."""
+        self._task_repo.close_overdue(datetime.now())
+
+
+class AsyncTaskCloser:
+    """Closes overdue tasks through the async repository on the API's event loop.
+
+    The scheduler thread hands each run to ``loop`` and waits for it, so the sweep
+    shares the database and mirror that serve the async API handlers.
+    """
+
+    def __init__(self, task_repo: AsyncTaskRepository, loop: asyncio.AbstractEventLoop):
+        self._task_repo = task_repo
+        self._loop = loop
+
+    def close_overdue_tasks(self) -> None:
+        """Mark all overdue tasks as done and set closed_at in one backend operation."""
+        asyncio.run_coroutine_threadsafe(self._task_repo.close_overdue(datetime.now()), self._loop).result()
@@ -1,14 +1,14 @@
 from schedule import every, run_pending
 import time
-from typing import List
+from typing import List, Union
 from threading import Thread
-from service.scheduler.task_closer import TaskCloser
+from service.scheduler.task_closer import AsyncTaskCloser, TaskCloser
 
 
 class TaskScheduler:
     """Schedules periodic task closure using schedule 1.2.2."""
 
-    def __init__(self, jobs: List[TaskCloser]):
+    def __init__(self, jobs: List[Union[TaskCloser, AsyncTaskCloser]]):
         self._jobs = jobs
         self._stop = False
 
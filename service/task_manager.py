@@ -1,10 +1,11 @@
 from datetime import date
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 from core.config import AppConfig
 from models.models import Detail, Task, Project
 from repository.task_repository import TaskRepository
 from service.entity_manager import EntityManager
-from core.validator import StatusValidator, DeadlineValidator
+from core.validator import StatusValidator, DeadlineValidator, NonEmptyTextValidator
+from exception.exceptions import DuplicateValueError, MaxCountError
 
 class TaskManager(EntityManager[Task]):
     """Manager for task-level operations."""
@@ -44,12 +45,38 @@ class TaskManager(EntityManager[Task]):
     def _get_max_count(self) -> int:
         return self._config.max_tasks
 
+    def add_entities(self, entries: Iterable[Tuple[Detail, Optional[date], Optional[str]]]) -> List[Task]:
+        """Validate and add a batch of (detail, deadline, status) entries in one database operation."""
+        if self._parent_project is None:
+            raise ValueError("Current project is not set for TaskManager.")
+        with self._repository.unit_of_work():
+            tasks = [self.create_entity_object(detail, deadline, status) for detail, deadline, status in entries]
+            self.validate_batch(tasks)
+            self._repository.add_tasks(self._parent_project, tasks)
+        return tasks
+
     def remove_entity_object(self, entity: Task) -> None:
         """Remove entity and handle cascade deletes if needed."""
         self._remove_from_repository(entity, self._parent_project)
 
     # ---------- Validators ----------
 
+    def validate_batch(self, tasks: List[Task]) -> None:
+        """Validate count, titles and descriptions of a whole batch against one read of the project."""
+        existing = self.get_repo_list()
+        if len(existing) + len(tasks) > self._get_max_count():
+            raise MaxCountError(self.entity_name(), self._get_max_count())
+        field_name = f"{self.entity_name()} title"
+        title_validator = NonEmptyTextValidator(max_length=self._get_max_title_length(), field_name=field_name)
+        titles = {t.detail.title for t in existing}
+        for task in tasks:
+            title = title_validator.validate(task.detail.title)
+            if title in titles:
+                raise DuplicateValueError(field_name)
+            titles.add(title)
+            self.validate_description(task.detail.description)
+            self.validate_status(task.status)
+
     def validate_status(self, status: str) -> str:
         validator = StatusValidator()
         return validator.validate(status)
@@ -63,6 +90,17 @@ class TaskManager(EntityManager[Task]):
             raise ValueError("Current project is not set for TaskManager.")
         return self._repository.get_db_list(self._parent_project)
 
+    def get_entity_by_id(self, entity_id: int) -> Optional[Task]:
+        if self._parent_project is None:
+            raise ValueError("Current project is not set for TaskManager.")
+        return self._repository.get_by_id(entity_id, self._parent_project)
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Return task counts by status of the current project."""
+        if self._parent_project is None:
+            raise ValueError("Current project is not set for TaskManager.")
+        return self._repository.get_status_counts(self._parent_project)
+
     def _append_to_repository(self, entity: Task) -> None:
         if self._parent_project is None:
             raise ValueError("Current project is not set for TaskManager.")
@@ -0,0 +1,224 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api_cli.api.controllers.project_controller import ProjectController
+from api_cli.api.controllers.task_controller import TaskController
+from core.config import AppConfig
+from db.db_inmemory import InMemoryDatabase
+from db.async_db_interface import SyncDatabaseAdapter
+from service.async_project_manager import AsyncProjectManager
+
+
+def _config() -> AppConfig:
+    return AppConfig(
+        max_projects=10,
+        max_project_name_length=30,
+        max_project_description_length=150,
+        max_tasks=10,
+        max_task_name_length=30,
+        max_task_description_length=150,
+        db_type="memory",
+        db_name="",
+        db_user="",
+        db_password="",
+        db_host="",
+        db_port=5432,
+    )
+
+
+@pytest.fixture
+def client():
+    manager = AsyncProjectManager(_config(), SyncDatabaseAdapter(InMemoryDatabase(), offload=False))
+    app = FastAPI()
+    app.include_router(ProjectController(manager).router)
+    app.include_router(TaskController(manager).router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def sql_client(tmp_path):
+    from api_cli.api.middleware import UnitOfWorkMiddleware
+    from db.db_sqlite import SQLiteDatabase
+
+    async_db = SyncDatabaseAdapter(SQLiteDatabase(str(tmp_path / "todo.db")))
+    manager = AsyncProjectManager(_config(), async_db)
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware, db=async_db)
+    app.include_router(ProjectController(manager).router)
+    app.include_router(TaskController(manager).router)
+    return TestClient(app)
+
+
+def _create_project(client, title: str = "API project") -> int:
+    response = client.post("/projects/", json={"detail": {"title": title, "description": "desc"}})
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def _create_task(client, project_id: int, title: str = "API task") -> dict:
+    deadline = (date.today() + timedelta(days=3)).isoformat()
+    response = client.post(
+        f"/projects/{project_id}/tasks/",
+        json={"detail": {"title": title, "description": "desc"}, "deadline": deadline},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_project_is_addressable_by_id(client):
+    project_id = _create_project(client)
+
+    response = client.get(f"/projects/{project_id}")
+
+    assert response.status_code == 200
+    assert response.json()["detail"]["title"] == "API project"
+    assert client.get("/projects/9999").status_code == 404
+
+
+def test_task_crud_by_id(client):
+    project_id = _create_project(client)
+    task = _create_task(client, project_id)
+    url = f"/projects/{project_id}/tasks/{task['id']}"
+
+    assert client.get(url).json()["detail"]["title"] == "API task"
+
+    update = {"detail": {"title": "Renamed", "description": "desc"}, "deadline": task["deadline"], "status": "doing"}
+    response = client.put(url, json=update)
+    assert response.status_code == 200
+    assert response.json()["id"] == task["id"]
+    assert client.get(url).json()["status"] == "doing"
+
+    assert client.delete(url).status_code == 200
+    assert client.get(url).status_code == 404
+
+
+def test_task_is_not_reachable_through_another_project(client):
+    project_id = _create_project(client)
+    other_id = _create_project(client, "Other project")
+    task = _create_task(client, project_id)
+
+    assert client.get(f"/projects/{other_id}/tasks/{task['id']}").status_code == 404
+
+
+def test_stats_follow_task_writes(client):
+    baseline = client.get("/projects/stats").json()
+    project_id = _create_project(client)
+    task = _create_task(client, project_id)
+    _create_task(client, project_id, "Second task")
+
+    update = {"detail": task["detail"], "deadline": task["deadline"], "status": "done"}
+    client.put(f"/projects/{project_id}/tasks/{task['id']}", json=update)
+
+    stats = client.get(f"/projects/{project_id}/stats").json()
+    assert (stats["todo"], stats["doing"], stats["done"], stats["total"]) == (1, 0, 1, 2)
+    totals = client.get("/projects/stats").json()
+    assert totals["total"] == baseline["total"] + 2
+
+    client.delete(f"/projects/{project_id}")
+    assert client.get("/projects/stats").json() == baseline
+    assert client.get(f"/projects/{project_id}/stats").status_code == 404
+
+
+def test_db_metrics_route_reports_lock_stats():
+    from api_cli.api.controllers.metrics_controller import MetricsController
+
+    db = InMemoryDatabase()
+    db.snapshot()
+    app = FastAPI()
+    app.include_router(MetricsController(SyncDatabaseAdapter(db)).router)
+    response = TestClient(app).get("/metrics/db")
+
+    assert response.status_code == 200
+    assert response.json()["lock.projects_write"]["acquisitions"] >= 1
+
+
+def test_request_runs_in_one_unit_of_work(tmp_path):
+    from sqlalchemy import event
+    from api_cli.api.middleware import UnitOfWorkMiddleware
+    from db.db_sqlite import SQLiteDatabase
+
+    db = SQLiteDatabase(str(tmp_path / "todo.db"))
+    async_db = SyncDatabaseAdapter(db)
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware, db=async_db)
+    app.include_router(ProjectController(AsyncProjectManager(_config(), async_db)).router)
+    app.include_router(TaskController(AsyncProjectManager(_config(), async_db)).router)
+    client = TestClient(app)
+    project_id = _create_project(client)
+    _create_task(client, project_id)
+    _create_task(client, project_id, "Second task")
+
+    commits = []
+    engine = db._db_session.get_engine()
+    listener = lambda conn: commits.append(conn)
+    event.listen(engine, "commit", listener)
+    try:
+        assert client.delete(f"/projects/{project_id}").status_code == 200
+        assert client.get("/projects/9999").status_code == 404
+    finally:
+        event.remove(engine, "commit", listener)
+
+    assert len(commits) == 1
+    db._load()
+    assert db.get_projects() == []
+
+
+def test_task_listing_pages_and_projects_fields(client):
+    project_id = _create_project(client)
+    ids = [_create_task(client, project_id, f"Task {index}")["id"] for index in range(4)]
+    url = f"/projects/{project_id}/tasks/"
+
+    page = client.get(url, params={"limit": 2, "after": ids[0]}).json()
+    assert [task["id"] for task in page] == ids[1:3]
+
+    response = client.get(url, params={"fields": "id,status", "after": ids[2]})
+    assert response.json() == [{"id": ids[3], "status": "todo"}]
+
+    assert client.get(url, params={"fields": "id,secret"}).status_code == 400
+    assert client.get(url, params={"limit": 0}).status_code == 422
+    assert client.get("/projects/", params={"fields": "id", "after": project_id}).json() is None
+
+
+def test_task_update_honours_if_match(client):
+    project_id = _create_project(client)
+    task = _create_task(client, project_id)
+    url = f"/projects/{project_id}/tasks/{task['id']}"
+    etag = client.get(url).headers["ETag"]
+    update = {"detail": {"title": "API task", "description": "desc"}, "deadline": task["deadline"], "status": "doing"}
+
+    response = client.put(url, json=update, headers={"If-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag == f'"{task["version"]}"'
+
+    stale = client.put(url, json={**update, "status": "done"}, headers={"If-Match": etag})
+    assert stale.status_code == 409
+    assert client.put(url, json=update, headers={"If-Match": '"99"'}).status_code == 409
+    assert client.get(url).json()["status"] == "doing"
+    assert client.put(url, json=update, headers={"If-Match": "*"}).status_code == 200
+
+
+def test_sql_backend_rejects_duplicate_task_titles(sql_client):
+    project_id = _create_project(sql_client)
+    first = _create_task(sql_client, project_id, "A")
+    _create_task(sql_client, project_id, "B")
+    deadline = (date.today() + timedelta(days=3)).isoformat()
+    duplicate = {"detail": {"title": "A", "description": "desc"}, "deadline": deadline}
+
+    assert sql_client.post(f"/projects/{project_id}/tasks/", json=duplicate).status_code == 400
+    rename = {**duplicate, "detail": {"title": "B", "description": "desc"}}
+    assert sql_client.put(f"/projects/{project_id}/tasks/{first['id']}", json=rename).status_code == 400
+    titles = [task["detail"]["title"] for task in sql_client.get(f"/projects/{project_id}/tasks/").json()]
+    assert titles == ["A", "B"]
+
+
+def test_project_rename_returns_the_new_title(sql_client):
+    project_id = _create_project(sql_client, "P")
+    renamed = {"detail": {"title": "P2", "description": "renamed"}}
+
+    response = sql_client.put(f"/projects/{project_id}", json=renamed)
+    assert response.status_code == 200
+    assert response.json()["detail"] == renamed["detail"]
+    assert sql_client.get(f"/projects/{project_id}").json()["detail"] == renamed["detail"]
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from api_cli.api.controllers.project_controller import ProjectController
+from api_cli.api.controllers.task_controller import TaskController
+from core.config import AppConfig
+from db.orm_models import Base
+from models.models import Detail, Project, Task
+from service.async_project_manager import AsyncProjectManager
+
+pytest.importorskip("aiosqlite")
+
+from db.db_async_postgres import AsyncPostgresDatabase  # noqa: E402
+
+
+@pytest.fixture
+def url(tmp_path):
+    """Async URL of a throwaway SQLite file with the schema created up front."""
+    path = tmp_path / "todo.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return f"sqlite+aiosqlite:///{path}"
+
+
+def _task(title: str, status: str = "todo", days: int = 1) -> Task:
+    return Task(detail=Detail(title, f"{title} desc"), deadline=date.today() + timedelta(days=days), status=status)
+
+
+def _config() -> AppConfig:
+    return AppConfig(
+        max_projects=10, max_project_name_length=30, max_project_description_length=150,
+        max_tasks=10, max_task_name_length=30, max_task_description_length=150,
+        db_type="postgres", db_name="", db_user="", db_password="", db_host="", db_port=5432,
+    )
+
+
+def test_writes_are_mirrored_and_reloaded(url):
+    async def scenario():
+        db = AsyncPostgresDatabase(url)
+        await db.load()
+        project = Project(detail=Detail("P1", "first"))
+        await db.add_project(project)
+        task = _task("T1")
+        await db.add_task(project, task)
+        await db.update_entity(task, _task("T1", status="done"), project)
+        assert await db.get_status_counts() == {"todo": 0, "doing": 0, "done": 1}
+
+        await db.load()
+        [loaded] = await db.get_projects()
+        [reloaded] = await db.get_tasks(loaded)
+        assert (reloaded.id, reloaded.status) == (task.id, "done")
+        assert await db.get_task_by_id(loaded, task.id) is reloaded
+        assert (await db.get_metrics())["pool"]["checkouts"] >= 1
+        await db.close()
+
+    asyncio.run(scenario())
+
+
+def test_async_handlers_serve_crud(url):
+    db = AsyncPostgresDatabase(url)
+    manager = AsyncProjectManager(_config(), db)
+    app = FastAPI()
+    app.add_event_handler("startup", db.load)
+    app.add_event_handler("shutdown", db.close)
+    app.include_router(ProjectController(manager).router)
+    app.include_router(TaskController(manager).router)
+
+    with TestClient(app) as client:
+        project_id = client.post("/projects/", json={"detail": {"title": "P1", "description": "d"}}).json()["id"]
+        deadline = (date.today() + timedelta(days=1)).isoformat()
+        created = client.post(f"/projects/{project_id}/tasks/",
+                              json={"detail": {"title": "T1", "description": "d"}, "deadline": deadline})
+        assert created.status_code == 200
+        task_id = created.json()["id"]
+
+        assert client.get(f"/projects/{project_id}/tasks/{task_id}").json()["detail"]["title"] == "T1"
+        assert client.delete(f"/projects/{project_id}").status_code == 200
+        assert client.get(f"/projects/{project_id}").status_code == 404
+
+
+def test_scheduler_closes_tasks_through_the_api_database(url):
+    from repository.async_task_repository import AsyncTaskRepository
+    from service.scheduler.task_closer import AsyncTaskCloser
+
+    db = AsyncPostgresDatabase(url)
+    closers = []
+
+    async def start():
+        await db.load()
+        project = Project(detail=Detail("P1", "first"))
+        await db.add_project(project)
+        await db.add_task(project, _task("T1", days=-1))
+        closers.append(AsyncTaskCloser(AsyncTaskRepository(db), asyncio.get_running_loop()))
+
+    app = FastAPI()
+    app.add_event_handler("startup", start)
+    app.add_event_handler("shutdown", db.close)
+    app.include_router(TaskController(AsyncProjectManager(_config(), db)).router)
+
+    with TestClient(app) as client:
+        closers[0].close_overdue_tasks()
+        [task] = client.get("/projects/1/tasks/").json()
+        assert task["status"] == "done" and task["closed_at"] is not None
@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from db.db_columnar import ColumnarDatabase
+from models.models import Detail, Project, Task
+
+
+def _task(title: str, status: str = "todo", days: int = 1) -> Task:
+    return Task(detail=Detail(title, f"{title} desc"), deadline=date.today() + timedelta(days=days), status=status)
+
+
+@pytest.fixture
+def db():
+    database = ColumnarDatabase()
+    database.add_project(Project(detail=Detail("P1", "first")))
+    return database
+
+
+def test_tasks_round_trip_through_columns(db):
+    project = db.get_projects()[0]
+    task = _task("T1", status="doing")
+    db.add_task(project, task)
+
+    loaded = db.get_task_by_id(project, task.id)
+
+    assert loaded is not task
+    assert (loaded.detail, loaded.deadline, loaded.status, loaded.closed_at) == \
+           (task.detail, task.deadline, "doing", None)
+    with pytest.raises(ValueError):
+        db.add_task(project, _task("T1"))
+
+
+def test_update_and_remove_by_id(db):
+    project = db.get_projects()[0]
+    task = _task("T1")
+    db.add_task(project, task)
+    closed_at = datetime(2030, 1, 1, 12, 30)
+
+    db.update_entity(task, Task(detail=Detail("T1 renamed", "d"), deadline=task.deadline,
+                                status="done", closed_at=closed_at), project)
+
+    updated = db.get_task_by_id(project, task.id)
+    assert (updated.detail.title, updated.status, updated.closed_at) == ("T1 renamed", "done", closed_at)
+    db.remove_task(project, updated)
+    assert db.get_task_by_id(project, task.id) is None
+    assert db.get_tasks(project) == []
+
+
+def test_vectorized_filters(db):
+    project = db.get_projects()[0]
+    other = Project(detail=Detail("P2", "second"))
+    db.add_project(other)
+    overdue, soon, done = _task("overdue", days=-2), _task("soon", days=3), _task("done", "done", -5)
+    for task in (soon, overdue, done):
+        db.add_task(project, task)
+    db.add_task(other, _task("other", status="doing", days=1))
+
+    assert [t.id for _, t in db.get_tasks_due_between(end=datetime.now())] == [overdue.id]
+    assert [t.detail.title for _, t in db.get_tasks_due_between(limit=2)] == ["overdue", "other"]
+    assert db.get_status_counts(project) == {"todo": 2, "doing": 0, "done": 1}
+    assert db.get_status_counts() == {"todo": 2, "doing": 1, "done": 1}
+
+
+def test_remove_project_drops_rows_and_compacts(db):
+    project = db.get_projects()[0]
+    keeper = Project(detail=Detail("P2", "second"))
+    db.add_project(keeper)
+    for i in range(10):
+        db.add_task(project, _task(f"T{i}"))
+    kept = _task("kept")
+    db.add_task(keeper, kept)
+
+    db.remove_project(project)
+
+    assert db._size == 1
+    assert [t.detail.title for t in db.get_tasks(keeper)] == ["kept"]
+    assert db.get_task_by_id(keeper, kept.id).detail.title == "kept"
+    assert db.get_status_counts()["todo"] == 1
+
+
+def test_snapshot_is_isolated_from_later_writes(db):
+    project = db.get_projects()[0]
+    task = _task("T1")
+    db.add_task(project, task)
+    before = db.snapshot()
+
+    db.remove_task(project, task)
+
+    assert [t.id for t in before.get_project(project.id).tasks] == [task.id]
+    assert db.snapshot().get_project(project.id).tasks == ()
+
+
+def test_close_overdue_updates_columns_in_place(db):
+    project = db.get_projects()[0]
+    overdue, done, upcoming = _task("overdue", days=-2), _task("done", "done", days=-2), _task("upcoming", days=2)
+    db.add_tasks(project, [overdue, done, upcoming])
+    now = datetime.now()
+
+    assert db.close_overdue(now) == [overdue.id]
+
+    closed = db.get_task_by_id(project, overdue.id)
+    assert (closed.status, closed.closed_at) == ("done", now)
+    assert db.get_task_by_id(project, done.id).closed_at is None
+    assert db.get_status_counts(project) == {"todo": 1, "doing": 0, "done": 2}
+    assert db.close_overdue(now) == []
+
+
+def test_task_pages_are_keyset_slices(db):
+    project = db.get_projects()[0]
+    for index in range(5):
+        db.add_task(project, _task(f"T{index}"))
+    ids = [task.id for task in db.get_tasks(project)]
+
+    assert [t.id for t in db.get_tasks_page(project, after=ids[0], limit=3)] == ids[1:4]
+    assert [t.id for t in db.get_tasks_page(project, after=ids[3])] == ids[4:]
+
+
+def test_deadlines_keep_their_type_and_precision(db):
+    project = db.get_projects()[0]
+    precise = _task("T1")
+    precise.deadline = datetime(2030, 1, 1, 9, 30, 15, 250)
+    db.add_tasks(project, [precise, _task("T2")])
+
+    loaded = {task.detail.title: task.deadline for task in db.get_tasks(project)}
+
+    assert loaded["T1"] == datetime(2030, 1, 1, 9, 30, 15, 250)
+    assert type(loaded["T2"]) is date and loaded["T2"] == date.today() + timedelta(days=1)
+
+
+def test_project_row_index_survives_compaction(db):
+    project = db.get_projects()[0]
+    other = Project(detail=Detail("P2", "second"))
+    db.add_project(other)
+    db.add_tasks(project, [_task(f"T{index}") for index in range(6)])
+    db.add_task(other, _task("O1"))
+    for task in db.get_tasks(project)[:4]:
+        db.remove_task(project, task)
+
+    assert [t.detail.title for t in db.get_tasks(project)] == ["T4", "T5"]
+    assert [t.detail.title for t in db.get_tasks(other)] == ["O1"]
+    with pytest.raises(ValueError):
+        db.add_task(project, _task("T5"))
+    db.add_task(project, _task("T0"))
+    assert db.get_status_counts(project) == {"todo": 3, "doing": 0, "done": 0}
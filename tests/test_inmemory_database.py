@@ -0,0 +1,278 @@
+from datetime import date, timedelta
+from threading import Thread
+
+import pytest
+
+from db.db_inmemory import InMemoryDatabase
+from models.models import Detail, Project, Task
+
+
+def _task(title: str, status: str = "todo", days: int = 1) -> Task:
+    return Task(detail=Detail(title, f"{title} desc"), deadline=date.today() + timedelta(days=days), status=status)
+
+
+@pytest.fixture
+def db():
+    database = InMemoryDatabase()
+    database.add_project(Project(detail=Detail("P1", "first")))
+    return database
+
+
+def test_demo_data_is_indexed(db):
+    project = db._find_project(Project(detail=Detail("Project B", "")))
+    assert [t.detail.title for t in db.get_tasks(project)] == ["Task B1", "Task B2"]
+
+
+def test_add_task_rejects_duplicate_title(db):
+    project = Project(detail=Detail("P1", ""))
+    db.add_task(project, _task("T1"))
+    with pytest.raises(ValueError):
+        db.add_task(project, _task("T1"))
+
+
+def test_task_rename_keeps_index_in_sync(db):
+    project = Project(detail=Detail("P1", ""))
+    task = _task("T1")
+    db.add_task(project, task)
+
+    db.update_entity(task, _task("T2", status="doing"), project)
+
+    assert db._find_task(project, _task("T2")) is task
+    with pytest.raises(ValueError):
+        db._find_task(project, _task("T1"))
+    db.add_task(project, _task("T1"))
+
+
+def test_project_rename_moves_task_index(db):
+    project = db.get_projects()[-1]
+    task = _task("T1")
+    db.add_task(project, task)
+
+    db.update_entity(project, Project(detail=Detail("P1 renamed", "first")), None)
+
+    renamed = Project(detail=Detail("P1 renamed", ""))
+    assert db._find_project(renamed) is project
+    assert db._find_task(renamed, task) is task
+    with pytest.raises(ValueError):
+        db.get_tasks(Project(detail=Detail("P1", "")))
+
+
+def test_remove_drops_index_entries(db):
+    project = db.get_projects()[-1]
+    task = _task("T1")
+    db.add_task(project, task)
+
+    db.remove_task(project, task)
+    with pytest.raises(ValueError):
+        db.remove_task(project, task)
+
+    db.remove_project(project)
+    assert project not in db.get_projects()
+    with pytest.raises(ValueError):
+        db.add_task(project, _task("T2"))
+
+
+def test_ids_are_allocated_and_resolvable(db):
+    project = db.get_projects()[-1]
+    task = _task("T1")
+    db.add_task(project, task)
+
+    assert project.id is not None and task.id is not None
+    assert len({p.id for p in db.get_projects()}) == len(db.get_projects())
+    assert db.get_project_by_id(project.id) is project
+    assert db.get_task_by_id(project, task.id) is task
+
+
+def test_task_id_is_scoped_to_its_project(db):
+    project, other = db.get_projects()[-1], db.get_projects()[0]
+    task = _task("T1")
+    db.add_task(project, task)
+
+    assert db.get_task_by_id(other, task.id) is None
+    db.remove_task(project, task)
+    assert db.get_task_by_id(project, task.id) is None
+
+
+def test_removed_project_drops_its_ids(db):
+    project = db.get_projects()[0]
+    task_ids = [t.id for t in project.tasks]
+
+    db.remove_project(project)
+
+    assert db.get_project_by_id(project.id) is None
+    assert all(db.get_task_by_id(project, task_id) is None for task_id in task_ids)
+
+
+def test_due_between_skips_done_and_orders_by_deadline(db):
+    project = db.get_projects()[-1]
+    late, soon, done = _task("late", days=10), _task("soon", days=2), _task("done", status="done", days=1)
+    for task in (late, soon, done):
+        db.add_task(project, task)
+
+    start = date.today()
+    due = db.get_tasks_due_between(start, start + timedelta(days=30))
+
+    assert [t for _, t in due] == [soon, late]
+    assert all(p is project for p, _ in due)
+    assert [t for _, t in db.get_tasks_due_between(start, limit=1)] == [soon]
+
+
+def test_deadline_index_follows_updates(db):
+    project = db.get_projects()[-1]
+    task = _task("T1", days=5)
+    db.add_task(project, task)
+    start = date.today()
+
+    db.update_entity(task, _task("T1", days=1), project)
+    assert [t for _, t in db.get_tasks_due_between(start, start + timedelta(days=2))] == [task]
+
+    db.update_entity(task, _task("T1", status="done", days=1), project)
+    assert db.get_tasks_due_between(start) == []
+
+
+def test_task_closer_closes_only_overdue_tasks(db):
+    from repository.project_repository import ProjectRepository
+    from repository.task_repository import TaskRepository
+    from service.scheduler.task_closer import TaskCloser
+
+    project = db.get_projects()[-1]
+    overdue, upcoming = _task("overdue", days=-1), _task("upcoming", days=1)
+    db.add_task(project, overdue)
+    db.add_task(project, upcoming)
+
+    TaskCloser(ProjectRepository(db), TaskRepository(db)).close_overdue_tasks()
+
+    assert overdue.status == "done" and overdue.closed_at is not None
+    assert upcoming.status == "todo"
+    assert db.get_tasks_due_between(end=date.today()) == []
+
+
+def test_status_counts_are_maintained(db):
+    project = db.get_projects()[-1]
+    task = _task("T1")
+    db.add_task(project, task)
+    db.add_task(project, _task("T2", status="doing"))
+
+    db.update_entity(task, _task("T1", status="done"), project)
+
+    assert db.get_status_counts(project) == {"todo": 0, "doing": 1, "done": 1}
+    assert db.get_status_counts() == {"todo": 2, "doing": 2, "done": 1}
+    db.remove_project(project)
+    assert db.get_status_counts() == {"todo": 2, "doing": 1, "done": 0}
+
+
+def test_snapshot_is_isolated_from_later_writes(db):
+    project = db.get_projects()[-1]
+    task = _task("T1")
+    db.add_task(project, task)
+    before = db.snapshot()
+
+    db.update_entity(task, _task("T1", status="done"), project)
+    db.add_task(project, _task("T2"))
+    db.remove_project(db.get_projects()[0])
+
+    view = before.get_project(project.id)
+    assert [(t.title, t.status) for t in view.tasks] == [("T1", "todo")]
+    assert len(before.projects) == 3
+    after = db.snapshot()
+    assert [t.title for t in after.get_project(project.id).tasks] == ["T1", "T2"]
+    assert after.version > before.version
+
+
+def test_snapshot_shares_unchanged_projects(db):
+    untouched, changed = db.get_projects()[0], db.get_projects()[-1]
+    first = db.snapshot()
+    assert db.snapshot() is first
+
+    db.add_task(changed, _task("T1"))
+    second = db.snapshot()
+
+    assert second.get_project(untouched.id) is first.get_project(untouched.id)
+    assert second.get_project(changed.id) is not first.get_project(changed.id)
+
+
+def test_concurrent_task_writes_keep_indexes_consistent(db):
+    projects = [Project(detail=Detail(f"C{i}", "concurrent")) for i in range(8)]
+    for project in projects:
+        db.add_project(project)
+
+    def worker(project: Project) -> None:
+        for n in range(200):
+            db.add_task(project, _task(f"T{n}"))
+            db.get_status_counts(project)
+        for n in range(0, 200, 2):
+            db.remove_task(project, _task(f"T{n}"))
+
+    threads = [Thread(target=worker, args=(project,)) for project in projects]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [task.id for project in projects for task in db.get_tasks(project)]
+    assert len(ids) == len(set(ids)) == 8 * 100
+    assert db.get_status_counts()["todo"] >= 8 * 100
+    assert all(db.get_task_by_id(project, task.id) is task
+               for project in projects for task in db.get_tasks(project))
+    stats = db.lock_stats()
+    assert stats["tasks"]["acquisitions"] >= 8 * 300
+    assert stats["projects_write"]["acquisitions"] >= 8
+
+
+def test_add_tasks_is_all_or_nothing(db):
+    project = db.get_projects()[-1]
+    db.add_tasks(project, [_task("B1"), _task("B2")])
+    assert [t.detail.title for t in db.get_tasks(project)][-2:] == ["B1", "B2"]
+
+    with pytest.raises(ValueError):
+        db.add_tasks(project, [_task("B3"), _task("B1")])
+    assert "B3" not in [t.detail.title for t in db.get_tasks(project)]
+
+
+def test_pages_follow_id_order(db):
+    project = db.get_projects()[-1]
+    for index in range(5):
+        db.add_task(project, _task(f"T{index}"))
+    ids = [task.id for task in db.get_tasks(project)]
+
+    assert [t.id for t in db.get_tasks_page(project, limit=2)] == ids[:2]
+    assert [t.id for t in db.get_tasks_page(project, after=ids[1], limit=2)] == ids[2:4]
+    assert [t.id for t in db.get_tasks_page(project, after=ids[-1])] == []
+    first = db.get_projects_page(limit=1)
+    assert [p.id for p in db.get_projects_page(after=first[0].id)] == [p.id for p in db.get_projects()[1:]]
+
+
+def test_update_from_stale_copy_conflicts(db):
+    from exception.exceptions import VersionConflictError
+
+    project = db.get_projects()[-1]
+    db.add_task(project, _task("T1"))
+    stored = db.get_tasks(project)[-1]
+    stale = _task("T1")
+    stale._id, stale._version = stored.id, stored.version
+
+    db.update_entity(stored, _task("T1", status="doing"), project)
+    assert stored.version == 2
+
+    with pytest.raises(VersionConflictError):
+        db.update_entity(stale, _task("T1", status="done"), project)
+    based_on_first = _task("T1", status="done")
+    based_on_first.based_on(1)
+    with pytest.raises(VersionConflictError):
+        db.update_entity(stored, based_on_first, project)
+    assert stored.status == "doing"
+
+
+def test_rename_onto_existing_title_is_rejected(db):
+    project_a = db._find_project(Project(detail=Detail("Project A", "")))
+    project_b = db._find_project(Project(detail=Detail("Project B", "")))
+    with pytest.raises(ValueError):
+        db.update_entity(project_b, Project(detail=Detail("Project A", "renamed")), None)
+    assert [p.detail.title for p in db.get_projects()].count("Project A") == 1
+    assert db._find_project(Project(detail=Detail("Project B", ""))) is project_b
+
+    first, second = db.get_tasks(project_b)[:2]
+    with pytest.raises(ValueError):
+        db.update_entity(first, _task(second.detail.title), project_b)
+    assert [t.detail.title for t in db.get_tasks(project_b)] == ["Task B1", "Task B2"]
+    db.remove_project(project_a)
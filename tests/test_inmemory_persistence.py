@@ -0,0 +1,89 @@
+import os
+from datetime import date, datetime
+
+import pytest
+
+from db.db_inmemory import InMemoryDatabase
+from db.persistence import InMemoryPersistence
+from models.models import Detail, Project, Task
+
+
+def _open(directory, snapshot_interval: int = 1000) -> InMemoryDatabase:
+    return InMemoryDatabase(persistence=InMemoryPersistence(str(directory), snapshot_interval=snapshot_interval))
+
+
+def _state(db: InMemoryDatabase):
+    return [
+        (p.id, p.detail.title, [(t.id, t.detail.title, t.deadline, t.status, t.closed_at) for t in p.tasks])
+        for p in db.get_projects()
+    ]
+
+
+def _populate(db: InMemoryDatabase) -> None:
+    keep, drop = Project(detail=Detail("Keep", "kept")), Project(detail=Detail("Drop", "dropped"))
+    db.add_project(keep)
+    db.add_project(drop)
+    first = Task(detail=Detail("T1", "first"), deadline=date(2030, 1, 1))
+    db.add_task(keep, first)
+    db.add_task(keep, Task(detail=Detail("T2", "second"), deadline=datetime(2030, 2, 1, 9, 30), status="doing"))
+    db.update_entity(first, Task(detail=Detail("T1 renamed", "first"), deadline=date(2030, 1, 2),
+                                 status="done", closed_at=datetime(2029, 12, 31, 23, 0)), keep)
+    db.update_entity(keep, Project(detail=Detail("Keep renamed", "kept")), None)
+    db.remove_project(drop)
+
+
+def test_fresh_store_starts_empty(tmp_path):
+    assert _open(tmp_path).get_projects() == []
+
+
+@pytest.mark.parametrize("snapshot_interval", [1000, 3])
+def test_restart_restores_state(tmp_path, snapshot_interval):
+    db = _open(tmp_path, snapshot_interval)
+    _populate(db)
+    expected = _state(db)
+
+    restarted = _open(tmp_path, snapshot_interval)
+
+    assert _state(restarted) == expected
+    assert restarted.get_status_counts() == db.get_status_counts()
+    new_project = Project(detail=Detail("New", "after restart"))
+    restarted.add_project(new_project)
+    assert new_project.id == db._next_project_id
+
+
+def test_ids_of_removed_entities_are_not_reused(tmp_path):
+    db = _open(tmp_path, snapshot_interval=1)
+    project = Project(detail=Detail("Drop", "dropped"))
+    db.add_project(project)
+    db.remove_project(project)
+
+    new_project = Project(detail=Detail("New", "after restart"))
+    _open(tmp_path).add_project(new_project)
+
+    assert new_project.id == project.id + 1
+
+
+def test_close_writes_snapshot_and_empties_log(tmp_path):
+    db = _open(tmp_path)
+    _populate(db)
+    expected = _state(db)
+
+    db.close()
+
+    assert os.path.getsize(tmp_path / InMemoryPersistence.WAL_FILE) == 0
+    assert _state(_open(tmp_path)) == expected
+
+
+def test_torn_log_tail_is_discarded(tmp_path):
+    db = _open(tmp_path)
+    _populate(db)
+    expected = _state(db)
+    db._persistence.close()
+    with open(tmp_path / InMemoryPersistence.WAL_FILE, "ab") as wal:
+        wal.write(b"\x40\x00\x00\x00garbage")
+
+    restarted = _open(tmp_path)
+
+    assert _state(restarted) == expected
+    restarted.add_project(Project(detail=Detail("New", "after crash")))
+    assert len(_open(tmp_path).get_projects()) == len(expected) + 1
@@ -0,0 +1,26 @@
+from datetime import date
+
+import pytest
+
+from models.models import Detail, Project, Task
+
+
+def test_models_are_slotted():
+    task = Task(detail=Detail("T1", "desc"), deadline=date(2030, 1, 1))
+    with pytest.raises(AttributeError):
+        task.unknown = 1
+    assert not hasattr(Project(detail=Detail("P1", "desc")), "__dict__")
+
+
+def test_task_interns_status():
+    first = Task(detail=Detail("T1", "d"), deadline=date(2030, 1, 1), status="".join(["do", "ne"]))
+    second = Task(detail=Detail("T2", "d"), deadline=date(2030, 1, 1), status="".join(["d", "one"]))
+
+    assert first.status is second.status
+
+
+def test_id_and_str_are_preserved():
+    task = Task(detail=Detail("T1", "desc"), deadline=date(2030, 1, 1), status="doing")
+    task._id = 7
+    assert task.id == 7
+    assert str(task) == "T1 (desc) - doing, 2030-01-01"
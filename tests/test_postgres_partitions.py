@@ -0,0 +1,92 @@
+"""Partitioning checks that need a PostgreSQL server.
+
+Set TEST_POSTGRES_URL to a throwaway database: its public schema is dropped and
+rebuilt by the migrations for every test.
+"""
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from db.db_postgres import PostgresDatabase
+from models.models import Detail, Project, Task
+
+URL = os.getenv("TEST_POSTGRES_URL")
+pytestmark = pytest.mark.skipif(not URL, reason="TEST_POSTGRES_URL is not set")
+
+alembic = pytest.importorskip("alembic")
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _migrate(step, revision: str) -> None:
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    config.set_main_option("sqlalchemy.url", URL.replace("%", "%%"))
+    step(config, revision)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(URL)
+    with engine.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE"))
+        conn.execute(text("CREATE SCHEMA public"))
+    yield engine
+    engine.dispose()
+
+
+def _task(title: str, days: int) -> Task:
+    return Task(detail=Detail(title, f"{title} desc"), deadline=datetime.now() + timedelta(days=days))
+
+
+def _partitions_of_tasks(engine) -> dict:
+    with engine.connect() as conn:
+        return dict(conn.execute(text("SELECT title, tableoid::regclass::text FROM tasks")).all())
+
+
+def test_migration_moves_existing_tasks_into_partitions(engine):
+    _migrate(command.upgrade, "0004")
+    with engine.begin() as conn:
+        project_id = conn.execute(text(
+            "INSERT INTO projects (title, description) VALUES ('P1', 'd') RETURNING id"
+        )).scalar()
+        conn.execute(text(
+            "INSERT INTO tasks (title, description, project_id, status, closed_at) VALUES "
+            "('open', 'd', :project_id, 'todo', NULL), ('old', 'd', :project_id, 'done', '2023-05-01')"
+        ), {"project_id": project_id})
+
+    _migrate(command.upgrade, "head")
+    assert _partitions_of_tasks(engine) == {"open": "tasks_open", "old": "tasks_done_2023"}
+
+    _migrate(command.downgrade, "0004")
+    assert _partitions_of_tasks(engine) == {"open": "tasks", "old": "tasks"}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT relkind FROM pg_class WHERE relname = 'tasks'")).scalar() == "r"
+
+
+def test_closed_tasks_land_in_their_year_and_detach(engine):
+    _migrate(command.upgrade, "head")
+    db = PostgresDatabase(URL, use_alembic=True)
+    try:
+        project = Project(detail=Detail("P1", "first"))
+        db.add_project(project)
+        db.add_tasks(project, [_task("overdue", -1), _task("upcoming", 3)])
+        now = datetime.now()
+        [closed_id] = db.close_overdue(now)
+        assert _partitions_of_tasks(engine) == {"overdue": f"tasks_done_{now.year}", "upcoming": "tasks_open"}
+
+        db.add_task_partition(now.year + 5)
+        with engine.connect() as conn:
+            assert conn.execute(text(f"SELECT to_regclass('tasks_done_{now.year + 5}')")).scalar() is not None
+
+        assert db.detach_task_partition(now.year) == [closed_id]
+        assert [t.detail.title for t in db.get_tasks(project)] == ["upcoming"]
+        assert db.get_status_counts() == {"todo": 1, "doing": 0, "done": 0}
+        with engine.connect() as conn:
+            assert conn.execute(text(f"SELECT count(*) FROM tasks_done_{now.year}")).scalar() == 1
+    finally:
+        db._db_session.engine.dispose()
@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from db.db_sqlite import SQLiteDatabase
+from models.models import Detail, Project, Task
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SQLiteDatabase(str(tmp_path / "todo.db"))
+
+
+def _task(title: str, status: str = "todo", days: int = 1) -> Task:
+    return Task(detail=Detail(title, f"{title} desc"), deadline=date.today() + timedelta(days=days), status=status)
+
+
+def test_runs_in_wal_mode(db):
+    with db._db_session.get_engine().connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_crud_round_trips_through_the_file(db, tmp_path):
+    project = Project(detail=Detail("P1", "first"))
+    db.add_project(project)
+    db.add_task(project, _task("T1"))
+    db.add_task(project, _task("T2", status="doing"))
+    db.update_entity(_task("T1"), _task("T1", status="done"), project)
+    db.remove_task(project, _task("T2"))
+
+    reopened = SQLiteDatabase(str(tmp_path / "todo.db"))
+    [loaded] = reopened.get_projects()
+    [task] = reopened.get_tasks(loaded)
+    assert loaded.id == project.id
+    assert (task.detail.title, task.status) == ("T1", "done")
+    assert reopened.get_status_counts() == {"todo": 0, "doing": 0, "done": 1}
+
+
+def test_removing_project_removes_its_tasks(db):
+    project = Project(detail=Detail("P1", "first"))
+    db.add_project(project)
+    db.add_task(project, _task("T1"))
+    db.remove_project(project)
+
+    with db._db_session.get_engine().connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM tasks")).scalar() == 0
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+import pytest
+
+from core.config import AppConfig
+from db.db_inmemory import InMemoryDatabase
+from exception.exceptions import DuplicateValueError, MaxCountError
+from models.models import Detail, Project
+from service.task_manager import TaskManager
+
+
+@pytest.fixture
+def manager():
+    config = AppConfig(
+        max_projects=10,
+        max_project_name_length=30,
+        max_project_description_length=150,
+        max_tasks=3,
+        max_task_name_length=30,
+        max_task_description_length=150,
+        db_type="memory",
+        db_name="",
+        db_user="",
+        db_password="",
+        db_host="",
+        db_port=5432,
+    )
+    db = InMemoryDatabase()
+    project = Project(detail=Detail("Batch", "batch project"))
+    db.add_project(project)
+    return TaskManager(config, db, project)
+
+
+def _entry(title: str):
+    return Detail(title, f"{title} desc"), date.today() + timedelta(days=1), None
+
+
+def test_add_entities_stores_whole_batch(manager):
+    tasks = manager.add_entities([_entry("T1"), _entry("T2")])
+    assert [t.status for t in tasks] == ["todo", "todo"]
+    assert [t.detail.title for t in manager.get_repo_list()] == ["T1", "T2"]
+
+
+def test_add_entities_checks_limit_for_whole_batch(manager):
+    manager.add_entities([_entry("T1")])
+    with pytest.raises(MaxCountError):
+        manager.add_entities([_entry("T2"), _entry("T3"), _entry("T4")])
+    assert len(manager.get_repo_list()) == 1
+
+
+def test_add_entities_rejects_duplicates_within_batch(manager):
+    with pytest.raises(DuplicateValueError):
+        manager.add_entities([_entry("T1"), _entry("T1")])
+    assert manager.get_repo_list() == []
+
+
+def test_add_entities_validates_and_inserts_in_one_unit_of_work(manager, monkeypatch):
+    repository = manager._repository
+    unit_of_work = repository.unit_of_work
+    opened = []
+    monkeypatch.setattr(repository, "unit_of_work", lambda: opened.append(True) or unit_of_work())
+
+    manager.add_entities([_entry("T1"), _entry("T2")])
+    assert opened == [True]